@@ -1,13 +1,18 @@
 from .dfs import dfs
 from .bfs import bfs
 from .topological_sort import topological_sort
-from .sccs import find_scss
+from .sccs import find_scss, find_condensation, Condensation
 from .articulation_bridges import find_bridges
+from .instrumentation import Instrumentation, TraversalStats
 
 __all__ = [
     'dfs',
     'bfs',
     'topological_sort',
     'find_scss',
-    'find_bridges'
+    'find_condensation',
+    'Condensation',
+    'find_bridges',
+    'Instrumentation',
+    'TraversalStats'
 ]
\ No newline at end of file
@@ -1,52 +1,102 @@
 from graph import Graph, Node
+from csr_graph import CSRGraph
 from typing import List, Dict
 from algorithms.node_state import NodeState
+from traversal import depth_first, ENTER, EDGE
+from algorithms.instrumentation import collect, report, edge_total
 
 def find_bridges(graph: Graph) -> List[List[str]]:
-    node_states: Dict[Node, NodeState] = {}
-    nodes = graph.get_nodes()
-    bridges: List[List[str]] = []
-    
-    for node in nodes:
-        node_states[node] = NodeState.NOT_STARTED
-        
-    disc: Dict[Node, int] = {} # Discovery time for a node in DFS
-    low: Dict[Node, int] = {} # The lowest discovery time reachable from u without going through the parent
+    stats = collect('find_bridges')
     
-    for node in nodes:
-        if node_states[node] == NodeState.NOT_STARTED:
-            _dfs(node, node_states, disc, low, 1, None, bridges)
+    if isinstance(graph, CSRGraph):
+        bridges = _find_bridges_csr(graph)
+        node_count = graph.node_count()
+    else:
+        node_states: Dict[str, NodeState] = dict.fromkeys(graph.nodes, NodeState.NOT_STARTED)
+        if stats is not None:
+            stats.lap('node_states')
+        nodes = graph.get_nodes()
+        bridges: List[List[str]] = []
             
+        disc: Dict[str, int] = {} # Discovery time (DFS depth) for a node
+        low: Dict[str, int] = {} # The lowest discovery time reachable from u without going through the parent
+        
+        for node in nodes:
+            if node_states[node.label] == NodeState.NOT_STARTED:
+                _dfs(node, node_states, disc, low, bridges)
+        node_count = len(disc)
+        
+    if stats is not None:
+        stats.lap('search')
+        stats.nodes_visited = node_count
+        stats.edges_scanned = edge_total(graph)
+        report(stats)
     return bridges
 
-def _dfs(node: Node, 
-         node_states: Dict[Node, NodeState], 
-         disc:Dict[Node, int], 
-         low: Dict[Node, int], 
-         curr_time: int,
-         parent: Node,
+def _dfs(root: Node, 
+         node_states: Dict[str, NodeState], 
+         disc: Dict[str, int], 
+         low: Dict[str, int], 
          bridges: List[List[str]]):
     
-    node_states[node] = NodeState.VISITING
-    disc[node] = curr_time
-    low[node] = curr_time
-    next_time = curr_time + 1
-    for edge in node.get_edges():
-        to_node = edge.to_node
-        
-        if to_node == parent:
+    for event, node, other in depth_first(root, node_states, report_edges=True, skip_parent=True):
+        if event == ENTER:
+            curr_time = disc[other.label] + 1 if other is not None else 1
+            disc[node.label] = curr_time
+            low[node.label] = curr_time
+        elif event == EDGE:
+            low[node.label] = min(low[node.label], low[other.label])
+        elif other is not None:
+            # EXIT: fold the finished child's low value into its parent
+            low[other.label] = min(low[other.label], low[node.label])
+            
+            if low[node.label] > disc[other.label]:
+                bridges.append([other.label, node.label])
+
+def _find_bridges_csr(graph: CSRGraph) -> List[List[str]]:
+    n = graph.node_count()
+    offsets = graph.offsets
+    targets = graph.targets
+    labels = graph.labels
+    bridges: List[List[str]] = []
+    
+    # disc == 0 means the node has not been discovered yet
+    disc = [0] * n
+    low = [0] * n
+    
+    for root in range(n):
+        if disc[root]:
             continue
         
-        if node_states[to_node] == NodeState.NOT_STARTED:
-            _dfs(to_node, node_states, disc, low, next_time, node, bridges)
-        
-            low[node] = min(low[node], low[to_node])
+        disc[root] = low[root] = 1
+        path = [root]
+        parents = [-1]
+        stack = [iter(targets[offsets[root]:offsets[root + 1]])]
         
-            if low[to_node] > disc[node]:
-                bridges.append([node.label, to_node.label])
-        else:
-            low[node] = min(low[node], low[to_node])
-            
-    node_states[node] = NodeState.VISITED
-            
-    
+        while stack:
+            node = path[-1]
+            parent = parents[-1]
+            for to_node in stack[-1]:
+                if to_node == parent:
+                    continue
+                
+                if not disc[to_node]:
+                    disc[to_node] = low[to_node] = disc[node] + 1
+                    path.append(to_node)
+                    parents.append(node)
+                    stack.append(iter(targets[offsets[to_node]:offsets[to_node + 1]]))
+                    break
+                
+                if low[to_node] < low[node]:
+                    low[node] = low[to_node]
+            else:
+                stack.pop()
+                path.pop()
+                parents.pop()
+                if parent >= 0:
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                    if low[node] > disc[parent]:
+                        bridges.append([labels[parent], labels[node]])
+                        
+    return bridges
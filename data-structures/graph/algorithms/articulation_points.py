@@ -1,57 +1,56 @@
 from graph import Graph, Node
 from typing import List, Dict, Set
 from algorithms.node_state import NodeState
+from traversal import depth_first, ENTER, EDGE
+from algorithms.instrumentation import collect, report, edge_total
 
 def find_articulation_points(graph: Graph) -> List[str]:
-    node_states: Dict[Node, NodeState] = {}
-    disc: Dict[Node, int] = {}
-    low: Dict[Node, int] = {}
+    stats = collect('find_articulation_points')
+    node_states: Dict[str, NodeState] = dict.fromkeys(graph.nodes, NodeState.NOT_STARTED)
+    if stats is not None:
+        stats.lap('node_states')
+    disc: Dict[str, int] = {}
+    low: Dict[str, int] = {}
     
     nodes = graph.get_nodes()
     
-    for node in nodes:
-        node_states[node] = NodeState.NOT_STARTED
-    
     result: Set[str] = set()
     
     for node in nodes:
-        if node_states[node] == NodeState.NOT_STARTED:
-            _dfs(node, node_states, disc, low, 0, result, None)
-        
+        if node_states[node.label] == NodeState.NOT_STARTED:
+            _dfs(node, node_states, disc, low, result)
+            
+    if stats is not None:
+        stats.lap('search')
+        stats.nodes_visited = len(disc)
+        stats.edges_scanned = edge_total(graph)
+        report(stats)
     return list(result)
 
-def _dfs(node: Node,
-         node_states: Dict[Node, NodeState],
-         disc: Dict[Node, int],
-         low: Dict[Node, int],
-         time: int,
-         result: Set[str],
-         parent: Node):
+def _dfs(root: Node,
+         node_states: Dict[str, NodeState],
+         disc: Dict[str, int],
+         low: Dict[str, int],
+         result: Set[str]):
     
-    node_states[node] = NodeState.VISITING
-    low[node] = time
-    disc[node] = time
+    children: Dict[str, int] = {}
     
-    children = 0
-    for edge in node.get_edges():
-        to_node = edge.to_node
-        
-        if to_node == parent:
-            continue
-        
-        if node_states[to_node] == NodeState.NOT_STARTED:
-            children += 1
-            _dfs(to_node, node_states, disc, low, time + 1, result, node)
-            
-            low[node] = min(low[node], low[to_node])
-            
-            if parent is None and children > 1:
-                result.add(node.label)
-            elif parent is not None and low[to_node] >= disc[node]:
-                result.add(node.label)
-                
-        #elif node_states[to_node] == NodeState.VISITING:
-        else:
-            low[node] = min(low[node], low[to_node])
+    for event, node, other in depth_first(root, node_states, report_edges=True, skip_parent=True):
+        if event == ENTER:
+            time = disc[other.label] + 1 if other is not None else 0
+            low[node.label] = time
+            disc[node.label] = time
+            children[node.label] = 0
+            if other is not None:
+                children[other.label] += 1
+        elif event == EDGE:
+            low[node.label] = min(low[node.label], low[other.label])
+        elif other is not None:
+            # EXIT: fold the finished child's low value into its parent
+            parent = other
+            low[parent.label] = min(low[parent.label], low[node.label])
             
-    node_states[node] = NodeState.VISITED
\ No newline at end of file
+            if parent is root and children[parent.label] > 1:
+                result.add(parent.label)
+            elif parent is not root and low[node.label] >= disc[parent.label]:
+                result.add(parent.label)
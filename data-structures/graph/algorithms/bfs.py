@@ -1,15 +1,38 @@
 from graph import Graph, Node
-from typing import List, Dict, Deque
+from csr_graph import CSRGraph
+from typing import List, Dict, Deque, Optional
 from collections import deque
 from algorithms.node_state import NodeState
+from algorithms.instrumentation import TraversalStats, collect, report, scanned_edges
 
 def bfs(graph: Graph, start_node_label) -> List[Node]:
+    stats = collect('bfs')
+    
+    if isinstance(graph, CSRGraph):
+        order = _bfs_csr(graph, start_node_label)
+    else:
+        order = _bfs_nodes(graph, start_node_label, stats)
+        
+    if stats is not None and order is not None:
+        stats.lap('search')
+        stats.nodes_visited = len(order)
+        if isinstance(graph, CSRGraph):
+            stats.edges_scanned = scanned_edges(graph, map(graph.get_id, order))
+        else:
+            stats.edges_scanned = scanned_edges(graph, (node.label for node in order))
+        report(stats)
+    return order
+
+def _bfs_nodes(graph: Graph, start_node_label, stats: Optional[TraversalStats]) -> List[Node]:
     node_states: Dict[Node, NodeState] = {}
     nodes = graph.get_nodes()
     
     for node in nodes:
         node_states[node] = NodeState.NOT_STARTED
         
+    if stats is not None:
+        stats.lap('node_states')
+        
     queue: Deque[Node] = deque()
     traversal_order: List[Node] = []
     
@@ -35,4 +58,32 @@ def bfs(graph: Graph, start_node_label) -> List[Node]:
                 queue.append(to_node)
                 
     
-    return traversal_order
\ No newline at end of file
+    return traversal_order
+
+def _bfs_csr(graph: CSRGraph, start_node_label: str) -> List[str]:
+    start = graph.get_id(start_node_label)
+    
+    if start == None:
+        print(f"Node with label {start_node_label} not found")
+        return
+    
+    offsets = graph.offsets
+    targets = graph.targets
+    visited = bytearray(graph.node_count())
+    visited[start] = 1
+    
+    # The traversal order doubles as the queue: everything past head is still pending
+    order: List[int] = [start]
+    head = 0
+    
+    while head < len(order):
+        node = order[head]
+        head += 1
+        
+        for to_node in targets[offsets[node]:offsets[node + 1]]:
+            if not visited[to_node]:
+                visited[to_node] = 1
+                order.append(to_node)
+                
+    labels = graph.labels
+    return [labels[node_id] for node_id in order]
\ No newline at end of file
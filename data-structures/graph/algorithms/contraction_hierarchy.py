@@ -0,0 +1,347 @@
+from array import array
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+import heapq
+import mmap
+import struct
+import sys
+from graph import Graph
+from csr_graph import CSRGraph
+from graph_snapshot import LabelTable, label_sections, _aligned, _pad
+from algorithms.dijkstra import ShortestPath
+
+# File layout (little-endian, every section starts on an 8-byte boundary), as in graph snapshots:
+#
+#   magic           8 bytes  b'GRAPHCH2'
+#   header          format version, flags (unused), node count, upward edges, downward edges, label blob size
+#   rank            int32[nodes]
+#   up              offsets int64[nodes + 1], targets int32, weights float64, via int32 per upward edge
+#   down            the same for the downward edges
+#   label_offsets   int64[nodes + 1]
+#   label_order     int32[nodes]
+#   label_blob      utf-8 bytes
+_MAGIC = b'GRAPHCH2'
+_FORMAT_VERSION = 2
+_HEADER = struct.Struct('<IIqqqq')
+
+class ContractionHierarchy:
+    """
+    Shortest-path index built by contracting nodes one at a time and adding
+    shortcut edges that preserve distances between the remaining nodes.
+
+    Queries run a bidirectional Dijkstra that only follows edges towards
+    higher-ranked nodes, so they settle a few hundred nodes instead of the
+    whole graph. Each side of the hierarchy is stored as CSR arrays; the via
+    array holds the contracted middle node of a shortcut, or -1 for an
+    original edge.
+    """
+
+    def __init__(self, labels: Sequence[str], rank: Sequence[int],
+                 up_offsets: Sequence[int], up_targets: Sequence[int], up_weights: Sequence[float],
+                 up_via: Sequence[int],
+                 down_offsets: Sequence[int], down_targets: Sequence[int], down_weights: Sequence[float],
+                 down_via: Sequence[int], label_to_id: Optional[Mapping[str, int]] = None):
+        self.labels = labels
+        self.label_to_id: Mapping[str, int] = label_to_id if label_to_id is not None else \
+            {label: i for i, label in enumerate(labels)}
+        self.rank = rank
+        # up: edge v -> x with rank[v] < rank[x], searched forward from the source
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_weights = up_weights
+        self.up_via = up_via
+        # down: edge x -> v with rank[x] > rank[v], stored at v and searched backward from the target
+        self.down_offsets = down_offsets
+        self.down_targets = down_targets
+        self.down_weights = down_weights
+        self.down_via = down_via
+
+    @classmethod
+    def build(cls, graph: Graph, witness_settle_limit: int = 200) -> 'ContractionHierarchy':
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        n = csr.node_count()
+
+        out_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        in_edges: List[Dict[int, float]] = [{} for _ in range(n)]
+        for node_id in range(n):
+            for edge_index in range(csr.offsets[node_id], csr.offsets[node_id + 1]):
+                to_node = csr.targets[edge_index]
+                if to_node == node_id:
+                    continue
+                weight = csr.weights[edge_index] if csr.weights is not None else 1.0
+                if weight < out_edges[node_id].get(to_node, float('inf')):
+                    out_edges[node_id][to_node] = weight
+                    in_edges[to_node][node_id] = weight
+
+        via: Dict[Tuple[int, int], int] = {}
+        contracted_neighbors = [0] * n
+        level = [0] * n  # Length of the longest chain of contracted nodes below each node
+        rank = array('i', [0]) * n
+        up: List[Dict[int, float]] = [{} for _ in range(n)]
+        down: List[Dict[int, float]] = [{} for _ in range(n)]
+
+        def shortcuts_for(node: int) -> List[Tuple[int, int, float]]:
+            shortcuts: List[Tuple[int, int, float]] = []
+            for from_node, in_weight in in_edges[node].items():
+                candidates = {to_node: in_weight + out_weight
+                              for to_node, out_weight in out_edges[node].items() if to_node != from_node}
+                if not candidates:
+                    continue
+                witness = _witness_search(out_edges, from_node, node, candidates, witness_settle_limit)
+                for to_node, weight in candidates.items():
+                    if witness.get(to_node, float('inf')) > weight:
+                        shortcuts.append((from_node, to_node, weight))
+            return shortcuts
+
+        def priority(node: int, shortcuts: List[Tuple[int, int, float]]) -> int:
+            edge_difference = len(shortcuts) - len(in_edges[node]) - len(out_edges[node])
+            return 2 * edge_difference + contracted_neighbors[node] + level[node]
+
+        queue = [(priority(node, shortcuts_for(node)), node) for node in range(n)]
+        heapq.heapify(queue)
+        next_rank = 0
+
+        while queue:
+            _, node = heapq.heappop(queue)
+
+            # Lazy update: re-check the priority and defer the node if it is no longer the best
+            shortcuts = shortcuts_for(node)
+            current = priority(node, shortcuts)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, node))
+                continue
+
+            rank[node] = next_rank
+            next_rank += 1
+
+            for from_node, to_node, weight in shortcuts:
+                if weight < out_edges[from_node].get(to_node, float('inf')):
+                    out_edges[from_node][to_node] = weight
+                    in_edges[to_node][from_node] = weight
+                    via[(from_node, to_node)] = node
+
+            # Whatever is still attached to the node is ranked higher and becomes part of the hierarchy
+            up[node] = out_edges[node]
+            down[node] = in_edges[node]
+            for to_node in out_edges[node]:
+                del in_edges[to_node][node]
+                contracted_neighbors[to_node] += 1
+                level[to_node] = max(level[to_node], level[node] + 1)
+            for from_node in in_edges[node]:
+                del out_edges[from_node][node]
+                contracted_neighbors[from_node] += 1
+                level[from_node] = max(level[from_node], level[node] + 1)
+            out_edges[node] = {}
+            in_edges[node] = {}
+
+        up_arrays = _pack(up, lambda node, other: via.get((node, other), -1))
+        down_arrays = _pack(down, lambda node, other: via.get((other, node), -1))
+        return cls(list(csr.labels), rank, *up_arrays, *down_arrays)
+
+    def distance(self, source: str, target: str) -> float:
+        return self._search(source, target)[0]
+
+    def shortest_path(self, source: str, target: str) -> ShortestPath:
+        best, meeting, forward_parent, backward_parent = self._search(source, target)
+        if meeting is None:
+            return ShortestPath(best)
+
+        hierarchy_path: List[int] = [meeting]
+        node = meeting
+        while forward_parent[node] is not None:
+            node = forward_parent[node]
+            hierarchy_path.append(node)
+        hierarchy_path.reverse()
+        node = meeting
+        while backward_parent[node] is not None:
+            node = backward_parent[node]
+            hierarchy_path.append(node)
+
+        path: List[int] = [hierarchy_path[0]]
+        for from_node, to_node in zip(hierarchy_path, hierarchy_path[1:]):
+            self._unpack(from_node, to_node, path)
+        return ShortestPath(best, [self.labels[node_id] for node_id in path])
+
+    def _search(self, source: str, target: str):
+        source_id = self.label_to_id.get(source, None)
+        target_id = self.label_to_id.get(target, None)
+        if source_id is None or target_id is None:
+            missing = source if source_id is None else target
+            print(f"Node with the label {missing} does not exist in the graph")
+            return float('inf'), None, {}, {}
+
+        up = (self.up_offsets, self.up_targets, self.up_weights)
+        down = (self.down_offsets, self.down_targets, self.down_weights)
+        # Each side searches its own edges and uses the other side's edges to stall on demand
+        sides = (
+            up + down + ({source_id: 0}, {source_id: None}, [(0, source_id)]),
+            down + up + ({target_id: 0}, {target_id: None}, [(0, target_id)]),
+        )
+        best = float('inf')
+        meeting: Optional[int] = None
+
+        while sides[0][8] or sides[1][8]:
+            for side in (0, 1):
+                offsets, targets, weights, stall_offsets, stall_targets, stall_weights, distance, parent, queue = sides[side]
+                if not queue:
+                    continue
+
+                dist, node = heapq.heappop(queue)
+                # Neither search can improve the meeting point once its frontier passes it
+                if dist >= best:
+                    queue.clear()
+                    continue
+                if dist > distance[node]:
+                    continue
+
+                other_distance = sides[1 - side][6]
+                if node in other_distance and dist + other_distance[node] < best:
+                    best = dist + other_distance[node]
+                    meeting = node
+
+                # A higher-ranked node already reached offers a shorter way here, so this
+                # node cannot lie on a shortest up-down path and its edges can be skipped
+                stalled = False
+                for edge_index in range(stall_offsets[node], stall_offsets[node + 1]):
+                    higher = stall_targets[edge_index]
+                    if higher in distance and distance[higher] + stall_weights[edge_index] < dist:
+                        stalled = True
+                        break
+                if stalled:
+                    continue
+
+                for edge_index in range(offsets[node], offsets[node + 1]):
+                    to_node = targets[edge_index]
+                    new_dist = dist + weights[edge_index]
+                    if new_dist < distance.get(to_node, float('inf')):
+                        distance[to_node] = new_dist
+                        parent[to_node] = node
+                        heapq.heappush(queue, (new_dist, to_node))
+
+        return best, meeting, sides[0][7], sides[1][7]
+
+    def _unpack(self, from_node: int, to_node: int, path: List[int]):
+        """Append the original-edge path from_node -> to_node (excluding from_node) to path"""
+        stack = [(from_node, to_node)]
+        while stack:
+            from_node, to_node = stack.pop()
+            middle = self._via(from_node, to_node)
+            if middle < 0:
+                path.append(to_node)
+            else:
+                stack.append((middle, to_node))
+                stack.append((from_node, middle))
+
+    def _via(self, from_node: int, to_node: int) -> int:
+        if self.rank[from_node] < self.rank[to_node]:
+            offsets, targets, vias, node, other = self.up_offsets, self.up_targets, self.up_via, from_node, to_node
+        else:
+            offsets, targets, vias, node, other = self.down_offsets, self.down_targets, self.down_via, to_node, from_node
+        for edge_index in range(offsets[node], offsets[node + 1]):
+            if targets[edge_index] == other:
+                return vias[edge_index]
+        return -1
+
+    def save(self, path: str):
+        encoded, label_offsets, label_order = label_sections(self.labels)
+        sections = [array('i', self.rank),
+                    array('q', self.up_offsets), array('i', self.up_targets), array('d', self.up_weights),
+                    array('i', self.up_via),
+                    array('q', self.down_offsets), array('i', self.down_targets), array('d', self.down_weights),
+                    array('i', self.down_via),
+                    label_offsets, label_order]
+
+        with open(path, 'wb') as file:
+            file.write(_MAGIC)
+            file.write(_HEADER.pack(_FORMAT_VERSION, 0, len(encoded), len(self.up_targets), len(self.down_targets),
+                                    label_offsets[-1]))
+            _pad(file)
+            for section in sections:
+                if sys.byteorder != 'little':
+                    section.byteswap()
+                file.write(section.tobytes())
+                _pad(file)
+            for label in encoded:
+                file.write(label)
+
+    @classmethod
+    def load(cls, path: str) -> 'ContractionHierarchy':
+        """Maps a saved hierarchy read-only; its arrays and labels are read straight from the mapping"""
+        if sys.byteorder != 'little':
+            raise ValueError("Contraction hierarchy files can only be mapped on little-endian hosts")
+
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = memoryview(mapping)
+        if bytes(buffer[:len(_MAGIC)]) != _MAGIC:
+            raise ValueError(f"{path} is not a contraction hierarchy file")
+
+        version, _, n, up_count, down_count, label_size = _HEADER.unpack_from(buffer, len(_MAGIC))
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported contraction hierarchy version {version}, expected {_FORMAT_VERSION}")
+
+        position = _aligned(len(_MAGIC) + _HEADER.size)
+
+        def section(typecode: str, itemsize: int, count: int) -> memoryview:
+            nonlocal position
+            view = buffer[position:position + itemsize * count].cast(typecode)
+            position = _aligned(position + itemsize * count)
+            return view
+
+        rank = section('i', 4, n)
+        up = (section('q', 8, n + 1), section('i', 4, up_count), section('d', 8, up_count), section('i', 4, up_count))
+        down = (section('q', 8, n + 1), section('i', 4, down_count), section('d', 8, down_count),
+                section('i', 4, down_count))
+        labels = LabelTable(section('q', 8, n + 1), section('i', 4, n), buffer[position:position + label_size])
+        return cls(labels, rank, *up, *down, label_to_id=labels)
+
+    def __repr__(self) -> str:
+        return f"ContractionHierarchy(nodes={len(self.labels)}, up={len(self.up_targets)}, down={len(self.down_targets)})"
+
+def _witness_search(out_edges: List[Dict[int, float]], source: int, excluded: int,
+                    candidates: Dict[int, float], settle_limit: int) -> Dict[int, float]:
+    """
+    Bounded Dijkstra from source that avoids the node being contracted. It
+    stops once every candidate target is settled or no candidate path can
+    still be beaten.
+    """
+    limit = max(candidates.values())
+    remaining = len(candidates)
+    distance: Dict[int, float] = {source: 0}
+    queue: List[Tuple[float, int]] = [(0, source)]
+    settled = 0
+
+    while queue and settled < settle_limit:
+        dist, node = heapq.heappop(queue)
+        if dist > distance[node]:
+            continue
+        if dist > limit:
+            break
+        settled += 1
+        if node in candidates:
+            remaining -= 1
+            if remaining == 0:
+                break
+
+        for to_node, weight in out_edges[node].items():
+            if to_node == excluded:
+                continue
+            new_dist = dist + weight
+            if new_dist < distance.get(to_node, float('inf')):
+                distance[to_node] = new_dist
+                heapq.heappush(queue, (new_dist, to_node))
+
+    return distance
+
+def _pack(adjacency: List[Dict[int, float]], via_of) -> Tuple[array, array, array, array]:
+    offsets = array('q', [0])
+    targets = array('i')
+    weights = array('d')
+    vias = array('i')
+    for node, edges in enumerate(adjacency):
+        for other, weight in edges.items():
+            targets.append(other)
+            weights.append(weight)
+            vias.append(via_of(node, other))
+        offsets.append(len(targets))
+    return offsets, targets, weights, vias
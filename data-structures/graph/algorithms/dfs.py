@@ -1,28 +1,60 @@
 from graph import Graph, Node
+from csr_graph import CSRGraph
+from traversal import depth_first, ENTER
 from typing import List, Dict
 from algorithms.node_state import NodeState
+from algorithms.instrumentation import collect, report, edge_total
     
 def dfs(graph: Graph) -> List[Node]:
-    node_states: Dict[Node, NodeState] = {}
-    order: List[Node] = []
-    nodes = graph.get_nodes()
+    stats = collect('dfs')
     
-    for node in nodes:
-        node_states[node] = NodeState.NOT_STARTED
+    if isinstance(graph, CSRGraph):
+        order = _dfs_csr(graph)
+    else:
+        node_states: Dict[str, NodeState] = dict.fromkeys(graph.nodes, NodeState.NOT_STARTED)
+        if stats is not None:
+            stats.lap('node_states')
+        order: List[Node] = []
         
-    for node in nodes:
-        if node_states[node] == NodeState.NOT_STARTED:
-            _dfs_rec(node, node_states, order)
-            
+        for node in graph.get_nodes():
+            if node_states[node.label] == NodeState.NOT_STARTED:
+                _dfs_iter(node, node_states, order)
+                
+    if stats is not None:
+        stats.lap('search')
+        stats.nodes_visited = len(order)
+        stats.edges_scanned = edge_total(graph)
+        report(stats)
     return order
 
-def _dfs_rec(node: Node, node_states: Dict[Node, NodeState], order: List[Node]):
-    node_states[node] = NodeState.VISITING
-    order.append(node)
-    
-    for edge in node.get_edges():
-        to_node = edge.to_node
-        if node_states[to_node] == NodeState.NOT_STARTED:
-            _dfs_rec(to_node, node_states, order)
+def _dfs_iter(node: Node, node_states: Dict[str, NodeState], order: List[Node]):
+    for event, visited_node, _ in depth_first(node, node_states):
+        if event == ENTER:
+            order.append(visited_node)
+
+def _dfs_csr(graph: CSRGraph) -> List[str]:
+    offsets = graph.offsets
+    targets = graph.targets
+    visited = bytearray(graph.node_count())
+    order: List[int] = []
     
-    node_states[node] = NodeState.VISITED
\ No newline at end of file
+    for root in range(graph.node_count()):
+        if visited[root]:
+            continue
+        
+        visited[root] = 1
+        order.append(root)
+        stack = [iter(targets[offsets[root]:offsets[root + 1]])]
+        
+        while stack:
+            for to_node in stack[-1]:
+                if not visited[to_node]:
+                    visited[to_node] = 1
+                    order.append(to_node)
+                    stack.append(iter(targets[offsets[to_node]:offsets[to_node + 1]]))
+                    break
+            else:
+                stack.pop()
+                
+    labels = graph.labels
+    return [labels[node_id] for node_id in order]
\ No newline at end of file
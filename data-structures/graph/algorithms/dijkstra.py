@@ -1,14 +1,55 @@
-from dataclasses import dataclass
-from typing import List, Dict, Tuple, Set
+from array import array
+from dataclasses import dataclass, field
+from typing import Callable, Hashable, Iterable, List, Dict, Optional, Sequence, Set, Tuple
 import heapq
-from graph import Graph, Node
+from itertools import chain
+from operator import attrgetter
+from graph import Graph
+from csr_graph import CSRGraph
+from algorithms.instrumentation import TraversalStats, collect, report, scanned_edges
+from algorithms.heaps import IndexedHeap, RadixHeap
 
 @dataclass
 class ShortestDistance:
     node: str
     distance: float
 
-def dijkstra(graph: Graph, source: str) -> List[ShortestDistance]:
+@dataclass
+class ShortestPath:
+    distance: float
+    path: List[str] = field(default_factory=list)  # Empty when the target is unreachable
+
+# Estimates the remaining distance from a node to the target, both given by label.
+# It must never overestimate for the returned path to be optimal.
+Heuristic = Callable[[str, str], float]
+
+def dijkstra(graph: Graph, source: str, queue: str = 'heap') -> List[ShortestDistance]:
+    """
+    queue selects the priority queue: 'heap' (binary heap, any non-negative
+    weights), 'radix' (monotone radix heap, non-negative integer weights) or
+    'auto', which uses the radix heap whenever every weight allows it. The
+    heap is the default: heapq runs in C, and measured faster than the radix
+    heap on CSR graphs and about even on object graphs. The weight check for
+    'auto' and 'radix' runs once per graph version.
+    """
+    if queue not in ('auto', 'heap', 'radix'):
+        raise ValueError(f"Unknown queue '{queue}', expected 'auto', 'heap' or 'radix'")
+    
+    stats = collect('dijkstra')
+    
+    if queue != 'heap':
+        integer_weights = graph.has_integer_weights() if isinstance(graph, CSRGraph) \
+            else graph.cached(_has_integer_weights)
+        if stats is not None:
+            stats.lap('weight_check')
+        if queue == 'radix' and not integer_weights:
+            raise ValueError("The radix queue needs non-negative integer edge weights")
+        if integer_weights:
+            return _dijkstra_radix(graph, source, stats)
+    
+    if isinstance(graph, CSRGraph):
+        return _dijkstra_csr(graph, source, stats)
+    
     nodes = graph.get_nodes()
     
     source_node = graph.get_node_by_label(source)
@@ -17,33 +58,453 @@ def dijkstra(graph: Graph, source: str) -> List[ShortestDistance]:
         return []
     
     result: List[ShortestDistance] = []
-    distance: Dict[Node, float] = {}
-    for node in nodes:
-        distance[node] = float('inf')
-        
-    distance[source_node] = 0
-    queue: List[Tuple[float, Node]] = [(0, source_node)]
-    visited: Set[Node] = set()
+    distance: Dict[str, float] = dict.fromkeys(graph.nodes, float('inf'))
+    distance[source] = 0
+    # heapq runs in C, so a shorter path pushes a new entry and the old one is
+    # skipped, which beats lowering keys in place. Compaction keeps the queue
+    # within twice the node count. Settled nodes are never relaxed again, so a
+    # negative edge cannot requeue them
+    queue: List[Tuple[float, str]] = [(0, source)]
+    limit = 2 * len(distance)
+    inf = float('inf')
+    heappush, heappop = heapq.heappush, heapq.heappop
+    settled: Set[str] = set()
+    decreases = stale = discarded = 0
+    if stats is not None:
+        stats.lap('init')
     
     while queue:
-        dist, node = heapq.heappop(queue)
-        
-        if node in visited:
+        dist, label = heappop(queue)
+        if label in settled:
+            stale += 1
             continue
-        
-        visited.add(node)
+        settled.add(label)
             
-        for edge in node.get_edges():
-            to_node = edge.to_node
-            if dist + edge.weight < distance[to_node]:
-                distance[to_node] = dist + edge.weight
-                heapq.heappush(queue, (dist + edge.weight, to_node))
+        for edge in graph.nodes[label].get_edges():
+            to_label = edge.to_node.label
+            new_dist = dist + edge.weight
+            if new_dist < distance[to_label] and to_label not in settled:
+                if distance[to_label] < inf:
+                    decreases += 1
+                distance[to_label] = new_dist
+                heappush(queue, (new_dist, to_label))
+        if len(queue) > limit:
+            queue, dropped = _compact(queue, distance)
+            discarded += dropped
                 
+    if stats is not None:
+        _count_settled(stats, graph, [label for label, dist in distance.items() if dist < float('inf')],
+                       stale, decreases, discarded)
+        
     for node in nodes:
         if node == source_node:
             continue
-        result.append(ShortestDistance(node.label, distance[node]))
+        result.append(ShortestDistance(node.label, distance[node.label]))
+    
+    if stats is not None:
+        stats.lap('result')
+        report(stats)
+    return result
+
+def _dijkstra_csr(graph: CSRGraph, source: str, stats: Optional[TraversalStats] = None) -> List[ShortestDistance]:
+    source_id = graph.get_id(source)
+    if source_id == None:
+        print(f"Node with the label {source} does not exist in the graph")
+        return []
+    
+    offsets = graph.offsets
+    targets = graph.targets
+    weights = graph.weights
+    n = graph.node_count()
+    
+    distance: List[float] = [float('inf')] * n
+    distance[source_id] = 0
+    # Lazy deletion with compaction, as in dijkstra
+    queue: List[Tuple[float, int]] = [(0, source_id)]
+    limit = 2 * n
+    inf = float('inf')
+    heappush, heappop = heapq.heappush, heapq.heappop
+    settled = bytearray(n)
+    decreases = stale = discarded = 0
+    if stats is not None:
+        stats.lap('init')
+    
+    while queue:
+        dist, node = heappop(queue)
+        if settled[node]:
+            stale += 1
+            continue
+        settled[node] = 1
+        
+        for edge_index in range(offsets[node], offsets[node + 1]):
+            to_node = targets[edge_index]
+            new_dist = dist + (weights[edge_index] if weights is not None else 1.0)
+            if new_dist < distance[to_node] and not settled[to_node]:
+                if distance[to_node] < inf:
+                    decreases += 1
+                distance[to_node] = new_dist
+                heappush(queue, (new_dist, to_node))
+        if len(queue) > limit:
+            queue, dropped = _compact(queue, distance)
+            discarded += dropped
+                
+    if stats is not None:
+        _count_settled(stats, graph, [node_id for node_id in range(n) if distance[node_id] < float('inf')],
+                       stale, decreases, discarded)
+        
+    labels = graph.labels
+    result = [ShortestDistance(labels[node_id], distance[node_id]) for node_id in range(n) if node_id != source_id]
+    if stats is not None:
+        stats.lap('result')
+        report(stats)
+    return result
+
+def _compact(queue: List[Tuple[float, Hashable]], distance) -> Tuple[List[Tuple[float, Hashable]], int]:
+    """
+    The live entries of a lazy-deletion queue as a new heap, and how many
+    were dropped. An entry is live while its distance is still the node's
+    best; settled nodes keep their distance, so their leftover entries are
+    dropped too. That leaves at most one entry per node.
+    """
+    live = [entry for entry in queue if entry[0] == distance[entry[1]]]
+    heapq.heapify(live)
+    return live, len(queue) - len(live)
+
+def _has_integer_weights(graph: Graph) -> bool:
+    """CSRGraph.has_integer_weights for object graphs, which cache it per version through graph.cached"""
+    edges = chain.from_iterable(map(attrgetter('edges'), graph.nodes.values()))
+    weights = list(map(float, map(attrgetter('weight'), edges)))
+    return min(weights, default=0) >= 0 and all(map(float.is_integer, weights))
+
+def _dijkstra_radix(graph: Graph, source: str, stats: Optional[TraversalStats] = None) -> List[ShortestDistance]:
+    """
+    Dijkstra over integer distances with a radix heap. Improved nodes are
+    pushed again and stale entries skipped, since pushes are O(1). As in
+    dijkstra, stale entries are dropped whenever the queue holds more than
+    twice the node count.
+    """
+    if isinstance(graph, CSRGraph):
+        source_key = graph.get_id(source)
+        offsets = graph.offsets
+        targets = graph.targets
+        int_weights = list(map(int, graph.weights)) if graph.weights is not None else [1] * graph.edge_count()
+        neighbors = lambda node_id: zip(targets[offsets[node_id]:offsets[node_id + 1]],
+                                        int_weights[offsets[node_id]:offsets[node_id + 1]])
+        keys = range(graph.node_count())
+        labels = graph.labels
+    else:
+        source_key = source if source in graph.nodes else None
+        nodes = graph.nodes
+        neighbors = lambda label: [(edge.to_node.label, int(edge.weight)) for edge in nodes[label].edges]
+        keys = list(graph.nodes)
+        labels = keys
+    
+    if source_key is None:
+        print(f"Node with the label {source} does not exist in the graph")
+        return []
+    
+    distance = dict.fromkeys(keys, float('inf'))
+    distance[source_key] = 0
+    queue = RadixHeap()
+    queue.push(0, source_key)
+    limit = 2 * len(distance)
+    live = lambda key, node: key == distance[node]
+    stale = decreases = discarded = 0
+    if stats is not None:
+        stats.lap('init')
+    
+    while queue:
+        dist, node = queue.pop()
+        if dist > distance[node]:
+            stale += 1
+            continue
+        
+        for to_node, weight in neighbors(node):
+            new_dist = dist + weight
+            if new_dist < distance[to_node]:
+                if distance[to_node] < float('inf'):
+                    decreases += 1
+                distance[to_node] = new_dist
+                queue.push(new_dist, to_node)
+        if len(queue) > limit:
+            discarded += queue.retain(live)
     
+    if stats is not None:
+        _count_settled(stats, graph, [key for key in keys if distance[key] < float('inf')], stale, decreases,
+                       discarded)
+        
+    result = [ShortestDistance(labels[i], float(distance[key])) for i, key in enumerate(keys) if key != source_key]
+    if stats is not None:
+        stats.lap('result')
+        report(stats)
     return result
+
+def _count_settled(stats: TraversalStats, graph: Graph, settled: List[Hashable], stale_pops: int = 0,
+                   decrease_keys: int = 0, discarded: int = 0):
+    """
+    Counts for a search that ran until its queue was empty: every settled
+    node was popped once and had its edges scanned, and every entry pushed
+    was popped, stale or not, or discarded by compaction. Lowered keys are
+    counted by the search itself.
+    """
+    stats.lap('search')
+    stats.nodes_visited = len(settled)
+    stats.edges_scanned = scanned_edges(graph, settled)
+    stats.heap_pops = len(settled) + stale_pops
+    stats.stale_pops = stale_pops
+    stats.heap_pushes = stats.heap_pops + discarded
+    stats.decrease_keys = decrease_keys
+
+def dijkstra_path(graph: Graph, source: str, target: str) -> ShortestPath:
+    """Dijkstra that stops as soon as the target is settled"""
+    return _point_to_point(graph, source, target, None, collect('dijkstra_path'))
+
+def astar(graph: Graph, source: str, target: str, heuristic: Heuristic) -> ShortestPath:
+    return _point_to_point(graph, source, target, heuristic, collect('astar'))
+
+def alt_path(graph: Graph, source: str, target: str, oracle: 'LandmarkOracle') -> ShortestPath:
+    """
+    A* guided by the landmark lower bounds of an oracle built for this graph
+    (algorithms.landmarks). The bound is consistent, so the path is exact.
+    """
+    if not oracle.matches(graph):
+        raise ValueError("Landmark oracle was built for a different graph or before it last changed, rebuild it")
+    
+    estimate = oracle.estimator(target)
+    if isinstance(graph, CSRGraph):
+        # Node ids are the keys here, and must be the ones the oracle was built with
+        target_id = graph.get_id(target)
+        if graph.node_count() != oracle.node_count() or oracle.label_to_id.get(target, target_id) != target_id:
+            raise ValueError("Landmark oracle was built for a different graph")
+        if target_id is not None:
+            estimate = oracle.estimator(target_id, by_id=True)
+    return _point_to_point(graph, source, target, None, collect('alt_path'), estimate)
+
+def bidirectional_dijkstra(graph: Graph, source: str, target: str, reverse_graph: Optional[Graph] = None) -> ShortestPath:
+    """
+    Runs Dijkstra from both ends and stops once the two frontiers can no longer
+    produce a shorter path. reverse_graph must hold every edge reversed; it is
+    built with create_transpose() when omitted, so callers issuing many queries
+    should build it once (or pass the graph itself when every edge is undirected).
+    """
+    stats = collect('bidirectional_dijkstra')
+    if reverse_graph is None:
+        reverse_graph = graph.transpose() if isinstance(graph, CSRGraph) else graph.create_transpose()
+        if stats is not None:
+            stats.lap('transpose')
+        
+    forward = _adjacency(graph)
+    backward = _adjacency(reverse_graph)
+    source_key = _key(graph, source)
+    target_key = _key(graph, target)
+    if source_key is None or target_key is None:
+        return ShortestPath(float('inf'))
+    
+    distances = ({source_key: 0}, {target_key: 0})
+    parents: Tuple[Dict, Dict] = ({source_key: None}, {target_key: None})
+    queues = (IndexedHeap(4), IndexedHeap(4))
+    queues[0].push(source_key, 0)
+    queues[1].push(target_key, 0)
+    adjacency = (forward, backward)
+    
+    best = float('inf') if source_key != target_key else 0
+    meeting = source_key
+    decreases = 0
+    if stats is not None:
+        stats.lap('init')
+    
+    while queues[0] and queues[1]:
+        forward_min = queues[0].peek()[1]
+        backward_min = queues[1].peek()[1]
+        if forward_min + backward_min >= best:
+            break
+        
+        # Expand whichever side has the closer frontier
+        side = 0 if forward_min <= backward_min else 1
+        node, dist = queues[side].pop()
+        
+        distance = distances[side]
+        other_distance = distances[1 - side]
+        queue = queues[side]
+        for to_node, weight in adjacency[side](node):
+            new_dist = dist + weight
+            if new_dist < distance.get(to_node, float('inf')):
+                distance[to_node] = new_dist
+                parents[side][to_node] = node
+                if to_node in queue:
+                    queue.decrease_key(to_node, new_dist)
+                    decreases += 1
+                else:
+                    queue.push(to_node, new_dist)
+                
+            if to_node in other_distance and distance[to_node] + other_distance[to_node] < best:
+                best = distance[to_node] + other_distance[to_node]
+                meeting = to_node
+                
+    if stats is not None:
+        # Popped nodes are the ones no longer queued; each scanned its edges on its own side
+        for side, side_graph in enumerate((graph, reverse_graph)):
+            settled = [key for key in distances[side] if key not in queues[side]]
+            stats.nodes_visited += len(settled)
+            stats.heap_pops += len(settled)
+            stats.heap_pushes += len(distances[side])
+            stats.edges_scanned += scanned_edges(side_graph, settled)
+        stats.decrease_keys = decreases
+        stats.lap('search')
         
-        
\ No newline at end of file
+    result = ShortestPath(best)
+    if best < float('inf'):
+        path = _walk_parents(parents[0], meeting)
+        path.reverse()
+        path.extend(_walk_parents(parents[1], meeting)[1:])
+        result = ShortestPath(best, [_label(graph, key) for key in path])
+        
+    if stats is not None:
+        stats.lap('path')
+        report(stats)
+    return result
+
+def _point_to_point(graph: Graph, source: str, target: str, heuristic: Optional[Heuristic],
+                    stats: Optional[TraversalStats] = None,
+                    estimate: Optional[Callable[[Hashable], float]] = None) -> ShortestPath:
+    neighbors = _adjacency(graph)
+    source_key = _key(graph, source)
+    target_key = _key(graph, target)
+    if source_key is None or target_key is None:
+        return ShortestPath(float('inf'))
+    
+    if estimate is None:
+        estimate = lambda key: 0
+    if heuristic is not None:
+        estimate = lambda key: heuristic(_label(graph, key), target)
+    
+    if stats is not None:
+        stats.lap('init')
+    distance, parent, queue, found = _guided_search(neighbors, source_key, target_key, estimate, stats=stats)
+    
+    result = ShortestPath(float('inf'))
+    if found:
+        path = _walk_parents(parent, target_key)
+        path.reverse()
+        result = ShortestPath(distance[target_key], [_label(graph, key) for key in path])
+        
+    if stats is not None:
+        stats.lap('search')
+        # Popped nodes are the ones no longer queued. A node reopened by an
+        # inconsistent heuristic is counted once
+        settled = [key for key in distance if key not in queue]
+        stats.nodes_visited = stats.heap_pops = len(settled)
+        stats.heap_pushes = len(distance)
+        stats.edges_scanned = scanned_edges(graph, settled)
+        if result.path:
+            # The search stopped when it popped the target, before scanning its edges
+            stats.edges_scanned -= scanned_edges(graph, [target_key])
+        report(stats)
+    return result
+
+def _guided_search(neighbors: Callable[[Hashable], Iterable[Tuple[Hashable, float]]], source_key: Hashable,
+                   target_key: Hashable, estimate: Callable[[Hashable], float],
+                   bound: float = float('inf'),
+                   stats: Optional[TraversalStats] = None) -> Tuple[Dict, Dict, IndexedHeap, bool]:
+    """
+    A* from source_key, settling nodes by distance plus estimate until
+    target_key is settled, which is what the returned flag reports. Nodes
+    whose estimated total reaches bound are never queued, so with an
+    estimate that never overestimates the search only finds paths cheaper
+    than bound, and an infinite estimate marks a node as a dead end.
+    Returns the distance and parent maps and the leftover queue; keys
+    lowered in place are added to stats.decrease_keys.
+    """
+    distance: Dict = {source_key: 0}
+    parent: Dict = {source_key: None}
+    queue = IndexedHeap(4)
+    queue.push(source_key, estimate(source_key))
+    
+    while queue:
+        node, priority = queue.pop()
+        if priority >= bound:
+            break
+        if node == target_key:
+            return distance, parent, queue, True
+        
+        dist = distance[node]
+        for to_node, weight in neighbors(node):
+            new_dist = dist + weight
+            if new_dist < distance.get(to_node, float('inf')):
+                priority = new_dist + estimate(to_node)
+                if priority >= bound:
+                    continue
+                distance[to_node] = new_dist
+                parent[to_node] = node
+                # A settled node is pushed again when an inconsistent heuristic reopens it
+                if to_node in queue:
+                    queue.decrease_key(to_node, priority)
+                    if stats is not None:
+                        stats.decrease_keys += 1
+                else:
+                    queue.push(to_node, priority)
+                    
+    return distance, parent, queue, False
+
+def _csr_distances(offsets: Sequence[int], targets: Sequence[int], weights: Optional[Sequence[float]],
+                   source: int) -> Tuple[List[float], List[Optional[int]]]:
+    """
+    Distance from source to every node of a CSR adjacency, inf where it
+    cannot be reached, and each node's parent on its shortest path. The
+    search always runs to the end, so stale heap entries are skipped rather
+    than keys lowered in place.
+    """
+    n = len(offsets) - 1
+    if weights is None:
+        weights = array('d', [1.0]) * len(targets)
+    distance = [float('inf')] * n
+    parent: List[Optional[int]] = [None] * n
+    distance[source] = 0
+    
+    queue = [(0, source)]
+    while queue:
+        dist, node = heapq.heappop(queue)
+        if dist > distance[node]:
+            continue
+        start, end = offsets[node], offsets[node + 1]
+        for to_node, weight in zip(targets[start:end], weights[start:end]):
+            new_dist = dist + weight
+            if new_dist < distance[to_node]:
+                distance[to_node] = new_dist
+                parent[to_node] = node
+                heapq.heappush(queue, (new_dist, to_node))
+                
+    return distance, parent
+
+def _key(graph: Graph, label: str) -> Optional[Hashable]:
+    """Search key for a label: the node id on a CSRGraph, the label itself otherwise"""
+    if isinstance(graph, CSRGraph):
+        key = graph.get_id(label)
+    else:
+        key = label if label in graph.nodes else None
+        
+    if key is None:
+        print(f"Node with the label {label} does not exist in the graph")
+    return key
+
+def _label(graph: Graph, key: Hashable) -> str:
+    return graph.labels[key] if isinstance(graph, CSRGraph) else key
+
+def _adjacency(graph: Graph) -> Callable[[Hashable], Iterable[Tuple[Hashable, float]]]:
+    if isinstance(graph, CSRGraph):
+        offsets = graph.offsets
+        targets = graph.targets
+        weights = graph.weights
+        if weights is None:
+            return lambda node_id: [(to_node, 1.0) for to_node in targets[offsets[node_id]:offsets[node_id + 1]]]
+        return lambda node_id: zip(targets[offsets[node_id]:offsets[node_id + 1]], weights[offsets[node_id]:offsets[node_id + 1]])
+    
+    nodes = graph.nodes
+    return lambda label: [(edge.to_node.label, edge.weight) for edge in nodes[label].edges]
+
+def _walk_parents(parent: Dict, node: Hashable) -> List[Hashable]:
+    path = [node]
+    while parent[node] is not None:
+        node = parent[node]
+        path.append(node)
+    return path
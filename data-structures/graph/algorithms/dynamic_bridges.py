@@ -0,0 +1,322 @@
+from collections import Counter
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from graph import Graph
+
+class DynamicBridges:
+    """
+    Bridges and articulation points of an undirected graph, kept current as
+    links are added and removed.
+
+    A spanning forest is maintained. Every other link closes a cycle along the
+    tree path between its ends and adds one to the cover count of each tree
+    edge on that path; a tree edge nobody covers is a bridge. At each inner
+    node of such a path, the cycle also joins the two tree neighbours it
+    passes between, and a node is an articulation point when those joins
+    leave its tree neighbours in more than one group.
+
+    Adding a link walks one tree path. Removing a non-tree link walks one
+    tree path back. Removing a tree edge that something covers searches the
+    smaller side of the cut for a replacement, re-walks only the links that
+    cross the cut and re-roots that smaller side, so the work follows the
+    region the change touches rather than the graph. is_bridge is O(1);
+    is_articulation_point re-checks a node only after a change reached it.
+    """
+
+    def __init__(self, graph: Optional[Graph] = None):
+        self.parent: Dict[Hashable, Optional[Hashable]] = {}
+        self.children: Dict[Hashable, Set[Hashable]] = {}
+        self.cover: Dict[Hashable, int] = {}                 # Keyed by the child end of a tree edge
+        self.extra: Dict[Hashable, Counter] = {}             # Non-tree links, both directions
+        self.joins: Dict[Hashable, Dict[frozenset, int]] = {}  # Pair of tree neighbours -> cycles joining them
+        self.bridge_children: Set[Hashable] = set()
+        self.articulation: Set[Hashable] = set()
+        self.dirty: Set[Hashable] = set()
+
+        if graph is None:
+            return
+
+        # Undirected graphs store each link once per direction
+        links: Counter = Counter()
+        for node in graph.get_nodes():
+            for edge in node.get_edges():
+                links[frozenset((node.label, edge.to_node.label))] += 1
+        for pair in links:
+            links[pair] //= 2
+        self._build(graph.nodes, links)
+
+    @classmethod
+    def from_links(cls, labels: Iterable[Hashable], links: Iterable[Tuple[Hashable, Hashable]]) -> 'DynamicBridges':
+        """Builds from (label, label) pairs, each link listed once"""
+        bridges = cls()
+        bridges._build(labels, Counter(frozenset(link) for link in links))
+        return bridges
+
+    def _build(self, labels: Iterable[Hashable], links: Counter):
+        for label in labels:
+            self.add_node(label)
+        for pair in links:
+            for label in pair:
+                self.add_node(label)
+
+        # Breadth-first spanning forest keeps tree paths short
+        adjacency: Dict[Hashable, List[Hashable]] = {label: [] for label in self.parent}
+        for pair in links:
+            if len(pair) == 2:
+                a, b = pair
+                adjacency[a].append(b)
+                adjacency[b].append(a)
+        visited: Set[Hashable] = set()
+        for root in adjacency:
+            if root in visited:
+                continue
+            visited.add(root)
+            queue = [root]
+            for label in queue:
+                for neighbor in adjacency[label]:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        self._attach(neighbor, label)
+                        links[frozenset((label, neighbor))] -= 1
+                        queue.append(neighbor)
+
+        for pair, count in links.items():
+            # Self-loops never affect connectivity
+            if count and len(pair) == 2:
+                a, b = pair
+                self._add_extra(a, b, count)
+
+    def add_node(self, label: Hashable):
+        if label in self.parent:
+            return
+
+        self.parent[label] = None
+        self.children[label] = set()
+        self.extra[label] = Counter()
+        self.joins[label] = {}
+
+    def add_link(self, from_label: Hashable, to_label: Hashable):
+        self.add_node(from_label)
+        self.add_node(to_label)
+        if from_label == to_label:
+            return
+
+        if self._tree_path(from_label, to_label) is None:
+            # Joins two trees: the new link is a bridge until a cycle covers it
+            self._reroot(from_label)
+            self._attach(from_label, to_label)
+        else:
+            self._add_extra(from_label, to_label, 1)
+
+    def remove_link(self, from_label: Hashable, to_label: Hashable):
+        if from_label not in self.parent or to_label not in self.parent:
+            print(f"Edge from {from_label} to {to_label} not found")
+            return
+
+        if self.extra[from_label][to_label]:
+            self._add_extra(from_label, to_label, -1)
+            return
+
+        if self.parent[to_label] == from_label:
+            self._remove_tree_edge(from_label, to_label)
+        elif self.parent[from_label] == to_label:
+            self._remove_tree_edge(to_label, from_label)
+        else:
+            print(f"Edge from {from_label} to {to_label} not found")
+
+    def is_bridge(self, from_label: Hashable, to_label: Hashable) -> bool:
+        if self.parent.get(to_label) == from_label and from_label is not None:
+            return to_label in self.bridge_children
+        if self.parent.get(from_label) == to_label and to_label is not None:
+            return from_label in self.bridge_children
+        return False
+
+    def is_articulation_point(self, label: Hashable) -> bool:
+        if label in self.dirty:
+            self._refresh(label)
+        return label in self.articulation
+
+    def bridges(self) -> List[List[Hashable]]:
+        return [[self.parent[child], child] for child in self.bridge_children]
+
+    def articulation_points(self) -> List[Hashable]:
+        for label in list(self.dirty):
+            self._refresh(label)
+        return list(self.articulation)
+
+    def _attach(self, child: Hashable, parent: Hashable):
+        self.parent[child] = parent
+        self.children[parent].add(child)
+        self.cover[child] = 0
+        self.bridge_children.add(child)
+        self.dirty.update((child, parent))
+
+    def _detach(self, child: Hashable):
+        parent = self.parent[child]
+        self.parent[child] = None
+        self.children[parent].discard(child)
+        del self.cover[child]
+        self.bridge_children.discard(child)
+        self.dirty.update((child, parent))
+
+    def _add_extra(self, from_label: Hashable, to_label: Hashable, count: int):
+        self.extra[from_label][to_label] += count
+        self.extra[to_label][from_label] += count
+        if not self.extra[from_label][to_label]:
+            del self.extra[from_label][to_label]
+            del self.extra[to_label][from_label]
+        self._cover_path(self._tree_path(from_label, to_label), count)
+
+    def _tree_path(self, from_label: Hashable, to_label: Hashable) -> Optional[List[Hashable]]:
+        """Tree path between two nodes, or None in different trees"""
+        parent = self.parent
+        up_from = [from_label]
+        up_to = [to_label]
+        seen_from = {from_label: 0}
+        seen_to = {to_label: 0}
+
+        # Climb both sides in step so the cost follows the path, not the depth
+        while True:
+            if up_from[-1] in seen_to:
+                up_to = up_to[:seen_to[up_from[-1]] + 1]
+                break
+            if up_to[-1] in seen_from:
+                up_from = up_from[:seen_from[up_to[-1]] + 1]
+                break
+
+            moved = False
+            for up, seen in ((up_from, seen_from), (up_to, seen_to)):
+                above = parent[up[-1]]
+                if above is not None:
+                    seen[above] = len(up)
+                    up.append(above)
+                    moved = True
+            if not moved:
+                return None
+
+        up_to.pop()
+        up_to.reverse()
+        return up_from + up_to
+
+    def _cover_path(self, path: List[Hashable], delta: int):
+        parent = self.parent
+        cover = self.cover
+        bridge_children = self.bridge_children
+        all_joins = self.joins
+        for index in range(len(path) - 1):
+            a, b = path[index], path[index + 1]
+            child = a if parent[a] == b else b
+            count = cover[child] + delta
+            cover[child] = count
+            if count:
+                bridge_children.discard(child)
+            else:
+                bridge_children.add(child)
+
+        for index in range(1, len(path) - 1):
+            joins = all_joins[path[index]]
+            pair = frozenset((path[index - 1], path[index + 1]))
+            count = joins.get(pair, 0) + delta
+            if count:
+                joins[pair] = count
+            else:
+                del joins[pair]
+        self.dirty.update(path[1:-1])
+
+    def _reroot(self, label: Hashable):
+        path = [label]
+        while self.parent[path[-1]] is not None:
+            path.append(self.parent[path[-1]])
+
+        covers = [self.cover[child] for child in path[:-1]]
+        for child in path[:-1]:
+            self._detach(child)
+        for index, cover in enumerate(covers):
+            self._attach(path[index + 1], path[index])
+            self.cover[path[index + 1]] = cover
+            if cover:
+                self.bridge_children.discard(path[index + 1])
+
+    def _remove_tree_edge(self, parent: Hashable, child: Hashable):
+        if not self.cover[child]:
+            self._detach(child)
+            return
+
+        side = self._smaller_side(parent, child)
+        crossing: Counter = Counter()
+        for label in side:
+            for other, count in self.extra[label].items():
+                if other not in side:
+                    crossing[(label, other)] += count
+
+        for (label, other), count in crossing.items():
+            self._cover_path(self._tree_path(label, other), -count)
+        self._detach(child)
+
+        # Some crossing link covered the edge, so it reconnects the two sides
+        (inside, outside), _ = crossing.most_common(1)[0]
+        crossing[(inside, outside)] -= 1
+        self.extra[inside][outside] -= 1
+        self.extra[outside][inside] -= 1
+        if not self.extra[inside][outside]:
+            del self.extra[inside][outside]
+            del self.extra[outside][inside]
+        self._reroot(inside)
+        self._attach(inside, outside)
+
+        for (label, other), count in crossing.items():
+            if count:
+                self._cover_path(self._tree_path(label, other), count)
+
+    def _smaller_side(self, parent: Hashable, child: Hashable) -> Set[Hashable]:
+        """Nodes on the smaller side of the tree once the parent-child edge is cut"""
+        # Child's side is its subtree. Parent's side starts by climbing, never back down into child
+        sides = [([child], {child}), ([parent], {parent, child})]
+        positions = [0, 0]
+
+        # Grow both sides one node at a time; the first to run out is the smaller
+        while True:
+            for index, (queue, seen) in enumerate(sides):
+                if positions[index] == len(queue):
+                    if index == 1:
+                        seen.discard(child)
+                    return seen
+                label = queue[positions[index]]
+                positions[index] += 1
+                above = self.parent[label]
+                if above is not None and label != child and above not in seen:
+                    seen.add(above)
+                    queue.append(above)
+                for below in self.children[label]:
+                    if below not in seen:
+                        seen.add(below)
+                        queue.append(below)
+
+    def _refresh(self, label: Hashable):
+        self.dirty.discard(label)
+        if label not in self.parent:
+            return
+
+        neighbors = list(self.children[label])
+        if self.parent[label] is not None:
+            neighbors.append(self.parent[label])
+
+        # Union the tree neighbours that some cycle through label joins
+        groups = {neighbor: neighbor for neighbor in neighbors}
+        def find(item):
+            while groups[item] != item:
+                groups[item] = groups[groups[item]]
+                item = groups[item]
+            return item
+
+        count = len(neighbors)
+        for pair in self.joins[label]:
+            a, b = pair
+            root_a, root_b = find(a), find(b)
+            if root_a != root_b:
+                groups[root_a] = root_b
+                count -= 1
+
+        if count > 1:
+            self.articulation.add(label)
+        else:
+            self.articulation.discard(label)
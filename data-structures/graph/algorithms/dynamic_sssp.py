@@ -0,0 +1,174 @@
+from typing import Dict, List, Optional, Set
+from weighted_graph import WeightedGraph
+from algorithms.dijkstra import ShortestPath
+from algorithms.heaps import IndexedHeap
+
+class DynamicShortestPaths:
+    """
+    Shortest-path tree from one source that stays correct while edges of the
+    graph are added, removed or re-weighted through this object.
+
+    A cheaper edge can only shorten paths, so a Dijkstra search starts at its
+    head and stops where distances stop improving. A dearer or removed tree
+    edge can only lengthen paths through its head, so only that subtree is
+    reset and re-settled from its best entry points outside the subtree.
+    Either way the work is proportional to the nodes whose distance or parent
+    changes and their edges, not to the graph.
+
+    distances and parents are kept current and keyed by label; unreachable
+    nodes have distance inf and parent None.
+    """
+
+    def __init__(self, graph: WeightedGraph, source: str):
+        self.graph = graph
+        self.source = source
+        self.distances: Dict[str, float] = dict.fromkeys(graph.nodes, float('inf'))
+        self.parents: Dict[str, Optional[str]] = dict.fromkeys(graph.nodes)
+        self.children: Dict[str, Set[str]] = {label: set() for label in graph.nodes}
+
+        # Cheapest edge weight between each pair of nodes, in both directions
+        self.out_weights: Dict[str, Dict[str, float]] = {label: {} for label in graph.nodes}
+        self.in_weights: Dict[str, Dict[str, float]] = {label: {} for label in graph.nodes}
+        for node in graph.get_nodes():
+            for edge in node.get_edges():
+                self._store_weight(node.label, edge.to_node.label)
+
+        if source not in graph.nodes:
+            print(f"Node with the label {source} does not exist in the graph")
+            return
+
+        self.distances[source] = 0
+        self._propagate([source])
+
+    def distance(self, label: str) -> float:
+        return self.distances.get(label, float('inf'))
+
+    def shortest_path(self, target: str) -> ShortestPath:
+        distance = self.distance(target)
+        if distance == float('inf'):
+            return ShortestPath(distance)
+
+        path: List[str] = [target]
+        while self.parents[path[-1]] is not None:
+            path.append(self.parents[path[-1]])
+        path.reverse()
+        return ShortestPath(distance, path)
+
+    def add_edge(self, from_node_label: str, to_node_label: str, weight: float, directed: bool = False):
+        if directed:
+            self.graph.add_directed_edge(from_node_label, to_node_label, weight)
+        else:
+            self.graph.add_undirected_edge(from_node_label, to_node_label, weight)
+        self._edge_changed(from_node_label, to_node_label)
+        if not directed:
+            self._edge_changed(to_node_label, from_node_label)
+
+    def set_edge_weight(self, from_node_label: str, to_node_label: str, weight: float, directed: bool = False):
+        if directed:
+            self.graph.set_directed_edge_weight(from_node_label, to_node_label, weight)
+        else:
+            self.graph.set_undirected_edge_weight(from_node_label, to_node_label, weight)
+        self._edge_changed(from_node_label, to_node_label)
+        if not directed:
+            self._edge_changed(to_node_label, from_node_label)
+
+    def remove_edge(self, from_node_label: str, to_node_label: str, directed: bool = False):
+        if directed:
+            self.graph.remove_directed_edge(from_node_label, to_node_label)
+        else:
+            self.graph.remove_undirected_edge(from_node_label, to_node_label)
+        self._edge_changed(from_node_label, to_node_label)
+        if not directed:
+            self._edge_changed(to_node_label, from_node_label)
+
+    def _store_weight(self, from_label: str, to_label: str) -> float:
+        """Re-reads the cheapest from -> to edge from the graph and returns the old weight"""
+        for label in (from_label, to_label):
+            if label not in self.out_weights:
+                # Node added to the graph after this object was built
+                self.distances[label] = float('inf')
+                self.parents[label] = None
+                self.children[label] = set()
+                self.out_weights[label] = {}
+                self.in_weights[label] = {}
+
+        old_weight = self.out_weights[from_label].get(to_label, float('inf'))
+        weights = [edge.weight for edge in self.graph.nodes[from_label].edges if edge.to_node.label == to_label]
+        if weights:
+            self.out_weights[from_label][to_label] = min(weights)
+            self.in_weights[to_label][from_label] = min(weights)
+        else:
+            self.out_weights[from_label].pop(to_label, None)
+            self.in_weights[to_label].pop(from_label, None)
+        return old_weight
+
+    def _edge_changed(self, from_label: str, to_label: str):
+        if from_label not in self.graph.nodes or to_label not in self.graph.nodes:
+            return
+
+        old_weight = self._store_weight(from_label, to_label)
+        new_weight = self.out_weights[from_label].get(to_label, float('inf'))
+
+        if new_weight < old_weight:
+            new_distance = self.distances[from_label] + new_weight
+            if new_distance < self.distances[to_label]:
+                self.distances[to_label] = new_distance
+                self._set_parent(to_label, from_label)
+                self._propagate([to_label])
+        elif new_weight > old_weight and self.parents[to_label] == from_label:
+            self._reroot_subtree(to_label)
+
+    def _set_parent(self, label: str, parent: Optional[str]):
+        old_parent = self.parents[label]
+        if old_parent is not None:
+            self.children[old_parent].discard(label)
+        self.parents[label] = parent
+        if parent is not None:
+            self.children[parent].add(label)
+
+    def _reroot_subtree(self, root: str):
+        # Every node below the dearer edge may now be further away; nothing else can be
+        subtree: List[str] = [root]
+        for label in subtree:
+            subtree.extend(self.children[label])
+        affected = set(subtree)
+
+        for label in subtree:
+            self._set_parent(label, None)
+            self.distances[label] = float('inf')
+
+        # Best way into each affected node from a node whose distance is unchanged
+        distances = self.distances
+        entry_points: List[str] = []
+        for label in subtree:
+            for from_label, weight in self.in_weights[label].items():
+                if from_label not in affected and distances[from_label] + weight < distances[label]:
+                    distances[label] = distances[from_label] + weight
+                    self._set_parent(label, from_label)
+            if distances[label] < float('inf'):
+                entry_points.append(label)
+
+        self._propagate(entry_points)
+
+    def _propagate(self, labels: List[str]):
+        """Dijkstra from nodes whose distance just dropped, relaxing until nothing improves"""
+        distances = self.distances
+        queue = IndexedHeap(4)
+        for label in labels:
+            queue.push(label, distances[label])
+
+        while queue:
+            label, dist = queue.pop()
+            for to_label, weight in self.out_weights[label].items():
+                new_distance = dist + weight
+                if new_distance < distances[to_label]:
+                    distances[to_label] = new_distance
+                    self._set_parent(to_label, label)
+                    if to_label in queue:
+                        queue.decrease_key(to_label, new_distance)
+                    else:
+                        queue.push(to_label, new_distance)
+
+    def __repr__(self) -> str:
+        reachable = sum(1 for distance in self.distances.values() if distance < float('inf'))
+        return f"DynamicShortestPaths(source={self.source}, reachable={reachable})"
@@ -0,0 +1,28 @@
+import importlib.util
+import os
+import sys
+from types import ModuleType
+
+# The heap package sits next to the graph directory, in data-structures/heap
+_HEAP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'heap')
+
+def _load(name: str) -> ModuleType:
+    """
+    The heap module called name, loaded from _HEAP_DIR without touching
+    sys.path. It is registered under its plain name, so the algorithms and
+    any caller importing it from sys.path share one module and one class.
+    """
+    module = sys.modules.get(name, None)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(name, os.path.join(_HEAP_DIR, f'{name}.py'))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return module
+
+IndexedHeap = _load('indexed_heap').IndexedHeap
+RadixHeap = _load('radix_heap').RadixHeap
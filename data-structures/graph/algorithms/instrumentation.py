@@ -0,0 +1,109 @@
+import time
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+from graph import Graph
+from csr_graph import CSRGraph
+
+@dataclass
+class TraversalStats:
+    """Work done by one call of an instrumented algorithm"""
+    algorithm: str
+    nodes_visited: int = 0
+    edges_scanned: int = 0
+    heap_pushes: int = 0  # Entries added, including ones that make an older entry for the node stale
+    heap_pops: int = 0
+    stale_pops: int = 0  # Outdated queue entries popped and skipped
+    decrease_keys: int = 0  # Keys of queued nodes lowered, in place or by pushing a new entry
+    phases: Dict[str, float] = field(default_factory=dict)  # Seconds per phase, in the order they ran
+    _mark: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    def lap(self, phase: str):
+        """Charges the time since the previous lap, or since creation, to phase"""
+        now = time.perf_counter()
+        self.phases[phase] = self.phases.get(phase, 0.0) + now - self._mark
+        self._mark = now
+
+    def seconds(self) -> float:
+        return sum(self.phases.values())
+
+    def as_dict(self) -> Dict:
+        return {
+            'algorithm': self.algorithm,
+            'nodes_visited': self.nodes_visited,
+            'edges_scanned': self.edges_scanned,
+            'heap_pushes': self.heap_pushes,
+            'heap_pops': self.heap_pops,
+            'stale_pops': self.stale_pops,
+            'decrease_keys': self.decrease_keys,
+            'phases': dict(self.phases),
+        }
+
+StatsCallback = Callable[[TraversalStats], None]
+
+class Instrumentation:
+    """
+    Opt-in statistics for the traversal and shortest-path algorithms. While
+    a `with Instrumentation(callback) as run:` block is open, every
+    instrumented call appends a TraversalStats to run.calls and hands it to
+    callback, e.g. to forward it to a metrics pipeline. Blocks are tracked
+    per thread (per context), so calls made by other threads are not
+    recorded.
+
+    With no block open an algorithm checks one flag per call and does no
+    counting or timing at all. The counts are derived from the finished
+    search where possible rather than tallied edge by edge, so enabling it
+    adds little to the search itself either.
+    """
+    def __init__(self, callback: Optional[StatsCallback] = None):
+        self.callback = callback
+        self.calls: List[TraversalStats] = []
+        self._tokens: List[Token] = []
+
+    def __enter__(self) -> 'Instrumentation':
+        self._tokens.append(_active.set(_active.get() + (self,)))
+        return self
+
+    def __exit__(self, *exc_info):
+        _active.reset(self._tokens.pop())
+
+    def totals(self) -> Dict[str, TraversalStats]:
+        """Stats of every recorded call summed per algorithm"""
+        totals: Dict[str, TraversalStats] = {}
+        for stats in self.calls:
+            total = totals.setdefault(stats.algorithm, TraversalStats(stats.algorithm))
+            total.nodes_visited += stats.nodes_visited
+            total.edges_scanned += stats.edges_scanned
+            total.heap_pushes += stats.heap_pushes
+            total.heap_pops += stats.heap_pops
+            total.stale_pops += stats.stale_pops
+            total.decrease_keys += stats.decrease_keys
+            for phase, seconds in stats.phases.items():
+                total.phases[phase] = total.phases.get(phase, 0.0) + seconds
+        return totals
+
+# The blocks open in the current context, innermost last. A new thread starts with none
+_active: ContextVar[Tuple[Instrumentation, ...]] = ContextVar('instrumentation', default=())
+
+def collect(algorithm: str) -> Optional[TraversalStats]:
+    """Fresh stats for an algorithm call when instrumentation is on, None otherwise"""
+    return TraversalStats(algorithm) if _active.get() else None
+
+def report(stats: TraversalStats):
+    for instrumentation in _active.get():
+        instrumentation.calls.append(stats)
+        if instrumentation.callback is not None:
+            instrumentation.callback(stats)
+
+def scanned_edges(graph: Graph, keys: Iterable[Hashable]) -> int:
+    """Out-degree sum of the given nodes: ids on a CSRGraph, labels otherwise"""
+    if isinstance(graph, CSRGraph):
+        offsets = graph.offsets
+        return sum(offsets[key + 1] - offsets[key] for key in keys)
+    nodes = graph.nodes
+    return sum(len(nodes[label].edges) for label in keys)
+
+def edge_total(graph: Graph) -> int:
+    if isinstance(graph, CSRGraph):
+        return graph.edge_count()
+    return sum(len(node.edges) for node in graph.nodes.values())
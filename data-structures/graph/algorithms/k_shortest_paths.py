@@ -0,0 +1,220 @@
+from bisect import insort
+from typing import Dict, List, Optional, Set, Tuple
+from graph import Graph
+from csr_graph import CSRGraph
+from algorithms.dijkstra import ShortestPath, _csr_distances, _guided_search, _walk_parents
+from algorithms.instrumentation import TraversalStats, collect, report, scanned_edges
+
+# (cost, node ids, distance from the source at each node, index where it leaves its parent path)
+Candidate = Tuple[float, Tuple[int, ...], Tuple[float, ...], int]
+
+class KShortestPaths:
+    """
+    Yen's k shortest loopless paths between two nodes, cheapest first, over a
+    CSR copy of the graph. Paths are node sequences; parallel edges count
+    once, at their lowest weight.
+
+    Path i + 1 is the cheapest path that leaves one of paths 1..i at some
+    spur node and never revisits the root before it. What keeps the
+    spur searches cheap:
+      - One reverse Dijkstra from the target gives every node's exact
+        distance to it in the full graph. Blocking edges can only lengthen
+        paths, so that distance is a lower bound for any spur search.
+      - When the reverse tree's own path from the spur node avoids
+        everything blocked, it is already the best spur path and no search
+        runs. Otherwise the spur search is A* with the lower bound as its
+        estimate (_guided_search, the point-to-point primitive in dijkstra).
+      - Only the cheapest k - len(found) candidates are kept. A spur node
+        whose root cost plus lower bound cannot beat the last of them is
+        skipped, and a search gives up once it cannot either. A path is spur
+        only from the node where it left its parent onwards (Lawler); the
+        nodes before that were tried when the parent was expanded.
+      - A search first runs inside bands of one, two and four mean edge
+        weights above the lower bound, so hubs on the way do not queue
+        every neighbour they have when the answer lies just above it.
+
+    The reverse tree for the most recent target is kept, so repeated queries
+    towards one endpoint skip it. The graph is re-read when its version
+    changes.
+    """
+    def __init__(self, graph: Graph):
+        self.graph = graph
+        self.version = None
+        self._tree_target: Optional[int] = None
+        self._load()
+
+    def _load(self):
+        graph = self.graph
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        if csr.weights is not None and min(csr.weights, default=0) < 0:
+            raise ValueError("k shortest paths needs non-negative edge weights")
+
+        self.version = getattr(graph, 'version', None)
+        self.csr = csr
+        self.reverse = csr.transpose()
+        self._mean_weight = 1.0
+        if csr.weights is not None and len(csr.weights):
+            self._mean_weight = sum(csr.weights) / len(csr.weights)
+        self._tree_target = None
+        self._distance_to_target: List[float] = []
+        self._next_hop: List[Optional[int]] = []
+
+    def paths(self, source: str, target: str, k: int) -> List[ShortestPath]:
+        if k < 1:
+            raise ValueError(f"Path count must be positive, got {k}")
+        if getattr(self.graph, 'version', None) != self.version:
+            self._load()
+
+        csr = self.csr
+        for label in (source, target):
+            if csr.get_id(label) is None:
+                print(f"Node with the label {label} does not exist in the graph")
+                return []
+
+        stats = collect('k_shortest_paths')
+        source_id = csr.get_id(source)
+        target_id = csr.get_id(target)
+        self._reverse_tree(target_id)
+        if stats is not None:
+            stats.lap('reverse_tree')
+
+        distance_to_target = self._distance_to_target
+        if distance_to_target[source_id] == float('inf'):
+            if stats is not None:
+                report(stats)
+            return []
+
+        first = self._tree_spur(source_id, 0.0, set(), set())
+        accepted: List[Candidate] = [(first[0], first[1], first[2], 0)]
+        candidates: List[Candidate] = []
+        seen: Set[Tuple[int, ...]] = {first[1]}
+        # Accepted paths as a prefix tree: the children of a prefix are the nodes they continue to
+        prefixes: Dict[int, Dict] = {}
+        self._add_prefix(prefixes, first[1])
+
+        while len(accepted) < k:
+            _, previous, previous_prefix, deviation = accepted[-1]
+            need = k - len(accepted)
+            blocked_nodes = set(previous[:deviation])
+            branch = prefixes
+            for node in previous[:deviation]:
+                branch = branch[node]
+
+            for index in range(deviation, len(previous) - 1):
+                spur = previous[index]
+                branch = branch[spur]
+                root_cost = previous_prefix[index]
+                bound = candidates[need - 1][0] if len(candidates) >= need else float('inf')
+
+                if root_cost + distance_to_target[spur] < bound:
+                    # Edges out of the spur node already used by an accepted path with this root
+                    blocked_next = set(branch)
+                    spur_path = self._tree_spur(spur, root_cost, blocked_nodes, blocked_next)
+                    if spur_path is None:
+                        spur_path = self._search_spur(spur, target_id, root_cost, bound, blocked_nodes, blocked_next,
+                                                      stats)
+
+                    if spur_path is not None:
+                        cost, spur_nodes, spur_prefix = spur_path
+                        path = previous[:index] + spur_nodes
+                        if cost < bound and path not in seen:
+                            seen.add(path)
+                            insort(candidates, (cost, path, previous_prefix[:index] + spur_prefix, index))
+                            if len(candidates) > need:
+                                seen.discard(candidates.pop()[1])
+
+                blocked_nodes.add(spur)
+
+            if not candidates:
+                break
+            accepted.append(candidates.pop(0))
+            self._add_prefix(prefixes, accepted[-1][1])
+
+        if stats is not None:
+            stats.lap('spur_paths')
+            report(stats)
+
+        labels = csr.labels
+        return [ShortestPath(cost, [labels[node] for node in path]) for cost, path, _, _ in accepted]
+
+    def _reverse_tree(self, target: int):
+        """Distance to target and next hop towards it for every node, inf and None where it cannot be reached"""
+        if self._tree_target == target:
+            return
+
+        reverse = self.reverse
+        distance, next_hop = _csr_distances(reverse.offsets, reverse.targets, reverse.weights, target)
+        self._distance_to_target = distance
+        self._next_hop = next_hop
+        self._tree_target = target
+
+    def _tree_spur(self, spur: int, root_cost: float, blocked_nodes: Set[int],
+                   blocked_next: Set[int]) -> Optional[Tuple[float, Tuple[int, ...], Tuple[float, ...]]]:
+        """The reverse tree's path from spur, when it avoids everything blocked"""
+        next_hop = self._next_hop
+        distance_to_target = self._distance_to_target
+        if next_hop[spur] in blocked_next:
+            return None
+
+        path = [spur]
+        node = next_hop[spur]
+        while node is not None:
+            if node in blocked_nodes:
+                return None
+            path.append(node)
+            node = next_hop[node]
+
+        spur_distance = distance_to_target[spur]
+        prefix = tuple(root_cost + spur_distance - distance_to_target[node] for node in path)
+        return root_cost + spur_distance, tuple(path), prefix
+
+    def _search_spur(self, spur: int, target: int, root_cost: float, bound: float, blocked_nodes: Set[int],
+                     blocked_next: Set[int],
+                     stats: Optional[TraversalStats]) -> Optional[Tuple[float, Tuple[int, ...], Tuple[float, ...]]]:
+        offsets = self.csr.offsets
+        targets = self.csr.targets
+        weights = self.csr.weights
+
+        def neighbors(node: int):
+            start, end = offsets[node], offsets[node + 1]
+            edges = zip(targets[start:end], weights[start:end]) if weights is not None \
+                else ((to_node, 1.0) for to_node in targets[start:end])
+            if node == spur:
+                return [(to_node, weight) for to_node, weight in edges
+                        if to_node not in blocked_nodes and to_node not in blocked_next]
+            return [(to_node, weight) for to_node, weight in edges if to_node not in blocked_nodes]
+
+        # The best spur path usually costs little more than the lower bound, while a hub queues
+        # every neighbour it has. Searching inside widening bands above the lower bound keeps those
+        # neighbours out of the queue; the last round searches without a band
+        limit = bound - root_cost
+        lower = self._distance_to_target[spur]
+        estimate = self._distance_to_target.__getitem__
+        for width in (1, 2, 4, None):
+            round_bound = min(lower + width * self._mean_weight, limit) if width is not None else limit
+            # Nodes that cannot reach the target at all have an infinite estimate and are never queued
+            distance, parent, queue, found = _guided_search(neighbors, spur, target, estimate, round_bound, stats)
+            if stats is not None:
+                settled = [node for node in distance if node not in queue]
+                stats.nodes_visited += len(settled)
+                stats.heap_pops += len(settled)
+                stats.heap_pushes += len(distance)
+                stats.edges_scanned += scanned_edges(self.csr, settled)
+            if found or round_bound >= limit:
+                break
+        if not found:
+            return None
+
+        path = _walk_parents(parent, target)
+        path.reverse()
+        return root_cost + distance[target], tuple(path), tuple(root_cost + distance[node] for node in path)
+
+    @staticmethod
+    def _add_prefix(prefixes: Dict[int, Dict], path: Tuple[int, ...]):
+        branch = prefixes
+        for node in path:
+            branch = branch.setdefault(node, {})
+
+def k_shortest_paths(graph: Graph, source: str, target: str, k: int) -> List[ShortestPath]:
+    """The k cheapest loopless paths from source to target, fewer if the graph has fewer"""
+    return KShortestPaths(graph).paths(source, target, k)
@@ -1,10 +1,41 @@
-from typing import Dict, List
+from array import array
+from itertools import compress
+from multiprocessing import Pool
+from operator import add, and_, attrgetter, ne
+from typing import Dict, List, Optional, Tuple
 from union_find import UnionFind
-from graph import Graph, WeightedEdge
+from graph import Graph, Node, WeightedEdge
+from csr_graph import CSRGraph
+
+# Edge lists at or below this size are sorted directly by filter-Kruskal
+_FILTER_BASE_SIZE = 4096
+
+def kruskal(graph: Graph, method: str = 'classic', workers: Optional[int] = None) -> List[WeightedEdge]:
+    """
+    Minimum spanning forest. Every method returns the same edges in the same
+    order (by weight, ties in edge order):
+
+    classic  sort every edge, then scan
+    filter   filter-Kruskal: split edges around a pivot weight, solve the light
+             half first and drop heavy edges that already close a cycle before
+             sorting them
+    boruvka  repeatedly join every component through its cheapest outgoing
+             edge; with workers > 1 the search is split across a process pool
+    """
+    if method == 'boruvka':
+        return _boruvka(graph, workers)
+
+    if method == 'filter':
+        return _filter_kruskal(graph)
+
+    if method != 'classic':
+        raise ValueError(f"Unknown MST method '{method}', expected 'classic', 'filter' or 'boruvka'")
+
+    if isinstance(graph, CSRGraph):
+        return _kruskal_csr(graph)
 
-def kruskal(graph: Graph) -> List[WeightedEdge]:
     nodes = graph.get_nodes()
-    node_to_index: Dict = {node: i for i, node in enumerate(nodes)}
+    node_to_index: Dict[str, int] = {node.label: i for i, node in enumerate(nodes)}
     union_find = UnionFind(len(nodes))
 
     edges: List[WeightedEdge] = []
@@ -17,11 +48,204 @@ def kruskal(graph: Graph) -> List[WeightedEdge]:
 
     mst = []
     for edge in edges:
-        from_idx = node_to_index[edge.from_node]
-        to_idx = node_to_index[edge.to_node]
-        if union_find.find(from_idx) != union_find.find(to_idx):
-            union_find.union(from_idx, to_idx)
+        from_idx = node_to_index[edge.from_node.label]
+        to_idx = node_to_index[edge.to_node.label]
+        if union_find.union(from_idx, to_idx):
             mst.append(edge)
             if len(mst) == len(nodes) - 1:
                 break
     return mst
+
+def _kruskal_csr(graph: CSRGraph) -> List[WeightedEdge]:
+    n = graph.node_count()
+    union_find = UnionFind(n)
+    sources = graph.sources()
+    targets = graph.targets
+    weights = graph.weights
+
+    # Sorting edge indices keeps the sort stable like the object path
+    edge_order = range(graph.edge_count())
+    if weights is not None:
+        edge_order = sorted(edge_order, key=weights.__getitem__)
+
+    mst: List[WeightedEdge] = []
+    for edge_index in edge_order:
+        from_idx = sources[edge_index]
+        to_idx = targets[edge_index]
+        if union_find.union(from_idx, to_idx):
+            weight = weights[edge_index] if weights is not None else 1.0
+            mst.append(WeightedEdge(Node(graph.labels[from_idx]), Node(graph.labels[to_idx]), weight))
+            if len(mst) == n - 1:
+                break
+    return mst
+
+def _edge_arrays(graph: Graph) -> Tuple[int, array, array, array, Optional[List[WeightedEdge]]]:
+    """
+    Node count plus the source, target and weight of every edge by edge index,
+    and for object graphs the edges themselves in the same order
+    """
+    if isinstance(graph, CSRGraph):
+        # Arrays rather than the CSR memoryviews: the Borůvka pool may have to pickle them
+        weights = array('d', graph.weights) if graph.weights is not None else array('d', [1.0]) * graph.edge_count()
+        return graph.node_count(), graph.sources(), array('i', graph.targets), weights, None
+
+    node_to_index: Dict[str, int] = {label: i for i, label in enumerate(graph.nodes)}
+    edges: List[WeightedEdge] = []
+    sources = array('i')
+    for i, node in enumerate(graph.get_nodes()):
+        edges.extend(node.edges)
+        sources.extend(array('i', [i]) * len(node.edges))
+    targets = array('i', map(node_to_index.__getitem__, map(attrgetter('to_node.label'), edges)))
+    weights = array('d', map(attrgetter('weight'), edges))
+    return len(node_to_index), sources, targets, weights, edges
+
+def _mst_edges(graph: Graph, edge_indices: List[int], sources: array, targets: array,
+               weights: array, edges: Optional[List[WeightedEdge]]) -> List[WeightedEdge]:
+    """Map selected edge indices back to the edge objects the classic method returns"""
+    if edges is not None:
+        return [edges[i] for i in edge_indices]
+    return [WeightedEdge(Node(graph.labels[sources[i]]), Node(graph.labels[targets[i]]), weights[i])
+            for i in edge_indices]
+
+def _filter_kruskal(graph: Graph) -> List[WeightedEdge]:
+    n, sources, targets, weights, edge_list = _edge_arrays(graph)
+    union_find = UnionFind(n)
+    parent = union_find.parent
+    union = union_find.union
+    selected: List[int] = []
+
+    # (edge indices, pivot): when pivot is set only the edges heavier than it are still
+    # pending, and they are split off together with the filter once the light side is done
+    stack: List[Tuple[List[int], Optional[float]]] = [(list(range(len(targets))), None)]
+    while stack and len(selected) < n - 1:
+        edges, pivot = stack.pop()
+
+        if pivot is not None:
+            # Keep the heavy edges whose ends the lighter edges have not connected yet
+            heavier = map(pivot.__lt__, map(weights.__getitem__, edges))
+            if len(edges) >= n:
+                # Resolving every root once lets the per-edge work run in C
+                roots = union_find.find_many(range(n))
+                from_roots = map(roots.__getitem__, map(sources.__getitem__, edges))
+                to_roots = map(roots.__getitem__, map(targets.__getitem__, edges))
+                edges = list(compress(edges, map(and_, heavier, map(ne, from_roots, to_roots))))
+            else:
+                remaining = []
+                for edge_index in compress(edges, heavier):
+                    x = sources[edge_index]
+                    y = targets[edge_index]
+                    while parent[x] != x:
+                        parent[x] = parent[parent[x]]
+                        x = parent[x]
+                    while parent[y] != y:
+                        parent[y] = parent[parent[y]]
+                        y = parent[y]
+                    if x != y:
+                        remaining.append(edge_index)
+                edges = remaining
+
+        # Aim the light side at about twice the edges the forest still needs. Lists that
+        # are not much longer than that gain nothing from splitting and are sorted whole.
+        fraction = 2 * (union_find.component_count() - 1) / max(1, len(edges))
+        if len(edges) > _FILTER_BASE_SIZE and fraction < 0.5:
+            pivot = _pivot_weight(edges, weights, fraction)
+            light = list(compress(edges, map(pivot.__ge__, map(weights.__getitem__, edges))))
+            if len(light) < len(edges):
+                stack.append((edges, pivot))
+                stack.append((light, None))
+                continue
+
+        # Stable sort keeps ties in edge order, exactly as the classic method scans them
+        edges.sort(key=weights.__getitem__)
+        for edge_index in edges:
+            if union(sources[edge_index], targets[edge_index]):
+                selected.append(edge_index)
+                if len(selected) == n - 1:
+                    break
+
+    return _mst_edges(graph, selected, sources, targets, weights, edge_list)
+
+def _pivot_weight(edges: List[int], weights: array, fraction: float) -> float:
+    """Weight at the given quantile of an evenly spaced sample of the edges"""
+    step = max(1, len(edges) // 255)
+    sample = sorted(weights[edges[i]] for i in range(0, len(edges), step))
+    return sample[int(fraction * (len(sample) - 1))]
+
+def _boruvka(graph: Graph, workers: Optional[int]) -> List[WeightedEdge]:
+    n, sources, targets, weights, edge_list = _edge_arrays(graph)
+    union_find = UnionFind(n)
+    selected: List[int] = []
+
+    # With edges in (weight, index) order the first edge seen for a component is its
+    # cheapest one, and the fixed tie-break means the chosen edges never form a cycle
+    live = array('i', sorted(range(len(targets)), key=weights.__getitem__))
+    workers = workers if workers is not None and workers > 1 else 1
+    pool = Pool(workers, initializer=_init_worker, initargs=(sources, targets)) if workers > 1 else None
+    if pool is None:
+        _init_worker(sources, targets)
+
+    try:
+        while live:
+            components = union_find.find_many(range(n))
+            chunk = -(-len(live) // workers)
+            tasks = [(components, live[start:start + chunk]) for start in range(0, len(live), chunk)]
+            results = pool.map(_cheapest_edges, tasks) if pool is not None else [_cheapest_edges(tasks[0])]
+
+            # Chunks are consecutive runs of the sorted order, so earlier chunks take priority
+            cheapest: Dict[int, int] = {}
+            for result, _ in reversed(results):
+                cheapest.update(result)
+            live = array('i')
+            for _, remaining in results:
+                live.extend(remaining)
+
+            for edge_index in cheapest.values():
+                if union_find.union(sources[edge_index], targets[edge_index]):
+                    selected.append(edge_index)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    selected.sort(key=lambda edge_index: (weights[edge_index], edge_index))
+    return _mst_edges(graph, selected, sources, targets, weights, edge_list)
+
+# Edge endpoints of the graph being processed, set once per Borůvka worker process
+_worker_edges: Tuple[array, array] = (array('i'), array('i'))
+
+def _init_worker(sources: array, targets: array):
+    global _worker_edges
+    _worker_edges = (sources, targets)
+
+def _cheapest_edges(task: Tuple[array, array]) -> Tuple[Dict[int, int], array]:
+    """
+    Cheapest edge leaving each component among a sorted run of edges, and the
+    edges of the run that still join two components
+    """
+    components, edges = task
+    sources, targets = _worker_edges
+
+    from_components = list(map(components.__getitem__, map(sources.__getitem__, edges)))
+    to_components = list(map(components.__getitem__, map(targets.__getitem__, edges)))
+    crossing = list(map(ne, from_components, to_components))
+    edges = list(compress(edges, crossing))
+    from_components = list(compress(from_components, crossing))
+    to_components = list(compress(to_components, crossing))
+
+    # Of several edges between the same two components only the first can ever join
+    # the tree, so the run shrinks with the number of components rather than edges.
+    # A dict built from the reversed run keeps the first position of every key.
+    pair_keys = map(add, map(len(components).__mul__, map(min, from_components, to_components)),
+                    map(max, from_components, to_components))
+    keep = sorted(dict(zip(reversed(list(pair_keys)), reversed(range(len(edges))))).values())
+    edges = array('i', map(edges.__getitem__, keep))
+    from_components = list(map(from_components.__getitem__, keep))
+    to_components = list(map(to_components.__getitem__, keep))
+
+    # Each end is collected separately, and the earlier of the two positions wins
+    positions = range(len(edges))
+    first = dict(zip(reversed(from_components), reversed(positions)))
+    for component, position in dict(zip(reversed(to_components), reversed(positions))).items():
+        if position < first.get(component, len(edges)):
+            first[component] = position
+    return {component: edges[position] for component, position in first.items()}, edges
@@ -0,0 +1,321 @@
+from array import array
+from itertools import chain, compress
+from math import fsum
+from multiprocessing import Pool
+from operator import add, attrgetter, sub
+from random import Random
+from typing import Callable, Hashable, List, Mapping, Optional, Sequence, Tuple
+import mmap
+import struct
+import sys
+from graph import Graph
+from csr_graph import CSRGraph
+from graph_snapshot import LabelTable, label_sections, _aligned, _pad
+from algorithms.dijkstra import _csr_distances
+
+# Oracle layout (little-endian, every section starts on an 8-byte boundary):
+#
+#   magic           8 bytes  b'LANDMARK'
+#   header          FORMAT_VERSION, flags, node count, landmark count, label blob size,
+#                   edge count and weight total of the graph (its fingerprint)
+#   landmarks       int32[landmarks]
+#   forward         float64[nodes * landmarks]  distance from each landmark, row per node
+#   backward        float64[nodes * landmarks]  distance to each landmark, only when FLAG_DIRECTED is set
+#   label_offsets   int64[nodes + 1]
+#   label_order     int32[nodes]
+#   label_blob      utf-8 bytes
+MAGIC = b'LANDMARK'
+FORMAT_VERSION = 2
+FLAG_DIRECTED = 1
+_HEADER = struct.Struct('<IIqqqqd')
+
+# Node count, edge count and the exact sum of the edge weights (1 per unweighted edge)
+Fingerprint = Tuple[int, int, float]
+
+class LandmarkOracle:
+    """
+    Exact shortest-path distances between every node and a few landmarks,
+    giving distance bounds for any pair in O(landmarks) (ALT). With d the
+    true distance and l any landmark, the triangle inequality gives
+        d(l, v) - d(l, u) <= d(u, v) <= d(u, l) + d(l, v)
+    and d(u, l) - d(v, l) <= d(u, v) as well. The lower bound is a
+    consistent A* estimate, see dijkstra.alt_path.
+
+    Landmarks are picked by farthest-point selection: each one is the node
+    farthest from all landmarks before it, so they end up on the edges of
+    the graph, where the bounds are tightest. The distances are kept in one
+    flat array with a row of landmark distances per node. An undirected
+    graph only needs distances from the landmarks; a directed one also
+    stores distances to them, found on the transposed graph.
+
+    The oracle describes the graph it was built from and has to be rebuilt
+    when edges change. It keeps that graph's fingerprint, also in saved
+    files, and matches() compares it with the graph being queried.
+    """
+    def __init__(self, labels: Sequence[str], label_to_id: Mapping[str, int], landmarks: Sequence[int],
+                 forward: Sequence[float], backward: Optional[Sequence[float]], fingerprint: Fingerprint):
+        self.labels = labels
+        self.label_to_id = label_to_id
+        self.landmarks = landmarks
+        self.forward = forward
+        self.backward = backward
+        self.fingerprint = fingerprint
+        # The graph last found to match, and its version then
+        self._matched: Optional[Tuple[Graph, Optional[int]]] = None
+
+    @classmethod
+    def build(cls, graph: Graph, landmarks: int = 16, workers: Optional[int] = None,
+              seed: Optional[int] = None) -> 'LandmarkOracle':
+        """
+        Selection is sequential, since every landmark depends on the distances
+        from the previous ones. On a directed graph the distances to each
+        landmark are not needed for that, and with workers > 1 they are found
+        by a process pool while selection goes on.
+        """
+        if landmarks < 1:
+            raise ValueError(f"Landmark count must be positive, got {landmarks}")
+        workers = workers or 1
+        if workers < 1:
+            raise ValueError(f"Worker count must be positive, got {workers}")
+
+        csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+        n = csr.node_count()
+        if n == 0:
+            raise ValueError("Cannot place landmarks in an empty graph")
+        if csr.weights is not None and min(csr.weights, default=0) < 0:
+            raise ValueError("Landmark distances need non-negative edge weights")
+
+        reverse = csr.transpose()
+        directed = not _symmetric(csr, reverse)
+        # Arrays rather than the CSR memoryviews: the pool may have to pickle them
+        adjacency = (array('q', csr.offsets), array('i', csr.targets),
+                     array('d', csr.weights) if csr.weights is not None else None)
+        reverse_adjacency = (array('q', reverse.offsets), array('i', reverse.targets),
+                             array('d', reverse.weights) if reverse.weights is not None else None)
+
+        pool = Pool(workers, initializer=_init_worker, initargs=reverse_adjacency) \
+            if directed and workers > 1 else None
+        try:
+            chosen: List[int] = []
+            rows: List[List[float]] = []
+            pending = []
+            # The first landmark is the node farthest from a random start. Nodes the landmarks
+            # cannot reach are infinitely far, so they are picked before anything else
+            nearest = _csr_distances(*adjacency, Random(seed).randrange(n))[0]
+            while len(chosen) < min(landmarks, n):
+                landmark = nearest.index(max(nearest))
+                if chosen and nearest[landmark] == 0:
+                    break
+                chosen.append(landmark)
+                if pool is not None:
+                    pending.append(pool.apply_async(_distance_row, (landmark,)))
+                row = _csr_distances(*adjacency, landmark)[0]
+                rows.append(row)
+                nearest = row if len(chosen) == 1 else list(map(min, nearest, row))
+
+            reverse_rows: List[List[float]] = []
+            if pool is not None:
+                reverse_rows = [result.get() for result in pending]
+            elif directed:
+                reverse_rows = [_csr_distances(*reverse_adjacency, landmark)[0] for landmark in chosen]
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        oracle = cls(csr.labels, csr.label_to_id, array('i', chosen), _interleave(rows, n),
+                     _interleave(reverse_rows, n) if directed else None, graph_fingerprint(csr))
+        oracle._matched = (graph, getattr(graph, 'version', None))
+        return oracle
+
+    def matches(self, graph: Graph) -> bool:
+        """
+        Whether graph has the fingerprint the oracle was built with. A match
+        is remembered until the graph's version changes; a changed version of
+        the graph last matched is taken as stale without recomputing.
+        """
+        version = getattr(graph, 'version', None)
+        if self._matched is not None and self._matched[0] is graph:
+            return self._matched[1] == version
+        if graph_fingerprint(graph) != tuple(self.fingerprint):
+            return False
+        self._matched = (graph, version)
+        return True
+
+    def landmark_labels(self) -> List[str]:
+        return [self.labels[landmark] for landmark in self.landmarks]
+
+    def node_count(self) -> int:
+        return len(self.labels)
+
+    def lower_bound(self, source: str, target: str) -> float:
+        """At most the distance from source to target, inf when target certainly cannot be reached"""
+        ids = self._ids(source, target)
+        if ids is None:
+            return float('inf')
+        return self.estimator(ids[1], by_id=True)(ids[0])
+
+    def upper_bound(self, source: str, target: str) -> float:
+        """Length of the best path from source to target through a landmark, inf if there is none"""
+        ids = self._ids(source, target)
+        if ids is None:
+            return float('inf')
+        to_landmarks = self.backward if self.backward is not None else self.forward
+        return min(map(add, self._row(to_landmarks, ids[0]), self._row(self.forward, ids[1])))
+
+    def heuristic(self, label: str, target: str) -> float:
+        """lower_bound with the signature dijkstra.astar expects"""
+        return self.lower_bound(label, target)
+
+    def estimator(self, target: Hashable, by_id: bool = False) -> Callable[[Hashable], float]:
+        """
+        Lower bound on the distance to target from a node, both given by
+        label, or both by id with by_id. The target's rows are looked up once, so each call
+        costs O(landmarks). Landmarks the target has no finite distance to
+        or from say nothing about it and are left out.
+        """
+        target_id = target if by_id else self.label_to_id.get(target)
+        if target_id is None:
+            return lambda key: 0.0
+
+        row = self._row
+        forward = self.forward
+        backward = self.backward
+        inf = float('inf')
+        target_forward = row(forward, target_id)
+        from_landmarks = [distance != inf for distance in target_forward]
+
+        if backward is None:
+            def estimate(node: int) -> float:
+                return max(compress(map(abs, map(sub, target_forward, row(forward, node))), from_landmarks),
+                           default=0.0)
+        else:
+            target_backward = row(backward, target_id)
+            to_landmarks = [distance != inf for distance in target_backward]
+
+            def estimate(node: int) -> float:
+                return max(0.0,
+                           max(compress(map(sub, target_forward, row(forward, node)), from_landmarks), default=0.0),
+                           max(compress(map(sub, row(backward, node), target_backward), to_landmarks), default=0.0))
+
+        if by_id:
+            return estimate
+        ids = self.label_to_id
+
+        def estimate_label(label: str) -> float:
+            node_id = ids.get(label)
+            return estimate(node_id) if node_id is not None else 0.0
+        return estimate_label
+
+    def save(self, path: str):
+        encoded, label_offsets, label_order = label_sections(self.labels)
+        sections = [array('i', self.landmarks), array('d', self.forward)]
+        if self.backward is not None:
+            sections.append(array('d', self.backward))
+        sections.extend([label_offsets, label_order])
+
+        flags = FLAG_DIRECTED if self.backward is not None else 0
+        with open(path, 'wb') as file:
+            file.write(MAGIC)
+            nodes, edges, weight_total = self.fingerprint
+            file.write(_HEADER.pack(FORMAT_VERSION, flags, nodes, len(self.landmarks), label_offsets[-1],
+                                    edges, weight_total))
+            _pad(file)
+            for section in sections:
+                if sys.byteorder != 'little':
+                    section.byteswap()
+                file.write(section.tobytes())
+                _pad(file)
+            for label in encoded:
+                file.write(label)
+
+    @classmethod
+    def load(cls, path: str) -> 'LandmarkOracle':
+        """Maps a saved oracle read-only; its tables and labels are read straight from the mapping"""
+        if sys.byteorder != 'little':
+            raise ValueError("Landmark oracles can only be mapped on little-endian hosts")
+
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = memoryview(mapping)
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a landmark oracle")
+
+        version, flags, n, count, label_size, edges, weight_total = _HEADER.unpack_from(buffer, len(MAGIC))
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported landmark oracle version {version}, expected {FORMAT_VERSION}")
+
+        position = _aligned(len(MAGIC) + _HEADER.size)
+
+        def section(typecode: str, itemsize: int, count: int) -> memoryview:
+            nonlocal position
+            view = buffer[position:position + itemsize * count].cast(typecode)
+            position = _aligned(position + itemsize * count)
+            return view
+
+        landmarks = section('i', 4, count)
+        forward = section('d', 8, n * count)
+        backward = section('d', 8, n * count) if flags & FLAG_DIRECTED else None
+        labels = LabelTable(section('q', 8, n + 1), section('i', 4, n), buffer[position:position + label_size])
+        return cls(labels, labels, landmarks, forward, backward, (n, edges, weight_total))
+
+    def __repr__(self) -> str:
+        kind = 'directed' if self.backward is not None else 'undirected'
+        return f"LandmarkOracle(nodes={len(self.labels)}, landmarks={len(self.landmarks)}, {kind})"
+
+    def _row(self, table: Sequence[float], node: int) -> Sequence[float]:
+        count = len(self.landmarks)
+        return table[node * count:(node + 1) * count]
+
+    def _ids(self, source: str, target: str) -> Optional[Tuple[int, int]]:
+        ids = []
+        for label in (source, target):
+            node_id = self.label_to_id.get(label)
+            if node_id is None:
+                print(f"Node with the label {label} does not exist in the graph")
+                return None
+            ids.append(node_id)
+        return ids[0], ids[1]
+
+def graph_fingerprint(graph: Graph) -> Fingerprint:
+    if isinstance(graph, CSRGraph):
+        weights = graph.weights
+        return graph.node_count(), graph.edge_count(), \
+            fsum(weights) if weights is not None else float(graph.edge_count())
+    edges = list(chain.from_iterable(map(attrgetter('edges'), graph.nodes.values())))
+    return len(graph.nodes), len(edges), fsum(getattr(edge, 'weight', 1.0) for edge in edges)
+
+def _symmetric(csr: CSRGraph, reverse: CSRGraph) -> bool:
+    """Whether every edge has a reverse edge of the same weight, i.e. the graph is undirected"""
+    if csr.offsets != reverse.offsets:
+        return False
+    weights = csr.weights
+    reverse_weights = reverse.weights
+    for node in range(csr.node_count()):
+        start, end = csr.offsets[node], csr.offsets[node + 1]
+        if weights is None:
+            if sorted(csr.targets[start:end]) != sorted(reverse.targets[start:end]):
+                return False
+        elif sorted(zip(csr.targets[start:end], weights[start:end])) != \
+                sorted(zip(reverse.targets[start:end], reverse_weights[start:end])):
+            return False
+    return True
+
+def _interleave(rows: List[List[float]], n: int) -> array:
+    """Landmark-major rows as one node-major table"""
+    table = array('d', bytes(8 * n * len(rows)))
+    for index, row in enumerate(rows):
+        table[index::len(rows)] = array('d', row)
+    return table
+
+# Transposed adjacency of the graph being processed, set once per worker process
+_worker_adjacency: Tuple[array, array, Optional[array]] = (array('q', [0]), array('i'), None)
+
+def _init_worker(offsets: array, targets: array, weights: Optional[array]):
+    global _worker_adjacency
+    _worker_adjacency = (offsets, targets, weights)
+
+def _distance_row(landmark: int) -> array:
+    """Distance from every node to landmark"""
+    return array('d', _csr_distances(*_worker_adjacency, landmark)[0])
@@ -0,0 +1,87 @@
+from typing import Tuple
+import numpy as np
+from graph import Graph
+from csr_graph import CSRGraph
+
+# Frontier-at-a-time traversals over the CSR arrays. Every step works on a
+# whole BFS level (or every edge) at once, so the per-node Python overhead of
+# bfs() disappears and the work is done by NumPy.
+
+def csr_arrays(graph: Graph) -> Tuple[np.ndarray, np.ndarray]:
+    """Zero-copy NumPy views of a CSR graph's offsets and targets"""
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    offsets = np.frombuffer(csr.offsets, dtype=np.int64)
+    targets = np.frombuffer(csr.targets, dtype=np.int32)
+    return offsets, targets
+
+def bfs_levels(graph: Graph, start_node_label: str) -> np.ndarray:
+    """BFS depth of every node id from the start node, -1 when unreachable"""
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    start = csr.get_id(start_node_label)
+    if start == None:
+        print(f"Node with label {start_node_label} not found")
+        return np.empty(0, dtype=np.int32)
+
+    offsets, targets = csr_arrays(csr)
+    levels = np.full(csr.node_count(), -1, dtype=np.int32)
+    levels[start] = 0
+    frontier = np.array([start], dtype=np.int64)
+    depth = 0
+
+    while frontier.size:
+        depth += 1
+        neighbors = _expand(offsets, targets, frontier)
+        neighbors = neighbors[levels[neighbors] < 0]
+        frontier = np.unique(neighbors)
+        levels[frontier] = depth
+
+    return levels
+
+def connected_components(graph: Graph) -> np.ndarray:
+    """
+    Component id (0..k-1) of every node id, treating edges as undirected.
+    Uses vectorized hook-and-compress: each round hooks every component root
+    onto the smallest root across its edges, then pointer-jumps to the roots.
+    """
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    offsets, targets = csr_arrays(csr)
+    n = csr.node_count()
+
+    sources = np.repeat(np.arange(n, dtype=np.int32), np.diff(offsets))
+    targets = targets.astype(np.int32, copy=False)
+    roots = np.arange(n, dtype=np.int32)
+
+    while True:
+        from_roots = roots[sources]
+        to_roots = roots[targets]
+        differs = from_roots != to_roots
+        if not differs.any():
+            break
+
+        # Keep only the edges that still join two components for the next round
+        sources = sources[differs]
+        targets = targets[differs]
+        low = np.minimum(from_roots[differs], to_roots[differs])
+        high = np.maximum(from_roots[differs], to_roots[differs])
+        np.minimum.at(roots, high, low)
+
+        while True:
+            jumped = roots[roots]
+            if np.array_equal(jumped, roots):
+                break
+            roots = jumped
+
+    _, component_ids = np.unique(roots, return_inverse=True)
+    return component_ids.astype(np.int32)
+
+def _expand(offsets: np.ndarray, targets: np.ndarray, frontier: np.ndarray) -> np.ndarray:
+    """Concatenated neighbor lists of every node in the frontier"""
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=targets.dtype)
+
+    # Edge index k of the i-th frontier node is starts[i] + k; build all of them at once
+    shifts = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return targets[np.arange(total, dtype=np.int64) + shifts]
@@ -0,0 +1,188 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+from graph import Graph
+from csr_graph import CSRGraph
+
+@dataclass
+class MaxFlow:
+    value: float
+    source_side: List[str] = field(default_factory=list)  # The side of a minimum cut that holds the source
+    cut_edges: List[Tuple[str, str]] = field(default_factory=list)
+
+class FlowNetwork:
+    """
+    Residual graph for Dinic's algorithm over CSR arrays. Every stored edge
+    becomes an arc with its weight as capacity (1 for unweighted graphs)
+    paired with a zero-capacity reverse arc, arc a's partner being a ^ 1, so
+    an undirected edge, stored once per direction, can carry its capacity
+    either way.
+
+    Each phase labels nodes by BFS distance from the source and pushes a
+    blocking flow along strictly increasing levels; there are at most n
+    phases. The network can be solved repeatedly for different node pairs,
+    which is what the Gomory-Hu construction needs.
+    """
+    def __init__(self, offsets: Sequence[int], targets: Sequence[int], capacities: Optional[Sequence[float]] = None):
+        n = len(offsets) - 1
+        self.node_count = n
+        self.arcs: List[List[int]] = [[] for _ in range(n)]
+        self.heads: List[int] = []
+        self.capacities: List[float] = []
+
+        for from_node in range(n):
+            for edge in range(offsets[from_node], offsets[from_node + 1]):
+                to_node = targets[edge]
+                if to_node == from_node:
+                    continue
+                arc = len(self.heads)
+                self.arcs[from_node].append(arc)
+                self.arcs[to_node].append(arc + 1)
+                self.heads += (to_node, from_node)
+                self.capacities += (capacities[edge] if capacities is not None else 1, 0)
+
+        self.original_capacities = list(self.capacities)
+
+    def max_flow(self, source: int, sink: int) -> Tuple[float, bytearray]:
+        """Flow value and a mask of the nodes on the source side of a minimum cut"""
+        if source == sink:
+            raise ValueError("Source and sink must be different nodes")
+
+        self.capacities[:] = self.original_capacities
+        arcs = self.arcs
+        heads = self.heads
+        capacity = self.capacities
+        total = 0
+
+        while True:
+            level = self._levels(source)
+            if level[sink] < 0:
+                return total, bytearray(1 if node_level >= 0 else 0 for node_level in level)
+
+            # Current-arc pointers: an arc that cannot push is never looked at again this phase
+            next_arc = [0] * self.node_count
+            path: List[int] = []
+            node = source
+            while True:
+                if node == sink:
+                    pushed = min(capacity[arc] for arc in path)
+                    total += pushed
+                    for arc in path:
+                        capacity[arc] -= pushed
+                        capacity[arc ^ 1] += pushed
+                    # Resume from the tail of the first arc that filled up
+                    saturated = next(index for index, arc in enumerate(path) if capacity[arc] == 0)
+                    del path[saturated:]
+                    node = heads[path[-1]] if path else source
+                    continue
+
+                node_arcs = arcs[node]
+                index = next_arc[node]
+                next_level = level[node] + 1
+                while index < len(node_arcs):
+                    arc = node_arcs[index]
+                    if capacity[arc] > 0 and level[heads[arc]] == next_level:
+                        break
+                    index += 1
+                next_arc[node] = index
+
+                if index < len(node_arcs):
+                    path.append(node_arcs[index])
+                    node = heads[node_arcs[index]]
+                elif node == source:
+                    break
+                else:
+                    # Dead end: drop it from the level graph and retreat
+                    level[node] = -1
+                    arc = path.pop()
+                    node = heads[arc ^ 1]
+                    next_arc[node] += 1
+
+    def _levels(self, source: int) -> List[int]:
+        arcs = self.arcs
+        heads = self.heads
+        capacity = self.capacities
+        level = [-1] * self.node_count
+        level[source] = 0
+        queue = [source]
+        for node in queue:
+            next_level = level[node] + 1
+            for arc in arcs[node]:
+                if capacity[arc] > 0 and level[heads[arc]] < 0:
+                    level[heads[arc]] = next_level
+                    queue.append(heads[arc])
+        return level
+
+class GomoryHuTree:
+    """
+    All-pairs minimum cuts of an undirected graph from n - 1 max-flow runs
+    (Gusfield's construction): the minimum cut between any two nodes is the
+    smallest capacity on the tree path between them. A query walks that path
+    instead of solving a flow.
+    """
+    def __init__(self, labels: Sequence[str], network: FlowNetwork):
+        n = network.node_count
+        self.labels = labels
+        self.label_to_id = {label: i for i, label in enumerate(labels)}
+        self.parent = array('i', bytes(4 * n))
+        self.capacity: List[float] = [0] * n
+
+        for node in range(1, n):
+            value, source_side = network.max_flow(node, self.parent[node])
+            self.capacity[node] = value
+            for other in range(node + 1, n):
+                if source_side[other] and self.parent[other] == self.parent[node]:
+                    self.parent[other] = node
+
+        # Every parent has a smaller id, so depths fill in one pass
+        self.depth = array('i', bytes(4 * n))
+        for node in range(1, n):
+            self.depth[node] = self.depth[self.parent[node]] + 1
+
+    def min_cut(self, from_label: str, to_label: str) -> float:
+        for label in (from_label, to_label):
+            if label not in self.label_to_id:
+                print(f"Node with the label {label} does not exist in the graph")
+                return 0
+
+        a = self.label_to_id[from_label]
+        b = self.label_to_id[to_label]
+        if a == b:
+            return float('inf')
+
+        parent = self.parent
+        depth = self.depth
+        capacity = self.capacity
+        result = float('inf')
+        while a != b:
+            if depth[a] < depth[b]:
+                a, b = b, a
+            result = min(result, capacity[a])
+            a = parent[a]
+        return result
+
+    def edges(self) -> List[Tuple[str, str, float]]:
+        return [(self.labels[node], self.labels[self.parent[node]], self.capacity[node])
+                for node in range(1, len(self.labels))]
+
+def max_flow(graph: Graph, source: str, sink: str) -> MaxFlow:
+    """Maximum flow from source to sink with edge weights as capacities"""
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    for label in (source, sink):
+        if csr.get_id(label) is None:
+            print(f"Node with the label {label} does not exist in the graph")
+            return MaxFlow(0)
+
+    network = FlowNetwork(csr.offsets, csr.targets, csr.weights)
+    value, source_side = network.max_flow(csr.get_id(source), csr.get_id(sink))
+
+    labels = csr.labels
+    cut_edges = [(labels[from_node], labels[to_node])
+                 for from_node in range(csr.node_count()) if source_side[from_node]
+                 for to_node in csr.neighbors(from_node) if not source_side[to_node]]
+    return MaxFlow(value, [labels[node] for node in range(len(labels)) if source_side[node]], cut_edges)
+
+def gomory_hu_tree(graph: Graph) -> GomoryHuTree:
+    """Minimum cuts between every pair of nodes of an undirected graph, with edge weights as capacities"""
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    return GomoryHuTree(csr.labels, FlowNetwork(csr.offsets, csr.targets, csr.weights))
@@ -1,7 +1,3 @@
-from enum import Enum
-
-
-class NodeState(Enum):
-    NOT_STARTED = 'Not Started'
-    VISITING = 'Visiting'
-    VISITED = 'Visited'
\ No newline at end of file
+# The graph classes and the algorithms share one NodeState so that state
+# dicts can be handed to the traversal core in traversal.py
+from graph import NodeState
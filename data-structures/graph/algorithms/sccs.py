@@ -1,34 +1,61 @@
+from dataclasses import dataclass
 from graph import Graph, Node
-from typing import List, Dict
+from csr_graph import CSRGraph
+from typing import List, Dict, Set, Tuple
 from algorithms.node_state import NodeState
+from traversal import depth_first, ENTER, EDGE, EXIT
+from algorithms.instrumentation import collect, report, edge_total
 
-def find_scss(graph: Graph) -> List[List[str]]:
-    finish_order = _find_finish_order(graph)
-    transpose_graph = graph.create_transpose()
-    return _find_sccs_in_transpose(transpose_graph, finish_order)
+@dataclass
+class Condensation:
+    components: List[List[str]]  # In topological order of the condensation DAG
+    component_of: Dict[str, int]
+    edges: List[List[int]]       # DAG adjacency between component indices
+
+def find_scss(graph: Graph, method: str = 'kosaraju') -> List[List[str]]:
+    if method not in ('kosaraju', 'tarjan'):
+        raise ValueError(f"Unknown SCC method '{method}', expected 'kosaraju' or 'tarjan'")
+    
+    stats = collect('find_scss')
+    
+    if method == 'tarjan':
+        components = _tarjan(graph)[0]
+        passes = 1
+    elif isinstance(graph, CSRGraph):
+        components = _find_scss_csr(graph)
+        passes = 2
+    else:
+        finish_order = _find_finish_order(graph)
+        if stats is not None:
+            stats.lap('finish_order')
+        transpose_graph = graph.create_transpose()
+        if stats is not None:
+            stats.lap('transpose')
+        components = _find_sccs_in_transpose(transpose_graph, finish_order)
+        passes = 2
+        
+    if stats is not None:
+        stats.lap('components')
+        # Each pass visits every node and scans every edge, once forwards and once transposed
+        stats.nodes_visited = passes * sum(map(len, components))
+        stats.edges_scanned = passes * edge_total(graph)
+        report(stats)
+    return components
             
 def _find_finish_order(graph: Graph) -> List[Node]:
     result: List[Node] = []
     nodes = graph.get_nodes()
     
-    node_states: Dict[Node, NodeState] = {}
-    nodes = graph.get_nodes()
-    
-    for node in nodes:
-        node_states[node] = NodeState.NOT_STARTED
+    node_states: Dict[str, NodeState] = dict.fromkeys(graph.nodes, NodeState.NOT_STARTED)
     
     for node in nodes:
-        if node_states[node] == NodeState.NOT_STARTED:
+        if node_states[node.label] == NodeState.NOT_STARTED:
             _record_finish_order(node, node_states,  result)
             
     return result
 
 def _find_sccs_in_transpose(graph: Graph, order: List[Node]) -> List[List[str]]:
-    node_states: Dict[Node, NodeState] = {}
-    nodes = graph.get_nodes()
-    
-    for node in nodes:
-        node_states[node] = NodeState.NOT_STARTED
+    node_states: Dict[str, NodeState] = dict.fromkeys(graph.nodes, NodeState.NOT_STARTED)
     
     result: List[List[str]] = []
     scc: List[str] = []
@@ -36,30 +63,216 @@ def _find_sccs_in_transpose(graph: Graph, order: List[Node]) -> List[List[str]]:
     for node in reversed(order):
        scc = []
        transpose_node = graph.nodes[node.label]
-       if node_states[transpose_node] == NodeState.NOT_STARTED:
-           _dfs_rec(transpose_node, node_states, scc)
+       if node_states[transpose_node.label] == NodeState.NOT_STARTED:
+           _dfs_iter(transpose_node, node_states, scc)
            result.append(scc)
            
     return result 
 
-def _dfs_rec(node: Node, node_states: Dict[Node, NodeState], order: List[Node]):
-    node_states[node] = NodeState.VISITING
-    order.append(node.label)
+def _dfs_iter(node: Node, node_states: Dict[str, NodeState], order: List[str]):
+    for event, visited_node, _ in depth_first(node, node_states):
+        if event == ENTER:
+            order.append(visited_node.label)
+
+def _record_finish_order(node: Node, node_states: Dict[str, NodeState], order: List[Node]):
+    for event, finished_node, _ in depth_first(node, node_states):
+        if event == EXIT:
+            order.append(finished_node)
+
+def _find_scss_csr(graph: CSRGraph) -> List[List[str]]:
+    n = graph.node_count()
+    offsets = graph.offsets
+    targets = graph.targets
+    visited = bytearray(n)
+    finish_order: List[int] = []
+    
+    for root in range(n):
+        if visited[root]:
+            continue
+        
+        visited[root] = 1
+        path = [root]
+        stack = [iter(targets[offsets[root]:offsets[root + 1]])]
+        
+        while stack:
+            for to_node in stack[-1]:
+                if not visited[to_node]:
+                    visited[to_node] = 1
+                    path.append(to_node)
+                    stack.append(iter(targets[offsets[to_node]:offsets[to_node + 1]]))
+                    break
+            else:
+                stack.pop()
+                finish_order.append(path.pop())
+    
+    transpose = graph.transpose()
+    offsets = transpose.offsets
+    targets = transpose.targets
+    visited = bytearray(n)
+    labels = graph.labels
+    result: List[List[str]] = []
+    
+    for root in reversed(finish_order):
+        if visited[root]:
+            continue
+        
+        visited[root] = 1
+        scc: List[str] = [labels[root]]
+        stack = [iter(targets[offsets[root]:offsets[root + 1]])]
+        
+        while stack:
+            for to_node in stack[-1]:
+                if not visited[to_node]:
+                    visited[to_node] = 1
+                    scc.append(labels[to_node])
+                    stack.append(iter(targets[offsets[to_node]:offsets[to_node + 1]]))
+                    break
+            else:
+                stack.pop()
+        
+        result.append(scc)
+        
+    return result
+
+def find_condensation(graph: Graph) -> Condensation:
+    stats = collect('find_condensation')
+    components, component_of = _tarjan(graph)
+    if stats is not None:
+        stats.lap('components')
+    edges: List[Set[int]] = [set() for _ in components]
     
-    for edge in node.get_edges():
-        to_node = edge.to_node
-        if node_states[to_node] == NodeState.NOT_STARTED:
-            _dfs_rec(to_node, node_states, order)
+    if isinstance(graph, CSRGraph):
+        labels = graph.labels
+        component_ids = [component_of[label] for label in labels]
+        targets = graph.targets
+        offsets = graph.offsets
+        for node_id in range(graph.node_count()):
+            from_component = component_ids[node_id]
+            for to_node in targets[offsets[node_id]:offsets[node_id + 1]]:
+                if component_ids[to_node] != from_component:
+                    edges[from_component].add(component_ids[to_node])
+    else:
+        for node in graph.get_nodes():
+            from_component = component_of[node.label]
+            for edge in node.get_edges():
+                to_component = component_of[edge.to_node.label]
+                if to_component != from_component:
+                    edges[from_component].add(to_component)
+                    
+    if stats is not None:
+        stats.lap('dag_edges')
+        # Tarjan and the DAG edge pass each scan every edge once
+        stats.nodes_visited = len(component_of)
+        stats.edges_scanned = 2 * edge_total(graph)
+        report(stats)
+    return Condensation(components, component_of, [sorted(component_edges) for component_edges in edges])
+
+def _tarjan(graph: Graph) -> Tuple[List[List[str]], Dict[str, int]]:
+    """
+    Single-pass Tarjan SCC. Components come out sinks first, so they are
+    reversed before returning to match the source-first order of Kosaraju.
+    """
+    if isinstance(graph, CSRGraph):
+        components = _tarjan_csr(graph)
+    else:
+        components = _tarjan_nodes(graph)
+        
+    components.reverse()
+    component_of: Dict[str, int] = {}
+    for component_id, component in enumerate(components):
+        for label in component:
+            component_of[label] = component_id
+            
+    return components, component_of
+
+def _tarjan_nodes(graph: Graph) -> List[List[str]]:
+    node_states: Dict[str, NodeState] = dict.fromkeys(graph.nodes, NodeState.NOT_STARTED)
+    index: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    assigned: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
     
-    node_states[node] = NodeState.VISITED
+    for root in graph.get_nodes():
+        if node_states[root.label] != NodeState.NOT_STARTED:
+            continue
+        
+        for event, node, other in depth_first(root, node_states, report_edges=True):
+            label = node.label
+            if event == ENTER:
+                index[label] = low[label] = len(index)
+                stack.append(label)
+            elif event == EDGE:
+                # Discovered nodes not yet assigned to a component are still on the stack
+                if other.label not in assigned and index[other.label] < low[label]:
+                    low[label] = index[other.label]
+            else:
+                if low[label] == index[label]:
+                    component: List[str] = []
+                    while True:
+                        member = stack.pop()
+                        assigned.add(member)
+                        component.append(member)
+                        if member == label:
+                            break
+                    components.append(component)
+                    
+                if other is not None and low[label] < low[other.label]:
+                    low[other.label] = low[label]
+                    
+    return components
 
-def _record_finish_order(node: Node, node_states: Dict[Node, NodeState], order: List[Node]):
-    node_states[node] = NodeState.VISITING
+def _tarjan_csr(graph: CSRGraph) -> List[List[str]]:
+    n = graph.node_count()
+    offsets = graph.offsets
+    targets = graph.targets
+    labels = graph.labels
     
-    for edge in node.get_edges():
-        to_node = edge.to_node
-        if node_states[to_node] == NodeState.NOT_STARTED:
-            _record_finish_order(to_node, node_states, order)
+    index = [-1] * n
+    low = [0] * n
+    assigned = bytearray(n)
+    stack: List[int] = []
+    components: List[List[str]] = []
+    counter = 0
     
-    order.append(node)
-    node_states[node] = NodeState.VISITED
\ No newline at end of file
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        path = [root]
+        iterators = [iter(targets[offsets[root]:offsets[root + 1]])]
+        
+        while iterators:
+            node = path[-1]
+            for to_node in iterators[-1]:
+                if index[to_node] < 0:
+                    index[to_node] = low[to_node] = counter
+                    counter += 1
+                    stack.append(to_node)
+                    path.append(to_node)
+                    iterators.append(iter(targets[offsets[to_node]:offsets[to_node + 1]]))
+                    break
+                
+                if not assigned[to_node] and index[to_node] < low[node]:
+                    low[node] = index[to_node]
+            else:
+                iterators.pop()
+                path.pop()
+                
+                if low[node] == index[node]:
+                    component: List[str] = []
+                    while True:
+                        member = stack.pop()
+                        assigned[member] = 1
+                        component.append(labels[member])
+                        if member == node:
+                            break
+                    components.append(component)
+                    
+                if path and low[node] < low[path[-1]]:
+                    low[path[-1]] = low[node]
+                    
+    return components
@@ -1,32 +1,42 @@
 from graph import Graph, Node
 from typing import List, Dict
 from algorithms.node_state import NodeState
+from traversal import depth_first, EXIT
+from algorithms.instrumentation import collect, report, edge_total
     
 
 def topological_sort(graph: Graph) -> List[Node]:
+    stats = collect('topological_sort')
     order: List[Node] = []    
-    node_states: Dict[Node, NodeState] = {}
     nodes = graph.get_nodes()
     
-    if graph.detect_cycle() == True:
+    has_cycle = graph.detect_cycle() == True
+    if stats is not None:
+        stats.lap('cycle_check')
+        
+    if has_cycle:
         print("Provided graph has a cycle, can't run topological sort")
+        if stats is not None:
+            report(stats)
         return order
     
-    for node in nodes:
-        node_states[node] = NodeState.NOT_STARTED
+    node_states: Dict[str, NodeState] = dict.fromkeys(graph.nodes, NodeState.NOT_STARTED)
+    if stats is not None:
+        stats.lap('node_states')
         
     for node in nodes:
-        if node_states[node] == NodeState.NOT_STARTED:
+        if node_states[node.label] == NodeState.NOT_STARTED:
             _topological_sort(node, node_states, order)
-                
+            
+    if stats is not None:
+        stats.lap('search')
+        stats.nodes_visited = len(order)
+        # The sort's own pass; the cycle check's work shows up in its phase time
+        stats.edges_scanned = edge_total(graph)
+        report(stats)
     return order
         
-def _topological_sort(node: Node, node_states: Dict[Node, NodeState], order: List[Node]):
-    node_states[node] = NodeState.VISITING
-    
-    for edge in node.get_edges():
-        if node_states[edge.to_node] == NodeState.NOT_STARTED:
-            _topological_sort(edge.to_node, node_states, order)
-            
-    order.append(node)
-    node_states[node] = NodeState.VISITED
\ No newline at end of file
+def _topological_sort(node: Node, node_states: Dict[str, NodeState], order: List[Node]):
+    for event, finished_node, _ in depth_first(node, node_states):
+        if event == EXIT:
+            order.append(finished_node)
@@ -0,0 +1,157 @@
+"""
+Timings for the graph algorithms on synthetic Erdos-Renyi, grid, power-law
+and deep-chain graphs: every entry point exported from algorithms, plus
+dijkstra, kruskal and find_articulation_points. Each result records the best
+of --repeat runs, nodes/sec, edges/sec and the peak memory the call
+allocated, from a separate tracemalloc run so tracing does not skew the
+timings. Run from any directory:
+
+    python benchmark_graphs.py [--nodes N] [--families NAME ...] [--repeat R]
+                               [--output results.json] [--compare baseline.json]
+
+--output writes the results as JSON; --compare prints each timing against an
+earlier results file, so a regression shows up as a ratio above 1.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from graph import Graph
+from undirected_graph import UndirectedGraph
+from directed_graph import DirectedGraph
+from weighted_graph import WeightedGraph
+from algorithms import dfs, bfs, topological_sort, find_scss, find_condensation, find_bridges
+from algorithms.articulation_points import find_articulation_points
+from algorithms.dijkstra import dijkstra
+from algorithms.kruskal import kruskal
+from graph_generators import GENERATORS, EdgeList
+
+# (name, kind of graph it runs on, call). Directed graphs are DAGs because the
+# generators orient every edge from the smaller id to the larger.
+BENCHMARKS: List[Tuple[str, str, Callable[[Graph, str], object]]] = [
+    ('dfs', 'undirected', lambda graph, source: dfs(graph)),
+    ('bfs', 'undirected', bfs),
+    ('topological_sort', 'directed', lambda graph, source: topological_sort(graph)),
+    ('find_scss', 'directed', lambda graph, source: find_scss(graph)),
+    ('find_condensation', 'directed', lambda graph, source: find_condensation(graph)),
+    ('find_bridges', 'undirected', lambda graph, source: find_bridges(graph)),
+    ('find_articulation_points', 'undirected', lambda graph, source: find_articulation_points(graph)),
+    ('dijkstra', 'weighted', dijkstra),
+    ('kruskal', 'weighted', lambda graph, source: kruskal(graph)),
+]
+
+GRAPH_TYPES = {
+    'undirected': UndirectedGraph,
+    'directed': DirectedGraph,
+    'weighted': WeightedGraph,
+}
+
+def measure(function: Callable, args: Tuple, repeat: int, trace_memory: bool) -> Tuple[float, Optional[int]]:
+    """Best wall time over repeat calls, and the peak bytes traced during one more call"""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function(*args)
+        best = min(best, time.perf_counter() - start)
+
+    peak = None
+    if trace_memory:
+        gc.collect()
+        tracemalloc.start()
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return best, peak
+
+def result(family: str, algorithm: str, nodes: int, edges: int, seconds: float, peak: Optional[int]) -> Dict:
+    return {
+        'family': family,
+        'algorithm': algorithm,
+        'nodes': nodes,
+        'edges': edges,
+        'seconds': seconds,
+        'nodes_per_second': nodes / seconds if seconds else None,
+        'edges_per_second': edges / seconds if seconds else None,
+        'peak_memory_bytes': peak,
+    }
+
+def run_family(family: str, edges: EdgeList, repeat: int, trace_memory: bool) -> List[Dict]:
+    results: List[Dict] = []
+    graphs: Dict[str, Graph] = {}
+    for kind, graph_type in GRAPH_TYPES.items():
+        seconds, peak = measure(graph_type.from_edge_list, (edges,), repeat, trace_memory)
+        graphs[kind] = graph_type.from_edge_list(edges)
+        results.append(result(family, f"build {graph_type.__name__}", len(graphs[kind].nodes), len(edges),
+                              seconds, peak))
+
+    source = edges[0][0]
+    for name, kind, function in BENCHMARKS:
+        graph = graphs[kind]
+        seconds, peak = measure(function, (graph, source), repeat, trace_memory)
+        results.append(result(family, name, len(graph.nodes), len(edges), seconds, peak))
+    return results
+
+def print_results(results: List[Dict], baseline: Optional[Dict[Tuple[str, str], Dict]] = None):
+    family = None
+    for row in results:
+        if row['family'] != family:
+            family = row['family']
+            print(f"\n{family}: {row['nodes']} nodes, {row['edges']} edges")
+        peak = row['peak_memory_bytes']
+        memory = f"{peak / 2 ** 20:8.1f} MiB" if peak is not None else ""
+        line = (f"  {row['algorithm']:28} {row['seconds']:8.3f}s {row['nodes_per_second']:12,.0f} nodes/s "
+                f"{row['edges_per_second']:12,.0f} edges/s {memory}")
+
+        previous = (baseline or {}).get((row['family'], row['algorithm']))
+        if previous is not None and previous['seconds']:
+            line += f"   x{row['seconds'] / previous['seconds']:.2f} vs baseline"
+        print(line)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the graph algorithms on synthetic graphs")
+    parser.add_argument('--nodes', type=int, default=20_000, help="approximate node count of each graph")
+    parser.add_argument('--families', nargs='+', choices=list(GENERATORS), default=list(GENERATORS))
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per algorithm, the best is kept")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc run")
+    parser.add_argument('--output', help="write the results to this JSON file")
+    parser.add_argument('--compare', help="JSON file from an earlier run to compare timings against")
+    args = parser.parse_args()
+
+    if args.nodes < 3:
+        raise ValueError(f"Node count must be at least 3, got {args.nodes}")
+    if args.repeat < 1:
+        raise ValueError(f"Repeat count must be positive, got {args.repeat}")
+
+    results: List[Dict] = []
+    for family in args.families:
+        edges = GENERATORS[family](args.nodes, seed=args.seed)
+        results += run_family(family, edges, args.repeat, not args.no_memory)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = {(row['family'], row['algorithm']): row for row in json.load(file)['results']}
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'nodes': args.nodes,
+            'repeat': args.repeat,
+            'seed': args.seed,
+            'results': results,
+        }
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2, sort_keys=True)
+            file.write('\n')
+        print(f"\nWrote {len(results)} results to {args.output}")
@@ -0,0 +1,128 @@
+from array import array
+from typing import Dict, List, Mapping, Optional, Sequence
+from graph import Graph, WeightedEdge
+
+class CSRGraph:
+    """
+    Frozen compressed-sparse-row view of a graph.
+
+    Node i's outgoing edges are targets[offsets[i]:offsets[i + 1]] and, for
+    weighted graphs, weights[offsets[i]:offsets[i + 1]]. Edges keep the order
+    of the source graph's adjacency lists, so traversals visit nodes in the
+    same order as on the object graph.
+    """
+    __slots__ = ('labels', 'label_to_id', 'offsets', 'targets', 'weights', '_integer_weights')
+
+    def __init__(self, labels: Sequence[str], offsets: array, targets: array, weights: Optional[array] = None,
+                 label_to_id: Optional[Mapping[str, int]] = None):
+        self.labels = labels
+        if label_to_id is None:
+            label_to_id = {label: i for i, label in enumerate(labels)}
+        self.label_to_id: Mapping[str, int] = label_to_id
+        self.offsets = memoryview(offsets).toreadonly()
+        self.targets = memoryview(targets).toreadonly()
+        self.weights = memoryview(weights).toreadonly() if weights is not None else None
+        self._integer_weights: Optional[bool] = None
+
+    @classmethod
+    def from_graph(cls, graph: Graph) -> 'CSRGraph':
+        labels: List[str] = []
+        node_to_id: Dict = {}
+        for i, node in enumerate(graph.get_nodes()):
+            labels.append(node.label)
+            node_to_id[node] = i
+
+        offsets = array('q', [0])
+        targets = array('i')
+        # Only created at the first weighted edge, so unweighted graphs never pay for it
+        weights: Optional[array] = None
+
+        for node in graph.get_nodes():
+            for edge in node.get_edges():
+                if isinstance(edge, WeightedEdge):
+                    if weights is None:
+                        weights = array('d', [1.0]) * len(targets)
+                    weights.append(edge.weight)
+                elif weights is not None:
+                    weights.append(1.0)
+                targets.append(node_to_id[edge.to_node])
+            offsets.append(len(targets))
+
+        return cls(labels, offsets, targets, weights)
+
+    def node_count(self) -> int:
+        return len(self.labels)
+
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def get_id(self, label: str) -> Optional[int]:
+        return self.label_to_id.get(label, None)
+
+    def get_label(self, node_id: int) -> str:
+        return self.labels[node_id]
+
+    def neighbors(self, node_id: int) -> memoryview:
+        return self.targets[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def edge_weights(self, node_id: int) -> memoryview:
+        if self.weights is None:
+            return memoryview(array('d', [1.0]) * (self.offsets[node_id + 1] - self.offsets[node_id]))
+        return self.weights[self.offsets[node_id]:self.offsets[node_id + 1]]
+
+    def has_integer_weights(self) -> bool:
+        """Whether every weight is a non-negative integer; worked out once, as the graph is frozen"""
+        if self._integer_weights is None:
+            weights = self.weights
+            self._integer_weights = weights is None or (min(weights, default=0) >= 0
+                                                        and all(map(float.is_integer, weights)))
+        return self._integer_weights
+
+    def sources(self) -> array:
+        """Source node id of every edge, aligned with targets"""
+        result = array('i')
+        offsets = self.offsets
+        for node_id in range(len(self.labels)):
+            result.extend([node_id] * (offsets[node_id + 1] - offsets[node_id]))
+        return result
+
+    def transpose(self) -> 'CSRGraph':
+        n = len(self.labels)
+        counts = array('q', [0]) * (n + 1)
+        for target in self.targets:
+            counts[target + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+
+        # Counting sort: each reversed edge goes to the next free slot of its new
+        # source, and walking the edges in order keeps them stable within a row
+        offsets = self.offsets
+        next_slot = counts[:-1]
+        targets = array('i', [0]) * len(self.targets)
+        weights = None
+        if self.weights is None:
+            for source in range(n):
+                for target in self.targets[offsets[source]:offsets[source + 1]]:
+                    slot = next_slot[target]
+                    next_slot[target] = slot + 1
+                    targets[slot] = source
+        else:
+            weights = array('d', [0.0]) * len(self.targets)
+            for source in range(n):
+                start, end = offsets[source], offsets[source + 1]
+                for target, weight in zip(self.targets[start:end], self.weights[start:end]):
+                    slot = next_slot[target]
+                    next_slot[target] = slot + 1
+                    targets[slot] = source
+                    weights[slot] = weight
+
+        return CSRGraph(self.labels, counts, targets, weights, self.label_to_id)
+
+    def nbytes(self) -> int:
+        size = self.offsets.nbytes + self.targets.nbytes
+        if self.weights is not None:
+            size += self.weights.nbytes
+        return size
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(nodes={self.node_count()}, edges={self.edge_count()})"
@@ -1,7 +1,8 @@
 from typing import List
 from collections import deque
-from typing import List, Deque
+from typing import List, Deque, Dict
 from graph import Graph, Node, Edge, NodeState
+from traversal import depth_first, EDGE
 
 class DirectedGraph(Graph):
         
@@ -9,6 +10,7 @@ class DirectedGraph(Graph):
         node = Node(label)
         self.node_states[node] = NodeState.NOT_STARTED
         self.nodes[label] = node
+        self.version += 1
         
     def add_edge(self, from_node_label: str, to_node_label: str):
         from_node = self.nodes.get(from_node_label, None)
@@ -23,30 +25,27 @@ class DirectedGraph(Graph):
             return
         
         from_node.add_edge(Edge(to_node))
+        self.version += 1
+        
+    def _link(self, from_node: Node, to_node: Node, weight: float):
+        from_node.edges.append(Edge(to_node))
         
     def detect_cycle(self) -> bool:
-        self.reset_node_state()
+        node_states: Dict[str, NodeState] = dict.fromkeys(self.nodes, NodeState.NOT_STARTED)
         
         for node in self.nodes.values():
-            if self.node_states[node] == NodeState.NOT_STARTED:
-                if self._is_cycle_present(node):
+            if node_states[node.label] == NodeState.NOT_STARTED:
+                if self._is_cycle_present(node, node_states):
                     return True
                 
         return False
     
-    def _is_cycle_present(self, node: Node):
-        self.node_states[node] = NodeState.VISITING
-        
-        for edge in node.get_edges():
-            to_node = edge.to_node
-            if self.node_states[to_node] == NodeState.VISITING:
+    def _is_cycle_present(self, node: Node, node_states: Dict[str, NodeState]):
+        for event, _, to_node in depth_first(node, node_states, report_edges=True):
+            # An edge back to a node still on the DFS path closes a cycle
+            if event == EDGE and node_states[to_node.label] == NodeState.VISITING:
                 return True
-            
-            if self.node_states[to_node] == NodeState.NOT_STARTED and self._is_cycle_present(to_node):
-                return True
-            
         
-        self.node_states[node] = NodeState.VISITED
         return False
     
     def create_transpose(self) -> 'Graph':
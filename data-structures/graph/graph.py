@@ -1,6 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+import gc
+import sys
+from typing import Any, Callable, Iterable, List, Dict, Optional, Sequence
 from enum import Enum
+from result_cache import ResultCache
 
 class NodeState(Enum):
     NOT_STARTED = 'Not Started'
@@ -43,14 +46,22 @@ class WeightedEdge(Edge):
         self.weight = weight
         self.from_node = from_node
 
+class MissingNodesError(ValueError):
+    def __init__(self, labels: List[str]):
+        super().__init__(f"{len(labels)} node label(s) not found in the graph: {labels[:10]}")
+        self.labels = labels
+
 class Graph(ABC):
     def __init__(self):
         self.nodes: Dict[str, Node] = {}
         self.node_states: Dict[Node, NodeState] = {}
+        self.version = 0 # Bumped by every add_node / add_edge
+        self.result_cache = ResultCache()
     
     def add_node(self, label: str):
         node = Node(label)
         self.nodes[label] = node    
+        self.version += 1
     
     def get_nodes(self) -> List[Node]:
         return self.nodes.values()
@@ -70,6 +81,85 @@ class Graph(ABC):
     def create_transpose(self) -> 'Graph':
         pass
 
+    @classmethod
+    def from_edge_list(cls, edges: Iterable[Sequence], **kwargs) -> 'Graph':
+        graph = cls()
+        graph.add_edges_from(edges, **kwargs)
+        return graph
+
+    def add_edges_from(self, edges: Iterable[Sequence], create_nodes: bool = True):
+        """
+        Bulk add_edge for (from_label, to_label) rows; NumPy arrays are accepted
+        too, and their numbers become labels like "0". Missing nodes are
+        created, or reported together in one MissingNodesError before anything
+        is added when create_nodes is False.
+        """
+        self._add_edges(edges, None, create_nodes, self._link)
+
+    @abstractmethod
+    def _link(self, from_node: Node, to_node: Node, weight: float):
+        pass
+
+    def _add_edges(self, edges: Iterable[Sequence], weights: Optional[Iterable[float]], create_nodes: bool,
+                   link: Callable[[Node, Node, float], None]):
+        rows = edges.tolist() if hasattr(edges, 'tolist') else list(edges)
+        if weights is not None:
+            weights = weights.tolist() if hasattr(weights, 'tolist') else list(weights)
+        nodes = self.nodes
+        # Each distinct label is converted to str once, and rows repeating it share one string
+        labels: Dict[Any, str] = {}
+
+        def label_of(value: Any) -> str:
+            label = labels.get(value, None)
+            if label is None:
+                if isinstance(value, float) and value.is_integer():
+                    value_label = str(int(value))
+                else:
+                    value_label = str(value)
+                label = labels[value] = sys.intern(value_label)
+            return label
+
+        if not create_nodes:
+            missing: Dict[str, None] = {}
+            for row in rows:
+                for label in (label_of(row[0]), label_of(row[1])):
+                    if label not in nodes:
+                        missing[label] = None
+            if missing:
+                raise MissingNodesError(list(missing))
+
+        # Every Node and Edge created here lives as long as the graph, so cyclic
+        # GC passes over them during the load are wasted work
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for index, row in enumerate(rows):
+                from_label, to_label = label_of(row[0]), label_of(row[1])
+                from_node = nodes.get(from_label, None)
+                if from_node is None:
+                    self.add_node(from_label)
+                    from_node = nodes[from_label]
+                to_node = nodes.get(to_label, None)
+                if to_node is None:
+                    self.add_node(to_label)
+                    to_node = nodes[to_label]
+
+                if weights is not None:
+                    weight = weights[index]
+                else:
+                    weight = row[2] if len(row) > 2 else 1.0
+                link(from_node, to_node, weight)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        if rows:
+            self.version += 1
+
+    def cached(self, algorithm: Callable, *args, **kwargs) -> Any:
+        """Run algorithm(self, *args, **kwargs), reusing the result until the graph changes"""
+        return self.result_cache.get(self, algorithm, *args, **kwargs)
+
     def reset_node_state(self):
         for node in self.nodes.values():
             self.node_states[node] = NodeState.NOT_STARTED
\ No newline at end of file
@@ -0,0 +1,69 @@
+from random import Random
+from typing import List, Optional, Set, Tuple
+
+# (from_label, to_label, weight) rows, as accepted by Graph.from_edge_list.
+# Nodes are labelled '0' .. 'n-1' and every edge runs from the smaller id to
+# the larger, so loading the rows into a DirectedGraph gives a DAG.
+EdgeList = List[Tuple[str, str, int]]
+
+def erdos_renyi(n: int, average_degree: float = 4, seed: Optional[int] = None) -> EdgeList:
+    """G(n, m) random graph with n * average_degree / 2 distinct links and no self-loops"""
+    if n < 2:
+        raise ValueError(f"Need at least 2 nodes, got {n}")
+
+    m = min(int(n * average_degree / 2), n * (n - 1) // 2)
+    random = Random(seed)
+    pairs: Set[Tuple[int, int]] = set()
+    while len(pairs) < m:
+        a, b = random.randrange(n), random.randrange(n)
+        if a != b:
+            pairs.add((min(a, b), max(a, b)))
+    return [(str(a), str(b), random.randint(1, 100)) for a, b in sorted(pairs)]
+
+def grid(n: int, seed: Optional[int] = None) -> EdgeList:
+    """Square lattice of about n nodes, each linked to its right and lower neighbours"""
+    side = max(int(n ** 0.5), 1)
+    random = Random(seed)
+    edges: EdgeList = []
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side:
+                edges.append((str(node), str(node + 1), random.randint(1, 100)))
+            if row + 1 < side:
+                edges.append((str(node), str(node + side), random.randint(1, 100)))
+    return edges
+
+def power_law(n: int, edges_per_node: int = 2, seed: Optional[int] = None) -> EdgeList:
+    """
+    Barabasi-Albert preferential attachment: each new node links to
+    edges_per_node earlier nodes picked in proportion to their degree, which
+    gives a few hubs and a long tail of low-degree nodes.
+    """
+    if edges_per_node < 1 or n <= edges_per_node:
+        raise ValueError(f"Need edges_per_node >= 1 and more than {edges_per_node} nodes, got {n}")
+
+    random = Random(seed)
+    # Every node appears once per link it has, so a uniform pick is degree-weighted
+    endpoints: List[int] = list(range(edges_per_node))
+    edges: EdgeList = []
+    for node in range(edges_per_node, n):
+        chosen: Set[int] = set()
+        while len(chosen) < edges_per_node:
+            chosen.add(random.choice(endpoints))
+        for other in sorted(chosen):
+            edges.append((str(other), str(node), random.randint(1, 100)))
+            endpoints += (other, node)
+    return edges
+
+def deep_chain(n: int, seed: Optional[int] = None) -> EdgeList:
+    """A single path 0 - 1 - ... - n-1, as deep as a graph on n nodes gets"""
+    random = Random(seed)
+    return [(str(node), str(node + 1), random.randint(1, 100)) for node in range(n - 1)]
+
+GENERATORS = {
+    'erdos_renyi': erdos_renyi,
+    'grid': grid,
+    'power_law': power_law,
+    'deep_chain': deep_chain,
+}
@@ -0,0 +1,138 @@
+from array import array
+from typing import Iterable, Iterator, List, Optional, Tuple
+import mmap
+import struct
+import sys
+from graph import Graph
+from csr_graph import CSRGraph
+
+# Snapshot layout (little-endian, every section starts on an 8-byte boundary):
+#
+#   magic           8 bytes  b'GRAPHSNP'
+#   header          FORMAT_VERSION, flags, node count, edge count, label blob size
+#   offsets         int64[nodes + 1]
+#   targets         int32[edges]
+#   weights         float64[edges]          only when FLAG_WEIGHTED is set
+#   label_offsets   int64[nodes + 1]        byte range of each label in the blob
+#   label_order     int32[nodes]            node ids sorted by label, for lookups
+#   label_blob      utf-8 bytes
+MAGIC = b'GRAPHSNP'
+FORMAT_VERSION = 1
+FLAG_WEIGHTED = 1
+_HEADER = struct.Struct('<IIqqq')
+
+class LabelTable:
+    """
+    Read-only node label table over a snapshot's label sections. Labels are
+    decoded on access and looked up by binary search over label_order, so
+    opening a snapshot never builds a per-node Python object.
+    """
+    def __init__(self, offsets: memoryview, order: memoryview, blob: memoryview):
+        self.offsets = offsets
+        self.order = order
+        self.blob = blob
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, node_id: int) -> str:
+        return self._raw(node_id).decode('utf-8')
+
+    def __iter__(self) -> Iterator[str]:
+        for node_id in range(len(self)):
+            yield self[node_id]
+
+    def get(self, label: str, default: Optional[int] = None) -> Optional[int]:
+        # UTF-8 byte order matches str order, so the raw bytes can be compared directly
+        key = label.encode('utf-8')
+        low, high = 0, len(self.order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._raw(self.order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        if low < len(self.order) and self._raw(self.order[low]) == key:
+            return self.order[low]
+        return default
+
+    def __contains__(self, label: str) -> bool:
+        return self.get(label) is not None
+
+    def _raw(self, node_id: int) -> bytes:
+        return bytes(self.blob[self.offsets[node_id]:self.offsets[node_id + 1]])
+
+def save_snapshot(graph: Graph, path: str):
+    csr = graph if isinstance(graph, CSRGraph) else CSRGraph.from_graph(graph)
+    n = csr.node_count()
+    m = csr.edge_count()
+
+    encoded, label_offsets, label_order = label_sections(csr.labels)
+    sections = [array('q', csr.offsets), array('i', csr.targets)]
+    if csr.weights is not None:
+        sections.append(array('d', csr.weights))
+    sections.extend([label_offsets, label_order])
+
+    flags = FLAG_WEIGHTED if csr.weights is not None else 0
+    with open(path, 'wb') as file:
+        file.write(MAGIC)
+        file.write(_HEADER.pack(FORMAT_VERSION, flags, n, m, label_offsets[-1]))
+        _pad(file)
+        for section in sections:
+            if sys.byteorder != 'little':
+                section.byteswap()
+            file.write(section.tobytes())
+            _pad(file)
+        for label in encoded:
+            file.write(label)
+
+def label_sections(labels: Iterable[str]) -> Tuple[List[bytes], array, array]:
+    """Encoded labels and the label_offsets and label_order sections a LabelTable reads"""
+    encoded: List[bytes] = [label.encode('utf-8') for label in labels]
+    label_offsets = array('q', [0])
+    for label in encoded:
+        label_offsets.append(label_offsets[-1] + len(label))
+    label_order = array('i', sorted(range(len(encoded)), key=encoded.__getitem__))
+    return encoded, label_offsets, label_order
+
+def load_snapshot(path: str) -> CSRGraph:
+    """
+    Maps a snapshot read-only and returns a CSRGraph whose arrays point
+    straight into the mapping, so loading costs the same for any graph size.
+    Processes that load the same file share its pages through the OS cache.
+    """
+    if sys.byteorder != 'little':
+        raise ValueError("Graph snapshots can only be mapped on little-endian hosts")
+
+    with open(path, 'rb') as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapping)
+    if bytes(buffer[:len(MAGIC)]) != MAGIC:
+        raise ValueError(f"{path} is not a graph snapshot")
+
+    version, flags, n, m, label_size = _HEADER.unpack_from(buffer, len(MAGIC))
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported graph snapshot version {version}, expected {FORMAT_VERSION}")
+
+    position = _aligned(len(MAGIC) + _HEADER.size)
+
+    def section(typecode: str, itemsize: int, count: int) -> memoryview:
+        nonlocal position
+        view = buffer[position:position + itemsize * count].cast(typecode)
+        position = _aligned(position + itemsize * count)
+        return view
+
+    offsets = section('q', 8, n + 1)
+    targets = section('i', 4, m)
+    weights = section('d', 8, m) if flags & FLAG_WEIGHTED else None
+    labels = LabelTable(section('q', 8, n + 1), section('i', 4, n), buffer[position:position + label_size])
+
+    return CSRGraph(labels, offsets, targets, weights, labels)
+
+def _aligned(position: int) -> int:
+    return (position + 7) & ~7
+
+def _pad(file):
+    file.write(b'\0' * (_aligned(file.tell()) - file.tell()))
@@ -1,7 +1,8 @@
-from collections import defaultdict, deque
-from typing import List, Dict
+from typing import List, Dict, Optional, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
+import sys
+import time
 
 class TraversalState(Enum):
     NOT_STARTED = "Not Started"
@@ -12,9 +13,15 @@ class Microservice:
     def __init__(self, name: str):
         self.name = name
         self.dependencies: List['Microservice'] = []
+        self.dependents: List['Microservice'] = []
+        self.graph: Optional['MicroserviceGraph'] = None
         
     def add_dependency(self, service: 'Microservice'):
+        """Adds the dependency as is; MicroserviceGraph.add_dependency also rejects cycles"""
         self.dependencies.append(service)
+        service.dependents.append(self)
+        if self.graph is not None:
+            self.graph._dependency_added(self, service)
 
     def get_dependencies(self) -> List['Microservice']:
         return self.dependencies
@@ -33,92 +40,351 @@ class LevelOrderDeployment:
     services: List[Microservice]
 
 class MicroserviceGraph:
+    """
+    Keeps a valid deployment order (every service after its dependencies) up
+    to date as dependencies are added, using the Pearce-Kelly algorithm.
+
+    A new dependency that already agrees with the order costs O(1). Otherwise
+    only the services whose position lies between the two endpoints and that
+    are connected to them are searched and shuffled among their own
+    positions, so the cost follows the affected region rather than the graph.
+    A dependency that would close a cycle is found by the same search and
+    rejected before anything changes.
+
+    Microservice.add_dependency skips all of this. A dependency added that
+    way which breaks the order marks it stale, and the next deploy or
+    add_dependency rebuilds it with a full topological sort, which fails if
+    such dependencies formed a cycle.
+    """
     def __init__(self):
         self.microservices: Dict[str, Microservice] = {}
+        self.order: List[Microservice] = []
+        self.positions: Dict[Microservice, int] = {}
+        self.order_valid = True
+        self.version = 0  # Bumped on every change so a stale DependencyIndex is rebuilt
+        self.index: Optional['DependencyIndex'] = None
         
     def add_microservice(self, name:str):
-        self.microservices[name] = Microservice(name)
+        if name in self.microservices:
+            return
+        
+        service = Microservice(name)
+        service.graph = self
+        self.microservices[name] = service
+        self.positions[service] = len(self.order)
+        self.order.append(service)
+        self.version += 1
     
     def get_microservices(self) -> List[Microservice]:
         return self.microservices.values()
     
-    def add_dependency(self, from_microservice_name: str, to_microservice_name: str):
+    def add_dependency(self, from_microservice_name: str, to_microservice_name: str) -> List[Microservice]:
+        """Returns the cycle the dependency would create, in which case it is not added"""
         from_microservice = self.microservices.get(from_microservice_name, None)
         to_microservice = self.microservices.get(to_microservice_name, None)
         
         if from_microservice == None:
             print(f"Microservice with name {from_microservice_name} not found")
-            return
+            return []
         
         if to_microservice == None:
             print(f"Microservice with name {to_microservice_name} not found")
-            return
+            return []
         
-        from_microservice.add_dependency(to_microservice)
+        if self.order_valid or self.restore_order():
+            cycle = self._reorder(from_microservice, to_microservice)
+        else:
+            # Already cyclic, so there is no order to maintain; only the new cycle is checked
+            cycle = [from_microservice] + _dependency_chain(to_microservice, from_microservice)
+            if len(cycle) == 1:
+                cycle = []
+        if cycle:
+            print(f"Dependency {from_microservice_name} -> {to_microservice_name} creates a cycle: "
+                  + " -> ".join(service.name for service in cycle))
+            return cycle
         
-def deploy(graph: MicroserviceGraph) -> Deployment:
-    service_states: Dict[Microservice, TraversalState] = {}
-    services = graph.get_microservices()
+        from_microservice.add_dependency(to_microservice)
+        return []
     
-    for service in services:
-        service_states[service] = TraversalState.NOT_STARTED
+    def restore_order(self) -> bool:
+        """Rebuilds a stale order by topological sort; False, leaving it stale, if there is a cycle"""
+        states: Dict[Microservice, TraversalState] = {}
+        order: List[Microservice] = []
+        for root in self.order:
+            if root in states:
+                continue
+            states[root] = TraversalState.VISITING
+            work = [(root, iter(root.dependencies))]
+            while work:
+                service, dependencies = work[-1]
+                for dependency in dependencies:
+                    state = states.get(dependency, None)
+                    if state is TraversalState.VISITING:
+                        return False
+                    if state is None:
+                        states[dependency] = TraversalState.VISITING
+                        work.append((dependency, iter(dependency.dependencies)))
+                        break
+                else:
+                    work.pop()
+                    states[service] = TraversalState.VISITED
+                    order.append(service)
         
-    order: List[Microservice] = []
+        self.order = order
+        self.positions = {service: position for position, service in enumerate(order)}
+        self.order_valid = True
+        return True
+    
+    def _dependency_added(self, service: Microservice, dependency: Microservice):
+        self.version += 1
+        if self.order_valid and self.positions.get(dependency, -1) >= self.positions.get(service, -1):
+            self.order_valid = False
+    
+    def dependency_index(self) -> 'DependencyIndex':
+        if self.index is None or self.index.version != self.version:
+            self.index = DependencyIndex(self)
+        return self.index
     
-    for service in services:
-        if service_states[service] == TraversalState.NOT_STARTED:
-            if find_deployment_order(service, service_states, order) == False:
-                return Deployment(is_possible=False, order=[])
+    def depends_on(self, microservice_name: str, dependency_name: str) -> bool:
+        """Whether microservice_name needs dependency_name deployed first, directly or transitively"""
+        return self.dependency_index().depends_on(microservice_name, dependency_name)
+    
+    def transitive_dependents(self, microservice_name: str) -> List[Microservice]:
+        return self.dependency_index().transitive_dependents(microservice_name)
+    
+    def _reorder(self, service: Microservice, dependency: Microservice) -> List[Microservice]:
+        """Moves dependency ahead of service if needed, or returns the cycle that prevents it"""
+        if service is dependency:
+            return [service, service]
+        
+        positions = self.positions
+        lower = positions[service]
+        upper = positions[dependency]
+        if upper < lower:
+            return []
+        
+        # Services that depend on service and sit no later than dependency
+        parents: Dict[Microservice, Microservice] = {service: service}
+        forward: List[Microservice] = [service]
+        stack = [service]
+        while stack:
+            current = stack.pop()
+            for dependent in current.dependents:
+                if dependent is dependency:
+                    # dependency already depends on service through this chain
+                    cycle = [service, dependency]
+                    while current is not service:
+                        cycle.append(current)
+                        current = parents[current]
+                    cycle.append(service)
+                    return cycle
+                if dependent not in parents and positions[dependent] < upper:
+                    parents[dependent] = current
+                    forward.append(dependent)
+                    stack.append(dependent)
+        
+        # Services dependency relies on that sit no earlier than service
+        seen: Set[Microservice] = {dependency}
+        backward: List[Microservice] = [dependency]
+        stack = [dependency]
+        while stack:
+            for required in stack.pop().dependencies:
+                if required not in seen and positions[required] > lower:
+                    seen.add(required)
+                    backward.append(required)
+                    stack.append(required)
         
-    return Deployment(is_possible=True, order=order)
+        # Reuse the same positions: first everything dependency needs, then everything needing service
+        key = positions.__getitem__
+        forward.sort(key=key)
+        backward.sort(key=key)
+        moved = backward + forward
+        for position, moved_service in zip(sorted(map(key, moved)), moved):
+            positions[moved_service] = position
+            self.order[position] = moved_service
+        return []
+        
+class DependencyIndex:
+    """
+    Transitive closure of the dependencies, answering depends_on in O(1).
 
-def find_deployment_order(service: Microservice, 
-                          service_states: Dict[Microservice, TraversalState], 
-                          order: List[Microservice]) -> bool:
-    
-    service_states[service] = TraversalState.VISITING
+    Services that depend on each other in a cycle (possible when
+    Microservice.add_dependency is called directly) collapse into one
+    component. Components are numbered so that every dependency of a
+    component comes first, and each one keeps a bitset of the components it
+    reaches: its own bit OR the bitsets of its direct dependencies, one
+    big-integer OR per edge. A second pass the other way round gives the
+    bitset of components that depend on each one.
+
+    Memory is two bits per pair of components, so it suits thousands of
+    services rather than millions. build_seconds and memory_bytes report
+    the cost of building the index.
+    """
+    def __init__(self, graph: MicroserviceGraph):
+        start = time.perf_counter()
+        self.version = graph.version
+        self.microservices = graph.microservices
+        self.components, self.component_of = _find_components(graph.get_microservices())
+        
+        # Same-component dependencies only matter for cycles, which depends_on checks separately
+        count = len(self.components)
+        reaches: List[int] = []
+        for component, members in enumerate(self.components):
+            row = 1 << component
+            for service in members:
+                for dependency in service.dependencies:
+                    if self.component_of[dependency] != component:
+                        row |= reaches[self.component_of[dependency]]
+            reaches.append(row)
+        
+        reached_by: List[int] = [0] * count
+        for component in range(count - 1, -1, -1):
+            row = 1 << component
+            for service in self.components[component]:
+                for dependent in service.dependents:
+                    if self.component_of[dependent] != component:
+                        row |= reached_by[self.component_of[dependent]]
+            reached_by[component] = row
+        
+        # Bytes make a membership test a single index instead of a shift of the whole row
+        row_bytes = (count + 7) // 8
+        self.reaches: List[bytes] = [row.to_bytes(row_bytes, 'little') for row in reaches]
+        self.reached_by = reached_by
+        self.cyclic: List[bool] = [len(members) > 1 or members[0] in members[0].dependencies
+                                   for members in self.components]
+        
+        self.build_seconds = time.perf_counter() - start
+        self.memory_bytes = (sys.getsizeof(self.reaches) + sum(map(sys.getsizeof, self.reaches))
+                             + sys.getsizeof(self.reached_by) + sum(map(sys.getsizeof, self.reached_by)))
     
-    for dependency in service.get_dependencies():
-        if service_states[dependency] == TraversalState.VISITING:
+    def depends_on(self, microservice_name: str, dependency_name: str) -> bool:
+        service = self.microservices.get(microservice_name, None)
+        dependency = self.microservices.get(dependency_name, None)
+        
+        if service == None:
+            print(f"Microservice with name {microservice_name} not found")
             return False
         
-        elif service_states[dependency] == TraversalState.NOT_STARTED and find_deployment_order(dependency, service_states, order) == False:
+        if dependency == None:
+            print(f"Microservice with name {dependency_name} not found")
             return False
         
-    order.append(service)
-    service_states[service] = TraversalState.VISITED
-    return True
+        component = self.component_of[service]
+        dependency_component = self.component_of[dependency]
+        if service is dependency:
+            return self.cyclic[component]
+        if dependency_component > component:
+            return False
+        return bool(self.reaches[component][dependency_component >> 3] >> (dependency_component & 7) & 1)
+    
+    def transitive_dependents(self, microservice_name: str) -> List[Microservice]:
+        """Every service that depends on microservice_name, in a valid deployment order"""
+        service = self.microservices.get(microservice_name, None)
+        if service == None:
+            print(f"Microservice with name {microservice_name} not found")
+            return []
+        
+        component = self.component_of[service]
+        bits = bin(self.reached_by[component])[:1:-1]  # Lowest component first
+        result: List[Microservice] = []
+        position = bits.find('1')
+        while position != -1:
+            result.extend(member for member in self.components[position]
+                          if member is not service or self.cyclic[component])
+            position = bits.find('1', position + 1)
+        return result
+    
+    def __repr__(self) -> str:
+        return (f"DependencyIndex(services={len(self.component_of)}, components={len(self.components)}, "
+                f"build={self.build_seconds * 1000:.1f}ms, memory={self.memory_bytes / 1024:.1f}KiB)")
+
+def _dependency_chain(start: Microservice, goal: Microservice) -> List[Microservice]:
+    """start, the services it depends on in turn, then goal; empty if start does not reach goal"""
+    parents: Dict[Microservice, Optional[Microservice]] = {start: None}
+    stack = [start]
+    while stack:
+        service = stack.pop()
+        if service is goal:
+            chain: List[Microservice] = []
+            while service is not None:
+                chain.append(service)
+                service = parents[service]
+            return chain[::-1]
+        for dependency in service.dependencies:
+            if dependency not in parents:
+                parents[dependency] = service
+                stack.append(dependency)
+    return []
+
+def _find_components(services) -> Tuple[List[List[Microservice]], Dict[Microservice, int]]:
+    """Iterative Tarjan; a component is emitted only after every component it depends on"""
+    index: Dict[Microservice, int] = {}
+    low: Dict[Microservice, int] = {}
+    on_stack: Set[Microservice] = set()
+    stack: List[Microservice] = []
+    components: List[List[Microservice]] = []
+    component_of: Dict[Microservice, int] = {}
+    
+    for root in services:
+        if root in index:
+            continue
+        
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(root.dependencies))]
+        
+        while work:
+            service, dependencies = work[-1]
+            for dependency in dependencies:
+                if dependency not in index:
+                    index[dependency] = low[dependency] = len(index)
+                    stack.append(dependency)
+                    on_stack.add(dependency)
+                    work.append((dependency, iter(dependency.dependencies)))
+                    break
+                if dependency in on_stack and index[dependency] < low[service]:
+                    low[service] = index[dependency]
+            else:
+                work.pop()
+                if work and low[service] < low[work[-1][0]]:
+                    low[work[-1][0]] = low[service]
+                
+                if low[service] == index[service]:
+                    component: List[Microservice] = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component_of[member] = len(components)
+                        component.append(member)
+                        if member is service:
+                            break
+                    components.append(component)
+    
+    return components, component_of
+        
+def deploy(graph: MicroserviceGraph) -> Deployment:
+    # The maintained order is valid unless Microservice.add_dependency broke it, and then
+    # only a cycle keeps it from being rebuilt
+    if not graph.order_valid and not graph.restore_order():
+        return Deployment(is_possible=False, order=[])
+    return Deployment(is_possible=True, order=list(graph.order))
 
 def find_parallel_deployment_order(graph: MicroserviceGraph) -> List[LevelOrderDeployment]:
-    services = graph.get_microservices()
-    in_degree: Dict[Microservice, int] = {}
+    # A service's level is one past its deepest dependency; the maintained
+    # order lists every dependency first, so a single pass settles all levels.
+    # There are no levels when a cycle makes deployment impossible
+    if not graph.order_valid and not graph.restore_order():
+        return []
+    levels: Dict[Microservice, int] = {}
     deployments : List[LevelOrderDeployment] = []
-    dependents_map: Dict[Microservice, List[Microservice]] = defaultdict(list)
-    
-    for service in services:
-        in_degree[service] = len(service.get_dependencies())
-        for dep in service.get_dependencies():
-            dependents_map[dep].append(service)
-        
-    queue = deque([s for s in services if in_degree[s] == 0])
-    level = 0
-    print(queue)
-    while queue:
-        current_level = []
-        size = len(queue)
-        while size > 0:
-            service = queue.popleft()
-            current_level.append(service)
-            
-            for dependent in dependents_map[service]:
-                in_degree[dependent] -= 1
-                if in_degree[dependent] == 0:
-                    queue.append(dependent)
-                    
-            size -= 1
-
-        deployments.append(LevelOrderDeployment(f"Level {level}", current_level))
-        level += 1        
+    
+    for service in graph.order:
+        level = 1 + max((levels[dep] for dep in service.get_dependencies()), default=-1)
+        levels[service] = level
+        if level == len(deployments):
+            deployments.append(LevelOrderDeployment(f"Level {level}", []))
+        deployments[level].services.append(service)
         
     return deployments
 
@@ -127,13 +393,9 @@ def main():
     print("=== Testing Cyclical Dependencies ===")
     graph = build_microservice_graph()
     deployment = deploy(graph)
-    if deployment.is_possible:
-        print("Deployment is possible")
-        print("Deployment Order:")
-        for service in deployment.order:
-            print(f" - {service.name}")
-    else:
-        print("Deployment is not possible due to circular dependencies")
+    print("Deployment Order with the circular dependency rejected:")
+    for service in deployment.order:
+        print(f" - {service.name}")
     
     # Test with valid graph for parallel deployment
     print("\n=== Testing Parallel Deployment ===")
@@ -152,6 +414,12 @@ def main():
             print(f"{level_deployment.level}: {service_names}")
     else:
         print("Deployment is not possible")
+    
+    print("\n=== Testing Transitive Dependencies ===")
+    print(f"WebUI depends on Database: {valid_graph.depends_on('WebUI', 'Database')}")
+    print(f"AuthService depends on OrderService: {valid_graph.depends_on('AuthService', 'OrderService')}")
+    print(f"Everything that needs UserService: {valid_graph.transitive_dependents('UserService')}")
+    print(valid_graph.dependency_index())
 
 def build_microservice_graph() -> MicroserviceGraph:
     graph = MicroserviceGraph()
@@ -163,7 +431,7 @@ def build_microservice_graph() -> MicroserviceGraph:
     graph.add_dependency("ServiceA", "ServiceB")
     graph.add_dependency("ServiceB", "ServiceC")
     graph.add_dependency("ServiceC", "ServiceD")
-    graph.add_dependency("ServiceD", "ServiceA")  # This creates a circular dependency
+    graph.add_dependency("ServiceD", "ServiceA")  # Rejected: this creates a circular dependency
 
     return graph
 
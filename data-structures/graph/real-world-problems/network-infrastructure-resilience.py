@@ -1,5 +1,14 @@
-from typing import List, Dict
+from array import array
+from dataclasses import dataclass
+from typing import List, Dict, Optional
 from enum import Enum
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from algorithms.betweenness import adjacency_betweenness
+from algorithms.dynamic_bridges import DynamicBridges
+from algorithms.max_flow import FlowNetwork, GomoryHuTree
 
 class TraversalState(Enum):
     NOT_STARTED = "Not Started"
@@ -23,9 +32,12 @@ class Server:
 class NetworkGraph:
     def __init__(self):
         self.servers: Dict[str, Server] = {}
+        self.monitor: Optional[DynamicBridges] = None  # Set by track_critical_connections
         
     def add_server(self, server_name):
         self.servers[server_name] = Server(server_name)
+        if self.monitor is not None:
+            self.monitor.add_node(server_name)
         
     def get_servers(self) -> List[Server]:
         return self.servers.values()
@@ -44,9 +56,39 @@ class NetworkGraph:
         
         from_server.add_connections(to_server)
         to_server.add_connections(from_server)
+        if self.monitor is not None:
+            self.monitor.add_link(from_server_name, to_server_name)
+        
+    def remove_connection(self, from_server_name: str, to_server_name: str):
+        from_server = self.servers.get(from_server_name, None)
+        to_server = self.servers.get(to_server_name, None)
+        
+        if from_server is None or to_server is None or to_server not in from_server.connections:
+            print(f"Connection between {from_server_name} and {to_server_name} not found")
+            return
+        
+        from_server.connections.remove(to_server)
+        to_server.connections.remove(from_server)
+        if self.monitor is not None:
+            self.monitor.remove_link(from_server_name, to_server_name)
+        
+    def track_critical_connections(self) -> DynamicBridges:
+        """
+        Keeps bridges and articulation points up to date through later
+        add_connection / remove_connection calls, so find_critical_connections
+        and find_critical_servers no longer search the whole network
+        """
+        if self.monitor is None:
+            links = [(server.name, connection.name) for server in self.servers.values()
+                     for connection in server.connections if server.name < connection.name]
+            self.monitor = DynamicBridges.from_links(self.servers, links)
+        return self.monitor
         
 
 def find_critical_connections(graph: NetworkGraph) -> List[List[Server]]:
+    if graph.monitor is not None:
+        return [[graph.servers[from_name], graph.servers[to_name]] for from_name, to_name in graph.monitor.bridges()]
+    
     server_states: Dict[Server, TraversalState] = {}
     disc: Dict[Server, int] = {}
     low: Dict[Server, int] = {}
@@ -63,6 +105,10 @@ def find_critical_connections(graph: NetworkGraph) -> List[List[Server]]:
             
     return result
 
+def find_critical_servers(graph: NetworkGraph) -> List[Server]:
+    """Servers whose failure splits the network"""
+    return [graph.servers[name] for name in graph.track_critical_connections().articulation_points()]
+
 def _find_critical_connections(server: Server,
                                disc: Dict[Server, int],
                                low: Dict[Server, int],
@@ -93,6 +139,44 @@ def _find_critical_connections(server: Server,
     
     server_states[server] = TraversalState.VISITED
     
+@dataclass
+class ServerLoad:
+    server: Server
+    routes: float  # Shortest routes between other servers that pass through this one
+
+def _adjacency(graph: NetworkGraph):
+    servers = list(graph.get_servers())
+    ids: Dict[Server, int] = {server: index for index, server in enumerate(servers)}
+    offsets = array('q', [0])
+    targets = array('i')
+    for server in servers:
+        targets.extend([ids[connection] for connection in server.get_connections()])
+        offsets.append(len(targets))
+    return servers, offsets, targets
+
+def build_link_failure_tree(graph: NetworkGraph) -> GomoryHuTree:
+    """
+    min_cut(a, b) on the result is the number of links that must fail to cut
+    server a off from server b, for any pair, from n - 1 max-flow runs
+    """
+    servers, offsets, targets = _adjacency(graph)
+    return GomoryHuTree([server.name for server in servers], FlowNetwork(offsets, targets))
+
+def rank_servers_by_traffic(graph: NetworkGraph, samples: Optional[int] = None,
+                            workers: Optional[int] = None, seed: Optional[int] = None) -> List[ServerLoad]:
+    """
+    Servers ordered by betweenness centrality. samples estimates it from
+    that many random servers on large networks; workers spreads the work
+    over a process pool.
+    """
+    servers, offsets, targets = _adjacency(graph)
+    
+    # Connections go both ways, so every route is found once from each end
+    scores = adjacency_betweenness(offsets, targets, samples, workers, seed)
+    loads = [ServerLoad(server, score / 2) for server, score in zip(servers, scores)]
+    loads.sort(key=lambda load: load.routes, reverse=True)
+    return loads
+
 def main():
     graph = build_network_graph()
     critical_connections = find_critical_connections(graph)
@@ -112,6 +196,23 @@ def main():
         print("Critical Connections in Graph")
         for conn in critical_connections:
             print(f" - {conn[0].name} <-> {conn[1].name}")
+    
+    print("Busiest servers:")
+    for load in rank_servers_by_traffic(graph)[:3]:
+        print(f" - {load.server.name}: {load.routes:g} routes")
+    
+    graph.track_critical_connections()
+    print(f"Critical servers: {find_critical_servers(graph)}")
+    graph.add_connection("F", "B")
+    print(f"After linking F and B: critical connections {find_critical_connections(graph)}, "
+          f"critical servers {find_critical_servers(graph)}")
+    graph.remove_connection("A", "D")
+    print(f"After removing A-D: critical connections {find_critical_connections(graph)}, "
+          f"critical servers {find_critical_servers(graph)}")
+    
+    failure_tree = build_link_failure_tree(graph)
+    for from_name, to_name in [("A", "C"), ("A", "F")]:
+        print(f"Links that must fail to separate {from_name} and {to_name}: {failure_tree.min_cut(from_name, to_name):g}")
 
 def build_network_graph() -> NetworkGraph:
     graph = NetworkGraph()
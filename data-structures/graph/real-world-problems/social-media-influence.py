@@ -8,9 +8,17 @@ These groups represent echo chambers where information circulates within the gro
 **Follow-up**: How would you handle millions of users? What if the graph changes frequently?
 """
 
-from typing import List, Dict
+from array import array
+from dataclasses import dataclass
+from itertools import chain
+from typing import List, Dict, Optional
 from enum import Enum
 
+try:
+    import numpy as np
+except ImportError:  # Only InfluenceRanker needs NumPy
+    np = None
+
 class TraversalState(Enum):
     NOT_STARTED = "Not Started"
     VISITING = "Visiting"
@@ -30,9 +38,11 @@ class User:
 class SocialMediaGraph:
     def __init__(self):
         self.users: Dict[str, User] = {}
+        self.version = 0  # Bumped on every change so InfluenceRanker knows to rebuild its matrix
         
     def add_user(self, name: str):
         self.users[name] = User(name)
+        self.version += 1
         
     def get_users(self) -> List[User]:
         return self.users.values()
@@ -45,6 +55,7 @@ class SocialMediaGraph:
             return
         
         followee.add_follower(follower)
+        self.version += 1
         
 def transpose_graph(graph: SocialMediaGraph) -> SocialMediaGraph:
     transposed_graph = SocialMediaGraph()
@@ -121,12 +132,148 @@ def _find_group(user: User, user_states: Dict[User, TraversalState], group: List
     
     user_states[user] = TraversalState.VISITED
 
+@dataclass
+class InfluenceScore:
+    name: str
+    score: float
+
+class InfluenceRanker:
+    """
+    PageRank over the follow graph: following someone passes a share of your
+    own score to them, so users followed by influential users rank highest.
+
+    The graph is flattened into NumPy edge arrays (follower id, followee id),
+    a sparse matrix in coordinate form, and each power iteration is one
+    gather and one np.bincount over all edges. Users who follow nobody hand
+    their score back through the teleport vector, which is uniform for plain
+    PageRank or concentrated on chosen users for personalized PageRank.
+
+    After the graph changes, rank() rebuilds the arrays and by default starts
+    from the previous scores, which are usually close to the new fixed point,
+    so it needs far fewer iterations than a cold start.
+    """
+    def __init__(self, graph: SocialMediaGraph, damping: float = 0.85,
+                 tolerance: float = 1e-6, max_iterations: int = 100):
+        if np is None:
+            raise ImportError("InfluenceRanker needs NumPy")
+        if not 0 < damping < 1:
+            raise ValueError(f"Damping must be between 0 and 1, got {damping}")
+        
+        self.graph = graph
+        self.damping = damping
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.version = -1
+        self.names: List[str] = []
+        self.scores: Optional[np.ndarray] = None
+        self.iterations = 0
+        self.converged = False
+    
+    def _build(self):
+        users = list(self.graph.get_users())
+        ids: Dict[User, int] = {user: index for index, user in enumerate(users)}
+        
+        sources = array('i', map(ids.__getitem__, chain.from_iterable(user.followers for user in users)))
+        follower_counts = array('q', [len(user.followers) for user in users])
+        
+        n = len(users)
+        self.sources = np.frombuffer(sources, dtype=np.int32) if sources else np.empty(0, dtype=np.int32)
+        self.targets = np.repeat(np.arange(n, dtype=np.int32), np.frombuffer(follower_counts, dtype=np.int64) if n else [])
+        following = np.bincount(self.sources, minlength=n).astype(np.float64)
+        self.dangling = following == 0
+        self.inverse_following = np.divide(1.0, following, out=np.zeros(n), where=~self.dangling)
+        self.names = [user.name for user in users]
+        self.version = self.graph.version
+    
+    def rank(self, personalization: Optional[Dict[str, float]] = None, warm_start: bool = True) -> np.ndarray:
+        """
+        Runs power iteration until the scores move by less than tolerance (L1)
+        or max_iterations is reached, and returns them aligned with names.
+        personalization maps user names to teleport weights.
+        """
+        previous_names, previous = self.names, self.scores if warm_start else None
+        if self.version != self.graph.version:
+            self._build()
+        
+        n = len(self.names)
+        if n == 0:
+            self.scores = np.empty(0)
+            return self.scores
+        
+        teleport = np.full(n, 1.0 / n)
+        if personalization:
+            positions = {name: index for index, name in enumerate(self.names)}
+            teleport = np.zeros(n)
+            for name, weight in personalization.items():
+                if name not in positions:
+                    print(f"User with name {name} not found")
+                    continue
+                teleport[positions[name]] = weight
+            if teleport.sum() <= 0:
+                raise ValueError("Personalization needs a positive weight on at least one existing user")
+            teleport /= teleport.sum()
+        
+        if previous is not None and len(previous):
+            if self.names[:len(previous_names)] == previous_names:
+                # Users are only ever appended, so old scores line up with the front
+                scores = np.concatenate([previous, np.full(n - len(previous), 1.0 / n)])
+            else:
+                scores_by_name = dict(zip(previous_names, previous.tolist()))
+                scores = np.fromiter((scores_by_name.get(name, 1.0 / n) for name in self.names), dtype=np.float64, count=n)
+            scores /= scores.sum()
+        else:
+            scores = teleport.copy()
+        
+        sources = self.sources
+        targets = self.targets
+        damping = self.damping
+        self.converged = False
+        for self.iterations in range(1, self.max_iterations + 1):
+            shares = (scores * self.inverse_following)[sources]
+            spread = np.bincount(targets, weights=shares, minlength=n)
+            leaked = damping * scores[self.dangling].sum() + (1 - damping)
+            new_scores = damping * spread + leaked * teleport
+            change = np.abs(new_scores - scores).sum()
+            scores = new_scores
+            if change < self.tolerance:
+                self.converged = True
+                break
+        
+        self.scores = scores
+        return scores
+    
+    def top_k(self, k: int) -> List[InfluenceScore]:
+        """The k highest-scoring users from the last rank() call, best first"""
+        if self.scores is None:
+            self.rank()
+        
+        scores = self.scores
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind='stable')]
+        return [InfluenceScore(self.names[index], float(scores[index])) for index in best]
+
 def main():
     graph = build_social_media_graph()
     influential_groups = find_influential_user_groups(graph)
     print("Influential User Groups:")
     for group in influential_groups:
         print([user.name for user in group])
+    
+    if np is not None:
+        ranker = InfluenceRanker(graph)
+        print("\nMost influential users:")
+        for influence in ranker.top_k(3):
+            print(f"  {influence.name}: {influence.score:.4f}")
+        print(f"Converged in {ranker.iterations} iterations")
+        
+        print("\nInfluence as seen from Eve:")
+        ranker.rank(personalization={"Eve": 1.0})
+        for influence in ranker.top_k(3):
+            print(f"  {influence.name}: {influence.score:.4f}")
 
 def build_social_media_graph() -> SocialMediaGraph:
     graph = SocialMediaGraph()
@@ -0,0 +1,48 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+class ResultCache:
+    """
+    Memoizes algorithm results for one graph, keyed by (algorithm, arguments,
+    graph version). Any add_node/add_edge bumps the graph's version, so the
+    first lookup after a mutation drops every stored result.
+
+    Cached results are shared between callers and must not be modified.
+    """
+    def __init__(self):
+        self.stats = CacheStats()
+        self._version = 0
+        self._results: Dict[Tuple[Callable, Tuple, Tuple, int], Any] = {}
+
+    def get(self, graph, algorithm: Callable, *args: Hashable, **kwargs: Hashable) -> Any:
+        if graph.version != self._version:
+            if self._results:
+                self.stats.invalidations += 1
+                self._results.clear()
+            self._version = graph.version
+
+        key = (algorithm, args, tuple(sorted(kwargs.items())), graph.version)
+        if key in self._results:
+            self.stats.hits += 1
+            return self._results[key]
+
+        self.stats.misses += 1
+        result = algorithm(graph, *args, **kwargs)
+        self._results[key] = result
+        return result
+
+    def clear(self):
+        self._results.clear()
+
+    def __len__(self) -> int:
+        return len(self._results)
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from collections import deque
+from graph import Graph
+from directed_graph import DirectedGraph
+from undirected_graph import UndirectedGraph
+from csr_graph import CSRGraph
+from algorithms.betweenness import betweenness_centrality
+
+def brute_force_betweenness(graph: Graph):
+    """Counts, for every ordered pair, the fraction of shortest paths through each node"""
+    def bfs(source):
+        distance = {source: 0}
+        paths = {source: 1}
+        queue = deque([source])
+        while queue:
+            label = queue.popleft()
+            for edge in graph.nodes[label].get_edges():
+                to_label = edge.to_node.label
+                if to_label not in distance:
+                    distance[to_label] = distance[label] + 1
+                    paths[to_label] = 0
+                    queue.append(to_label)
+                if distance[to_label] == distance[label] + 1:
+                    paths[to_label] += paths[label]
+        return distance, paths
+
+    searches = {label: bfs(label) for label in graph.nodes}
+    scores = dict.fromkeys(graph.nodes, 0.0)
+    for source in graph.nodes:
+        distance, paths = searches[source]
+        for target in distance:
+            if target == source:
+                continue
+            for middle in distance:
+                if middle in (source, target):
+                    continue
+                middle_distance, middle_paths = searches[middle]
+                if target in middle_distance and distance[middle] + middle_distance[target] == distance[target]:
+                    scores[middle] += paths[middle] * middle_paths[target] / paths[target]
+    return scores
+
+def test_betweenness_basic():
+    print("=== Testing Betweenness Centrality ===\n")
+    
+    # A - B - C - D with a shortcut B - D: B carries everything from A
+    graph = UndirectedGraph.from_edge_list([("A", "B"), ("B", "C"), ("C", "D"), ("B", "D")])
+    scores = betweenness_centrality(graph)
+    print(f"Scores: {scores}")
+    assert scores == {"A": 0.0, "B": 4.0, "C": 0.0, "D": 0.0}
+    
+    # Two equal routes around a square split each pair's unit
+    graph = UndirectedGraph.from_edge_list([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
+    scores = betweenness_centrality(graph)
+    print(f"Square: {scores}")
+    assert all(score == 1.0 for score in scores.values())
+    
+    assert betweenness_centrality(UndirectedGraph()) == {}
+
+def test_against_brute_force():
+    print("\n=== Testing Against Brute Force ===")
+    
+    rng = random.Random(3)
+    for directed in (False, True):
+        graph_class = DirectedGraph if directed else UndirectedGraph
+        graph = graph_class.from_edge_list([(str(rng.randrange(40)), str(rng.randrange(40))) for _ in range(80)])
+        expected = brute_force_betweenness(graph)
+        for target in (graph, CSRGraph.from_graph(graph)):
+            scores = betweenness_centrality(target)
+            assert all(abs(scores[label] - expected[label]) < 1e-9 for label in expected)
+        
+        parallel = betweenness_centrality(graph, workers=2)
+        assert all(abs(parallel[label] - expected[label]) < 1e-9 for label in expected)
+        print(f"  {'directed' if directed else 'undirected'}: serial and 2 workers match on {len(expected)} nodes")
+
+def test_sampling():
+    print("\n=== Testing Sampled Betweenness ===")
+    
+    rng = random.Random(5)
+    graph = UndirectedGraph.from_edge_list([(str(rng.randrange(300)), str(rng.randrange(300))) for _ in range(900)])
+    exact = betweenness_centrality(graph)
+    assert betweenness_centrality(graph, samples=len(graph.nodes)) == exact
+    
+    estimate = betweenness_centrality(graph, samples=150, seed=1)
+    assert estimate == betweenness_centrality(graph, samples=150, seed=1)
+    top = sorted(exact, key=exact.get, reverse=True)[:10]
+    estimated_top = set(sorted(estimate, key=estimate.get, reverse=True)[:20])
+    print(f"  {len(set(top) & estimated_top)} of the exact top 10 are in the sampled top 20")
+    assert len(set(top) & estimated_top) >= 8
+    
+    try:
+        betweenness_centrality(graph, samples=0)
+        assert False, "expected ValueError"
+    except ValueError as error:
+        print(f"  {error}")
+
+if __name__ == "__main__":
+    test_betweenness_basic()
+    test_against_brute_force()
+    test_sampling()
+    print("\n✅ All tests completed!")
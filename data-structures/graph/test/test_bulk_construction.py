@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tempfile
+import numpy as np
+from directed_graph import DirectedGraph
+from undirected_graph import UndirectedGraph
+from weighted_graph import WeightedGraph
+from graph import MissingNodesError
+from graph_snapshot import save_snapshot, load_snapshot
+from algorithms import topological_sort
+from algorithms.dijkstra import dijkstra
+
+def test_from_edge_list():
+    print("=== Testing from_edge_list ===\n")
+
+    graph = DirectedGraph.from_edge_list([("A", "B"), ("A", "C"), ("C", "D"), ("B", "D")])
+    print(f"Nodes: {list(graph.nodes)}")
+    print(f"Topological sort: {topological_sort(graph)}")
+
+    assert list(graph.nodes) == ["A", "B", "C", "D"]
+    assert [node.label for node in topological_sort(graph)] == ["D", "B", "C", "A"]
+
+    undirected = UndirectedGraph.from_edge_list([("A", "B")])
+    assert [edge.to_node.label for edge in undirected.get_node_by_label("B").get_edges()] == ["A"]
+
+def test_weighted_bulk_edges():
+    print("\n=== Testing Weighted Bulk Edges ===")
+
+    graph = WeightedGraph.from_edge_list([("A", "B", 4.0), ("A", "C", 2.0), ("C", "D", 5.0), ("B", "D", 1.0)],
+                                         directed=True)
+    for dist_info in dijkstra(graph, "A"):
+        print(f"  A -> {dist_info.node}: {dist_info.distance}")
+    assert {d.node: d.distance for d in dijkstra(graph, "A")} == {"B": 4.0, "C": 2.0, "D": 5.0}
+
+    graph.add_edges_from([("D", "A")], weights=[10.0], directed=True)
+    assert graph.get_node_by_label("D").get_edges()[0].weight == 10.0
+
+def test_missing_nodes_reported_in_batch():
+    print("\n=== Testing Missing Nodes Batch Error ===")
+
+    graph = DirectedGraph()
+    graph.add_node("A")
+    version = graph.version
+
+    try:
+        graph.add_edges_from([("A", "X"), ("Y", "A"), ("A", "B")], create_nodes=False)
+        assert False, "expected MissingNodesError"
+    except MissingNodesError as error:
+        print(f"Error: {error}")
+        assert error.labels == ["X", "Y", "B"]
+
+    # Nothing was added
+    assert graph.version == version
+    assert graph.get_node_by_label("A").get_edges() == []
+
+def test_numpy_labels():
+    print("\n=== Testing NumPy Labels ===")
+
+    graph = DirectedGraph.from_edge_list(np.array([[0, 1], [1, 2], [0, 2]]))
+    print(f"Nodes: {list(graph.get_nodes())}")
+    assert list(graph.nodes) == ["0", "1", "2"]
+    assert graph.get_node_by_label("0").get_edges()[0].to_node is graph.get_node_by_label("1")
+
+    # A float array with a weight column still gives integer labels
+    weighted = WeightedGraph.from_edge_list(np.array([[0, 1, 2.5], [1, 2, 1.0]]), directed=True)
+    assert list(weighted.nodes) == ["0", "1", "2"]
+    assert {d.node: d.distance for d in dijkstra(weighted, "0")} == {"1": 2.5, "2": 3.5}
+
+    # Labels given as numbers match existing string nodes
+    graph.add_edges_from(np.array([[2, 0]]), create_nodes=False)
+    assert [edge.to_node.label for edge in graph.get_node_by_label("2").get_edges()] == ["0"]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.snap")
+        save_snapshot(weighted, path)
+        snapshot = load_snapshot(path)
+        assert list(snapshot.labels) == ["0", "1", "2"]
+        assert dijkstra(snapshot, "0") == dijkstra(weighted, "0")
+        del snapshot
+
+if __name__ == "__main__":
+    test_from_edge_list()
+    test_weighted_bulk_edges()
+    test_missing_nodes_reported_in_batch()
+    test_numpy_labels()
+    print("\n✅ All tests completed!")
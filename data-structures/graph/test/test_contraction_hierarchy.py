@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weighted_graph import WeightedGraph
+from algorithms.dijkstra import dijkstra
+from algorithms.contraction_hierarchy import ContractionHierarchy
+
+def build_graph() -> WeightedGraph:
+    graph = WeightedGraph()
+    nodes = ["S", "A", "B", "C", "D", "T"]
+    for node in nodes:
+        graph.add_node(node)
+
+    edges = [
+        ("S", "A", 7), ("S", "B", 2), ("S", "C", 3),
+        ("A", "B", 3), ("A", "D", 4),
+        ("B", "D", 4), ("B", "T", 1),
+        ("C", "A", 2), ("C", "T", 5),
+        ("D", "T", 1)
+    ]
+
+    for from_node, to_node, weight in edges:
+        graph.add_directed_edge(from_node, to_node, weight)
+    return graph
+
+def test_matches_dijkstra():
+    print("=== Testing Contraction Hierarchy Queries ===\n")
+
+    graph = build_graph()
+    hierarchy = ContractionHierarchy.build(graph)
+    print(hierarchy)
+
+    for source in graph.nodes:
+        for dist_info in dijkstra(graph, source):
+            result = hierarchy.shortest_path(source, dist_info.node)
+            assert result.distance == dist_info.distance
+            if result.path:
+                assert result.path[0] == source and result.path[-1] == dist_info.node
+
+    result = hierarchy.shortest_path("S", "T")
+    print(f"S -> T: {result.path} ({result.distance})")
+    assert result.path == ["S", "B", "T"]
+
+def test_save_and_load():
+    print("\n=== Testing Save / Load ===")
+
+    hierarchy = ContractionHierarchy.build(build_graph())
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.ch")
+        hierarchy.save(path)
+        loaded = ContractionHierarchy.load(path)
+
+    print(f"Loaded {loaded}")
+    assert loaded.distance("S", "D") == hierarchy.distance("S", "D") == 6
+    assert loaded.shortest_path("C", "T").path == ["C", "T"]
+
+    # Labels are stored with explicit offsets, so NUL and non-ASCII characters survive
+    labels = ["a\0b", "", "ünïcode", "a", "b\0"]
+    graph = WeightedGraph.from_edge_list([(labels[i], labels[(i + 1) % 5], i + 1) for i in range(5)])
+    hierarchy = ContractionHierarchy.build(graph)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "labels.ch")
+        hierarchy.save(path)
+        loaded = ContractionHierarchy.load(path)
+        assert list(loaded.labels) == list(hierarchy.labels)
+        for source in labels:
+            for target in labels:
+                assert loaded.shortest_path(source, target) == hierarchy.shortest_path(source, target)
+
+        with open(path, 'r+b') as file:
+            file.write(b'GRAPHCH1')
+        try:
+            ContractionHierarchy.load(path)
+            assert False, "Expected ValueError"
+        except ValueError as error:
+            print(f"Rejected: {error}")
+        del loaded
+
+if __name__ == "__main__":
+    test_matches_dijkstra()
+    test_save_and_load()
+    print("\n✅ All tests completed!")
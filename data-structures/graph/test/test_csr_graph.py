@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from directed_graph import DirectedGraph
+from undirected_graph import UndirectedGraph
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from algorithms import dfs, bfs, find_scss, find_bridges
+from algorithms.dijkstra import dijkstra
+from algorithms.kruskal import kruskal
+
+def test_csr_directed():
+    print("=== Testing CSR Graph (Directed) ===\n")
+
+    graph = DirectedGraph()
+    for label in ["A", "B", "C", "D", "E"]:
+        graph.add_node(label)
+
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "C")
+    graph.add_edge("C", "A")
+    graph.add_edge("C", "D")
+    graph.add_edge("D", "E")
+
+    csr = CSRGraph.from_graph(graph)
+    print(csr)
+
+    assert dfs(csr) == [node.label for node in dfs(graph)]
+    assert bfs(csr, "A") == [node.label for node in bfs(graph, "A")]
+    assert find_scss(csr) == find_scss(graph)
+
+    print(f"DFS: {dfs(csr)}")
+    print(f"BFS: {bfs(csr, 'A')}")
+    print(f"SCCs: {find_scss(csr)}")
+
+def test_csr_undirected_bridges():
+    print("\n=== Testing CSR Graph (Bridges) ===")
+
+    graph = UndirectedGraph()
+    for label in ["A", "B", "C", "D", "E", "F"]:
+        graph.add_node(label)
+
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "C")
+    graph.add_edge("C", "A")
+    graph.add_edge("C", "D")
+    graph.add_edge("D", "E")
+    graph.add_edge("E", "F")
+
+    csr = CSRGraph.from_graph(graph)
+
+    assert find_bridges(csr) == find_bridges(graph)
+    print(f"Bridges: {find_bridges(csr)}")
+
+def test_csr_weighted():
+    print("\n=== Testing CSR Graph (Weighted) ===")
+
+    graph = WeightedGraph()
+    for label in ["A", "B", "C", "D"]:
+        graph.add_node(label)
+
+    graph.add_edge("A", "B", 4.0)
+    graph.add_edge("A", "C", 2.0)
+    graph.add_edge("C", "D", 5.0)
+    graph.add_edge("B", "D", 1.0)
+
+    csr = CSRGraph.from_graph(graph)
+
+    assert dijkstra(csr, "A") == dijkstra(graph, "A")
+    for dist_info in dijkstra(csr, "A"):
+        print(f"  A -> {dist_info.node}: {dist_info.distance}")
+
+    mst = kruskal(csr)
+    assert sum(edge.weight for edge in mst) == sum(edge.weight for edge in kruskal(graph))
+    print(f"MST weight: {sum(edge.weight for edge in mst)}")
+
+    print(f"CSR bytes: {csr.nbytes()} for {csr.edge_count()} edges")
+
+def test_csr_transpose():
+    print("\n=== Testing CSR Transpose ===")
+
+    rng = random.Random(4)
+    for weighted in (False, True):
+        graph = WeightedGraph() if weighted else DirectedGraph()
+        for i in range(60):
+            graph.add_node(str(i))
+        for _ in range(400):
+            a, b = rng.randrange(60), rng.randrange(60)
+            if weighted:
+                graph.add_directed_edge(str(a), str(b), rng.randint(1, 9))
+            else:
+                graph.add_edge(str(a), str(b))
+
+        csr = CSRGraph.from_graph(graph)
+        assert (csr.weights is None) == (not weighted)
+        reverse = csr.transpose()
+        assert reverse.edge_count() == csr.edge_count() and (reverse.weights is None) == (not weighted)
+
+        # Each reversed row lists its edges by original source, in original edge order
+        expected = [[] for _ in range(csr.node_count())]
+        for source in range(csr.node_count()):
+            for target, weight in zip(csr.neighbors(source), csr.edge_weights(source)):
+                expected[target].append((source, weight))
+        for node in range(csr.node_count()):
+            assert list(zip(reverse.neighbors(node), reverse.edge_weights(node))) == expected[node]
+        # Transposing back gives the original rows, sorted by target
+        back = reverse.transpose()
+        assert all(list(back.neighbors(node)) == sorted(csr.neighbors(node)) for node in range(csr.node_count()))
+    print("Transposed rows match a brute-force reversal")
+
+if __name__ == "__main__":
+    test_csr_directed()
+    test_csr_undirected_bridges()
+    test_csr_weighted()
+    test_csr_transpose()
+    print("\n✅ All tests completed!")
@@ -4,8 +4,12 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import random
+import subprocess
 from weighted_graph import WeightedGraph
-from algorithms.dijkstra import dijkstra
+from csr_graph import CSRGraph
+from algorithms import Instrumentation
+from algorithms.dijkstra import dijkstra, dijkstra_path, bidirectional_dijkstra, astar
 
 def test_dijkstra_basic():
     print("=== Testing Dijkstra's Algorithm ===\n")
@@ -83,8 +87,117 @@ def test_error_cases():
     for dist_info in result:
         print(f"  A -> {dist_info.node}: {dist_info.distance}")
 
+def test_point_to_point():
+    print("\n=== Testing Point-to-Point Queries ===")
+    
+    graph = WeightedGraph()
+    nodes = ["S", "A", "B", "C", "D", "T"]
+    for node in nodes:
+        graph.add_node(node)
+    
+    edges = [
+        ("S", "A", 7), ("S", "B", 2), ("S", "C", 3),
+        ("A", "B", 3), ("A", "D", 4),
+        ("B", "D", 4), ("B", "T", 1),
+        ("C", "A", 2), ("C", "T", 5),
+        ("D", "T", 1)
+    ]
+    
+    for from_node, to_node, weight in edges:
+        graph.add_directed_edge(from_node, to_node, weight)
+    
+    # Straight-line guesses that never overestimate the remaining cost
+    estimates = {"S": 2, "A": 2, "B": 1, "C": 2, "D": 1, "T": 0}
+    
+    for name, result in [
+        ("dijkstra_path", dijkstra_path(graph, "S", "T")),
+        ("bidirectional", bidirectional_dijkstra(graph, "S", "T")),
+        ("astar", astar(graph, "S", "T", lambda node, target: estimates[node])),
+    ]:
+        print(f"  {name}: {result.path} ({result.distance})")
+        assert result.distance == 3
+        assert result.path == ["S", "B", "T"]
+    
+    unreachable = dijkstra_path(graph, "T", "S")
+    print(f"  T -> S: {unreachable.path} ({unreachable.distance})")
+    assert unreachable.path == []
+
+def test_radix_queue():
+    print("\n=== Testing Radix Queue for Integer Weights ===")
+    
+    rng = random.Random(7)
+    graph = WeightedGraph.from_edge_list([(str(rng.randrange(200)), str(rng.randrange(200)), float(rng.randrange(50)))
+                                          for _ in range(1000)], directed=True)
+    
+    for target in (graph, CSRGraph.from_graph(graph)):
+        expected = [(d.node, d.distance) for d in dijkstra(target, "0", queue='heap')]
+        for queue in ('radix', 'auto'):
+            assert [(d.node, d.distance) for d in dijkstra(target, "0", queue=queue)] == expected
+    print(f"  heap, radix and auto agree on {len(expected)} distances")
+    
+    # The weight check is cached until the graph changes
+    misses = graph.result_cache.stats.misses
+    dijkstra(graph, "0", queue='auto')
+    assert graph.result_cache.stats.misses == misses
+    assert [(d.node, d.distance) for d in dijkstra(graph, "0")] == expected
+    
+    graph.add_directed_edge("0", "1", 0.5)
+    try:
+        dijkstra(graph, "0", queue='radix')
+        assert False, "expected ValueError"
+    except ValueError as error:
+        print(f"  {error}")
+
+def test_negative_edge():
+    print("\n=== Testing Negative Edge ===")
+    
+    # A settled node must not be queued again, or the search never ends
+    graph = WeightedGraph()
+    graph.add_node("A")
+    graph.add_node("B")
+    graph.add_undirected_edge("A", "B", -1)
+    
+    for target in (graph, CSRGraph.from_graph(graph)):
+        for queue in ('auto', 'heap'):
+            result = [(d.node, d.distance) for d in dijkstra(target, "A", queue=queue)]
+            print(f"  {queue}: {result}")
+            assert result == [("B", -1)]
+
+def test_queue_compaction():
+    print("\n=== Testing Queue Compaction ===")
+    
+    # Edges listed from the dearest down, so nodes keep getting shorter paths and stale entries pile up
+    n = 40
+    edges = [(str(i), str(j), float(3 * (j - i) ** 2 + (n - j))) for i in range(n) for j in range(i + 1, n)]
+    edges.sort(key=lambda edge: -edge[2])
+    graph = WeightedGraph.from_edge_list(edges, directed=True)
+    
+    with Instrumentation() as run:
+        for target in (graph, CSRGraph.from_graph(graph)):
+            result = [(d.node, d.distance) for d in dijkstra(target, "0", queue='heap')]
+            assert result == [(d.node, d.distance) for d in dijkstra(target, "0", queue='radix')]
+    
+    for stats in run.calls:
+        print(f"  pushed {stats.heap_pushes}, popped {stats.heap_pops}, {stats.decrease_keys} keys lowered")
+        # Entries never popped were dropped by compaction
+        assert stats.heap_pushes > stats.heap_pops
+        assert stats.heap_pushes == n + stats.decrease_keys
+
+def test_import_without_heap_path():
+    print("\n=== Testing Import Without the Heap Directory on sys.path ===")
+    
+    graph_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    code = "from algorithms.dijkstra import dijkstra; from algorithms.dynamic_sssp import DynamicShortestPaths"
+    completed = subprocess.run([sys.executable, "-c", code], cwd=graph_dir, capture_output=True, text=True)
+    assert completed.returncode == 0, completed.stderr
+
 if __name__ == "__main__":
     test_dijkstra_basic()
     test_dijkstra_complex()
     test_error_cases()
+    test_point_to_point()
+    test_radix_queue()
+    test_negative_edge()
+    test_queue_compaction()
+    test_import_without_heap_path()
     print("\n✅ All tests completed!")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from collections import Counter
+from undirected_graph import UndirectedGraph
+from algorithms.articulation_bridges import find_bridges
+from algorithms.articulation_points import find_articulation_points
+from algorithms.dynamic_bridges import DynamicBridges
+
+def component_count(nodes, links: Counter, skip_node=None, skip_link=None) -> int:
+    adjacency = {node: [] for node in nodes if node != skip_node}
+    for pair, count in links.items():
+        if not count or (pair == skip_link and count == 1):
+            continue
+        a, b = pair
+        if skip_node in (a, b):
+            continue
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+    
+    seen = set()
+    components = 0
+    for start in adjacency:
+        if start in seen:
+            continue
+        components += 1
+        seen.add(start)
+        stack = [start]
+        while stack:
+            for neighbor in adjacency[stack.pop()]:
+                if neighbor not in seen:
+                    seen.add(neighbor)
+                    stack.append(neighbor)
+    return components
+
+def check_against_brute_force(nodes, links: Counter, bridges: DynamicBridges):
+    base = component_count(nodes, links)
+    expected_bridges = {pair for pair, count in links.items() if count and component_count(nodes, links, skip_link=pair) > base}
+    # Removing an isolated node takes its own component with it
+    linked = {node for pair, count in links.items() if count for node in pair}
+    expected_points = {node for node in linked if component_count(nodes, links, skip_node=node) > base}
+    
+    assert {frozenset(bridge) for bridge in bridges.bridges()} == expected_bridges
+    assert set(bridges.articulation_points()) == expected_points
+    for pair in links:
+        a, b = pair
+        assert bridges.is_bridge(a, b) == (pair in expected_bridges)
+
+def test_static_graph():
+    print("=== Testing Bridges and Articulation Points ===\n")
+    
+    # Square A-B-C-D with a tail D-E-F
+    graph = UndirectedGraph.from_edge_list([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A"), ("D", "E"), ("E", "F")])
+    bridges = DynamicBridges(graph)
+    print(f"Bridges: {bridges.bridges()}")
+    print(f"Articulation points: {bridges.articulation_points()}")
+    assert {frozenset(bridge) for bridge in bridges.bridges()} == {frozenset(bridge) for bridge in find_bridges(graph)}
+    assert set(bridges.articulation_points()) == set(find_articulation_points(graph)) == {"D", "E"}
+    
+    bridges.add_link("F", "A")
+    print(f"After linking F-A: bridges {bridges.bridges()}, points {bridges.articulation_points()}")
+    assert bridges.bridges() == [] and bridges.articulation_points() == []
+    
+    bridges.remove_link("A", "B")
+    print(f"After removing A-B: bridges {sorted(map(sorted, bridges.bridges()))}")
+    assert {frozenset(bridge) for bridge in bridges.bridges()} == {frozenset(("B", "C")), frozenset(("C", "D"))}
+    assert bridges.is_bridge("C", "B") and not bridges.is_bridge("A", "F")
+    assert set(bridges.articulation_points()) == {"C", "D"}
+    
+    bridges.remove_link("A", "X")
+
+def test_random_updates():
+    print("\n=== Testing Random Link Changes ===")
+    
+    rng = random.Random(12)
+    for trial in range(6):
+        n = 18
+        nodes = list(range(n))
+        links: Counter = Counter()
+        graph = UndirectedGraph()
+        for node in nodes:
+            graph.add_node(node)
+        for _ in range(20):
+            a, b = rng.sample(nodes, 2)
+            graph.add_edge(a, b)
+            links[frozenset((a, b))] += 1
+        
+        bridges = DynamicBridges(graph)
+        check_against_brute_force(nodes, links, bridges)
+        for step in range(150):
+            present = [pair for pair, count in links.items() if count]
+            if present and rng.random() < 0.5:
+                a, b = rng.choice(present)
+                if rng.random() < 0.5:
+                    a, b = b, a
+                bridges.remove_link(a, b)
+                links[frozenset((a, b))] -= 1
+            else:
+                a, b = rng.sample(nodes, 2)
+                bridges.add_link(a, b)
+                links[frozenset((a, b))] += 1
+            check_against_brute_force(nodes, links, bridges)
+    print("  900 random additions and removals match a brute-force check")
+
+if __name__ == "__main__":
+    test_static_graph()
+    test_random_updates()
+    print("\n✅ All tests completed!")
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from weighted_graph import WeightedGraph
+from algorithms.dijkstra import dijkstra
+from algorithms.dynamic_sssp import DynamicShortestPaths
+
+def check_against_dijkstra(graph: WeightedGraph, paths: DynamicShortestPaths):
+    expected = {d.node: d.distance for d in dijkstra(graph, paths.source, queue='heap')}
+    expected[paths.source] = 0
+    for label, distance in paths.distances.items():
+        assert distance == expected[label] or abs(distance - expected[label]) < 1e-9, \
+            f"{label}: {distance} != {expected[label]}"
+
+    # Every tree edge must be a tight edge that still exists
+    for label, parent in paths.parents.items():
+        if parent is None:
+            assert label == paths.source or paths.distances[label] == float('inf')
+            continue
+        weight = min(edge.weight for edge in graph.nodes[parent].edges if edge.to_node.label == label)
+        assert abs(paths.distances[parent] + weight - paths.distances[label]) < 1e-9
+
+def test_dynamic_sssp_basic():
+    print("=== Testing Dynamic Shortest Paths ===\n")
+    
+    graph = WeightedGraph()
+    for label in "ABCDE":
+        graph.add_node(label)
+    graph.add_directed_edge("A", "B", 1.0)
+    graph.add_directed_edge("B", "C", 1.0)
+    graph.add_directed_edge("A", "C", 5.0)
+    graph.add_directed_edge("C", "D", 1.0)
+    
+    paths = DynamicShortestPaths(graph, "A")
+    print(f"Initial: {paths.shortest_path('D')}")
+    assert paths.shortest_path("D").path == ["A", "B", "C", "D"]
+    assert paths.distance("D") == 3.0
+    assert paths.distance("E") == float('inf')
+    
+    # Making the tree edge dearer moves C and D onto the direct edge
+    paths.set_edge_weight("B", "C", 10.0, directed=True)
+    print(f"After B->C = 10: {paths.shortest_path('D')}")
+    assert paths.shortest_path("D").path == ["A", "C", "D"]
+    assert paths.distance("D") == 6.0
+    
+    paths.add_edge("B", "D", 0.5, directed=True)
+    print(f"After adding B->D = 0.5: {paths.shortest_path('D')}")
+    assert paths.distance("D") == 1.5 and paths.parents["D"] == "B"
+    
+    paths.remove_edge("A", "C", directed=True)
+    print(f"After removing A->C: {paths.shortest_path('C')}")
+    assert paths.distance("C") == 11.0
+    
+    paths.remove_edge("A", "B", directed=True)
+    print(f"After removing A->B: {paths}")
+    assert all(paths.distance(label) == float('inf') for label in "BCDE")
+    assert paths.shortest_path("D").path == []
+    
+    paths.add_edge("A", "E", 2.0, directed=True)
+    paths.add_edge("E", "B", 2.0, directed=True)
+    assert paths.shortest_path("D").path == ["A", "E", "B", "D"]
+    check_against_dijkstra(graph, paths)
+
+def test_random_updates():
+    print("\n=== Testing Random Update Sequences ===")
+    
+    rng = random.Random(11)
+    for directed in (True, False):
+        n = 150
+        graph = WeightedGraph.from_edge_list([(str(rng.randrange(n)), str(rng.randrange(n)), float(rng.randrange(1, 20)))
+                                              for _ in range(400)], directed=directed)
+        paths = DynamicShortestPaths(graph, "0")
+        labels = list(graph.nodes)
+        
+        for step in range(300):
+            node = graph.nodes[rng.choice(labels)]
+            operation = rng.random()
+            if operation < 0.3 or not node.edges:
+                paths.add_edge(node.label, rng.choice(labels), float(rng.randrange(1, 20)), directed=directed)
+            elif operation < 0.6:
+                to_label = rng.choice(node.edges).to_node.label
+                paths.remove_edge(node.label, to_label, directed=directed)
+            else:
+                to_label = rng.choice(node.edges).to_node.label
+                paths.set_edge_weight(node.label, to_label, float(rng.randrange(1, 20)), directed=directed)
+            check_against_dijkstra(graph, paths)
+        
+        print(f"  {'directed' if directed else 'undirected'}: 300 updates match a full recompute ({paths})")
+
+def test_error_cases():
+    print("\n=== Testing Error Cases ===")
+    
+    graph = WeightedGraph()
+    graph.add_node("A")
+    paths = DynamicShortestPaths(graph, "X")
+    assert paths.distance("A") == float('inf')
+    
+    paths = DynamicShortestPaths(graph, "A")
+    paths.remove_edge("A", "B")
+    paths.set_edge_weight("A", "A", 3.0)
+    assert paths.distances == {"A": 0}
+
+if __name__ == "__main__":
+    test_dynamic_sssp_basic()
+    test_random_updates()
+    test_error_cases()
+    print("\n✅ All tests completed!")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from directed_graph import DirectedGraph
+from undirected_graph import UndirectedGraph
+from graph_generators import erdos_renyi, grid, power_law, deep_chain
+from algorithms import find_bridges
+
+def test_shapes():
+    print("=== Testing Generator Shapes ===\n")
+
+    edges = erdos_renyi(1000, average_degree=6, seed=3)
+    links = {(a, b) for a, b, _ in edges}
+    print(f"Erdos-Renyi: {len(edges)} edges")
+    assert len(edges) == 3000 and len(links) == 3000
+    assert all(a != b for a, b in links)
+
+    edges = grid(100)
+    print(f"Grid: {len(edges)} edges")
+    assert len(edges) == 2 * 10 * 9
+
+    edges = power_law(1000, edges_per_node=3, seed=3)
+    degree = {}
+    for a, b, _ in edges:
+        degree[a] = degree.get(a, 0) + 1
+        degree[b] = degree.get(b, 0) + 1
+    print(f"Power law: {len(edges)} edges, max degree {max(degree.values())}")
+    assert len(edges) == 3 * (1000 - 3)
+    assert max(degree.values()) > 10 * len(edges) * 2 // len(degree)
+
+    edges = deep_chain(50)
+    graph = UndirectedGraph.from_edge_list(edges)
+    assert len(edges) == 49 and len(find_bridges(graph)) == 49
+
+    for bad in (lambda: erdos_renyi(1), lambda: power_law(2, edges_per_node=2)):
+        try:
+            bad()
+            assert False, "Expected ValueError"
+        except ValueError as error:
+            print(f"Rejected: {error}")
+
+def test_seeds_and_orientation():
+    print("\n=== Testing Seeds and Orientation ===")
+
+    assert erdos_renyi(500, seed=7) == erdos_renyi(500, seed=7)
+    assert power_law(500, seed=7) != power_law(500, seed=8)
+
+    for edges in (erdos_renyi(500, seed=7), grid(400, seed=7), power_law(500, seed=7), deep_chain(500)):
+        assert all(int(a) < int(b) for a, b, _ in edges)
+        assert not DirectedGraph.from_edge_list(edges).detect_cycle()
+    print("Every generated edge points from the smaller id to the larger")
+
+if __name__ == "__main__":
+    test_shapes()
+    test_seeds_and_orientation()
+    print("\n✅ All tests completed!")
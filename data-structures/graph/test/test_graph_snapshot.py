@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weighted_graph import WeightedGraph
+from directed_graph import DirectedGraph
+from csr_graph import CSRGraph
+from graph_snapshot import save_snapshot, load_snapshot
+from algorithms import dfs, find_scss
+from algorithms.dijkstra import dijkstra
+
+def test_weighted_round_trip():
+    print("=== Testing Weighted Snapshot Round Trip ===\n")
+
+    graph = WeightedGraph()
+    for label in ["A", "B", "C", "D"]:
+        graph.add_node(label)
+
+    graph.add_directed_edge("A", "B", 4.0)
+    graph.add_directed_edge("A", "C", 2.0)
+    graph.add_directed_edge("C", "D", 5.0)
+    graph.add_directed_edge("B", "D", 1.0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.snap")
+        save_snapshot(graph, path)
+        snapshot = load_snapshot(path)
+
+        print(f"Loaded {snapshot}")
+        assert list(snapshot.labels) == ["A", "B", "C", "D"]
+        assert snapshot.get_id("C") == 2
+        assert snapshot.get_id("X") is None
+        assert dijkstra(snapshot, "A") == dijkstra(graph, "A")
+        for dist_info in dijkstra(snapshot, "A"):
+            print(f"  A -> {dist_info.node}: {dist_info.distance}")
+
+        # Views are released before the temporary file is removed
+        del snapshot
+
+def test_unweighted_round_trip():
+    print("\n=== Testing Unweighted Snapshot Round Trip ===")
+
+    graph = DirectedGraph()
+    for label in ["zeta", "alpha", "mu"]:
+        graph.add_node(label)
+    graph.add_edge("zeta", "alpha")
+    graph.add_edge("alpha", "zeta")
+    graph.add_edge("alpha", "mu")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "graph.snap")
+        save_snapshot(graph, path)
+        snapshot = load_snapshot(path)
+
+        assert snapshot.weights is None
+        assert dfs(snapshot) == dfs(CSRGraph.from_graph(graph))
+        assert find_scss(snapshot) == find_scss(graph)
+        print(f"SCCs: {find_scss(snapshot)}")
+        del snapshot
+
+if __name__ == "__main__":
+    test_weighted_round_trip()
+    test_unweighted_round_trip()
+    print("\n✅ All tests completed!")
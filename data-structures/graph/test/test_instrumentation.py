@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+import threading
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from undirected_graph import UndirectedGraph
+from directed_graph import DirectedGraph
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from algorithms import dfs, bfs, topological_sort, find_scss, find_condensation, find_bridges, Instrumentation
+from algorithms.articulation_points import find_articulation_points
+from algorithms.dijkstra import dijkstra, dijkstra_path, astar, bidirectional_dijkstra
+
+def shortcut_graph() -> WeightedGraph:
+    # B is first reached at 10, then at 2 through C
+    graph = WeightedGraph()
+    for label in "ABC":
+        graph.add_node(label)
+    graph.add_directed_edge("A", "B", 10)
+    graph.add_directed_edge("A", "C", 1)
+    graph.add_directed_edge("C", "B", 1)
+    return graph
+
+def test_traversal_counts():
+    print("=== Testing Traversal Counts ===\n")
+
+    graph = UndirectedGraph.from_edge_list([("A", "B"), ("B", "C")])
+    graph.add_node("D")
+    directed = DirectedGraph.from_edge_list([("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")])
+
+    with Instrumentation() as run:
+        dfs(graph)
+        bfs(graph, "A")
+        bfs(CSRGraph.from_graph(graph), "A")
+        find_bridges(graph)
+        find_articulation_points(graph)
+        topological_sort(DirectedGraph.from_edge_list([("A", "B"), ("B", "C")]))
+        find_scss(directed)
+        find_scss(directed, method='tarjan')
+        find_condensation(CSRGraph.from_graph(directed))
+
+    for stats in run.calls:
+        print(stats)
+
+    counts = [(stats.algorithm, stats.nodes_visited, stats.edges_scanned) for stats in run.calls]
+    assert counts == [('dfs', 4, 4), ('bfs', 3, 4), ('bfs', 3, 4), ('find_bridges', 4, 4),
+                      ('find_articulation_points', 4, 4), ('topological_sort', 3, 2),
+                      ('find_scss', 8, 8), ('find_scss', 4, 4), ('find_condensation', 4, 8)]
+    assert list(run.calls[0].phases) == ['node_states', 'search']
+    assert list(run.calls[5].phases) == ['cycle_check', 'node_states', 'search']
+    assert list(run.calls[6].phases) == ['finish_order', 'transpose', 'components']
+    assert all(stats.heap_pushes == 0 for stats in run.calls)
+
+def test_shortest_path_counts():
+    print("\n=== Testing Shortest Path Counts ===")
+
+    graph = shortcut_graph()
+    with Instrumentation() as run:
+        dijkstra(graph, "A", queue='heap')
+        dijkstra(graph, "A", queue='radix')
+        dijkstra(CSRGraph.from_graph(graph), "A", queue='heap')
+        dijkstra_path(graph, "A", "B")
+        astar(graph, "A", "B", lambda label, target: 0)
+        bidirectional_dijkstra(graph, "A", "B")
+
+    for stats in run.calls:
+        print(stats.as_dict())
+
+    heap, radix, csr, path, guided, both = run.calls
+    # Both queues lower B's key by pushing B again and skip the old entry
+    assert (heap.nodes_visited, heap.edges_scanned, heap.heap_pushes, heap.heap_pops, heap.stale_pops) == (3, 3, 4, 4, 1)
+    assert (radix.nodes_visited, radix.edges_scanned, radix.heap_pushes, radix.heap_pops, radix.stale_pops) == (3, 3, 4, 4, 1)
+    assert (heap.decrease_keys, radix.decrease_keys, csr.decrease_keys) == (1, 1, 1)
+    assert csr.as_dict()['edges_scanned'] == 3 and csr.heap_pops == 4
+    assert list(heap.phases) == ['init', 'search', 'result']
+    assert list(radix.phases) == ['weight_check', 'init', 'search', 'result']
+
+    # Stops on popping B, whose edges are never scanned
+    assert (path.algorithm, path.nodes_visited, path.edges_scanned, path.heap_pushes) == ('dijkstra_path', 3, 3, 3)
+    assert path.decrease_keys == 1
+    assert guided.algorithm == 'astar' and guided.nodes_visited == 3
+    assert both.algorithm == 'bidirectional_dijkstra' and list(both.phases)[0] == 'transpose'
+    assert both.nodes_visited == both.heap_pops > 0
+
+def test_callback_and_scope():
+    print("\n=== Testing Callback and Scope ===")
+
+    graph = shortcut_graph()
+    exported = []
+    with Instrumentation(lambda stats: exported.append(stats.as_dict())) as outer:
+        with Instrumentation() as inner:
+            dijkstra(graph, "A")
+        dfs(graph)
+
+    # Calls outside any block are not recorded anywhere
+    dijkstra(graph, "A")
+
+    print(f"Exported: {[row['algorithm'] for row in exported]}")
+    assert [row['algorithm'] for row in exported] == ['dijkstra', 'dfs']
+    assert len(inner.calls) == 1 and len(outer.calls) == 2
+    assert exported[0]['phases'] and all(seconds >= 0 for seconds in exported[0]['phases'].values())
+
+    with Instrumentation() as run:
+        dijkstra(graph, "A")
+        dijkstra(graph, "C")
+    totals = run.totals()
+    print(f"Totals: {totals['dijkstra']}")
+    assert totals['dijkstra'].nodes_visited == 3 + 2
+    assert abs(totals['dijkstra'].seconds() - sum(stats.seconds() for stats in run.calls)) < 1e-9
+
+def test_threads():
+    print("\n=== Testing Threads ===")
+
+    graph = shortcut_graph()
+    inner_calls = []
+
+    def work():
+        with Instrumentation() as inner:
+            dijkstra(graph, "C")
+        inner_calls.extend(stats.algorithm for stats in inner.calls)
+
+    with Instrumentation() as run:
+        # Neither a bare call nor a block in another thread shows up here
+        for target in (lambda: dijkstra(graph, "A"), work):
+            worker = threading.Thread(target=target)
+            worker.start()
+            worker.join()
+        dfs(graph)
+
+    print(f"Recorded here: {[stats.algorithm for stats in run.calls]}, in the worker: {inner_calls}")
+    assert [stats.algorithm for stats in run.calls] == ['dfs']
+    assert inner_calls == ['dijkstra']
+
+if __name__ == "__main__":
+    test_traversal_counts()
+    test_shortest_path_counts()
+    test_callback_and_scope()
+    test_threads()
+    print("\n✅ All tests completed!")
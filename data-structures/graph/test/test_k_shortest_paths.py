@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from algorithms.k_shortest_paths import KShortestPaths, k_shortest_paths
+
+def all_simple_paths(graph, source, target):
+    """Every loopless path with its cost, cheapest first"""
+    weights = {}
+    for node in graph.get_nodes():
+        for edge in node.get_edges():
+            pair = (node.label, edge.to_node.label)
+            weights[pair] = min(weights.get(pair, float('inf')), edge.weight)
+
+    paths = []
+    def extend(path, cost):
+        if path[-1] == target:
+            paths.append((cost, path[:]))
+            return
+        for (from_label, to_label), weight in weights.items():
+            if from_label == path[-1] and to_label not in path:
+                path.append(to_label)
+                extend(path, cost + weight)
+                path.pop()
+    extend([source], 0)
+    return sorted(paths)
+
+def test_yen_example():
+    print("=== Testing Yen's Example ===\n")
+
+    graph = WeightedGraph()
+    for label in "CDEFGH":
+        graph.add_node(label)
+    for from_label, to_label, weight in [("C", "D", 3), ("C", "E", 2), ("D", "F", 4), ("E", "D", 1), ("E", "F", 2),
+                                         ("E", "G", 3), ("F", "G", 2), ("F", "H", 1), ("G", "H", 2)]:
+        graph.add_directed_edge(from_label, to_label, weight)
+
+    paths = k_shortest_paths(graph, "C", "H", 3)
+    for path in paths:
+        print(f"{path.distance}: {' -> '.join(path.path)}")
+
+    assert [path.distance for path in paths] == [5, 7, 8]
+    assert paths[0].path == ["C", "E", "F", "H"]
+    assert paths[1].path == ["C", "E", "G", "H"]
+    assert paths[2].path in (["C", "D", "F", "H"], ["C", "E", "D", "F", "H"])
+
+    # Fewer paths than asked for when the graph runs out
+    assert len(k_shortest_paths(graph, "C", "H", 100)) == len(all_simple_paths(graph, "C", "H"))
+    assert k_shortest_paths(graph, "H", "C", 3) == []
+    assert k_shortest_paths(graph, "C", "C", 3)[0].path == ["C"]
+
+def test_against_brute_force():
+    print("\n=== Testing Against Brute Force ===")
+
+    rng = random.Random(5)
+    for trial in range(200):
+        n = rng.randint(2, 8)
+        graph = WeightedGraph()
+        for i in range(n):
+            graph.add_node(str(i))
+        directed = trial % 2 == 0
+        for _ in range(rng.randint(1, 16)):
+            a, b = rng.sample(range(n), 2)
+            weight = rng.choice([1, 2, 3, 1.5])
+            if directed:
+                graph.add_directed_edge(str(a), str(b), weight)
+            else:
+                graph.add_undirected_edge(str(a), str(b), weight)
+
+        source, target = str(rng.randrange(n)), str(rng.randrange(n))
+        k = rng.randint(1, 20)
+        expected = all_simple_paths(graph, source, target)[:k]
+        paths = k_shortest_paths(CSRGraph.from_graph(graph) if trial % 3 == 0 else graph, source, target, k)
+
+        assert [path.distance for path in paths] == [cost for cost, _ in expected], trial
+        assert len({tuple(path.path) for path in paths}) == len(paths)
+        assert all(len(set(path.path)) == len(path.path) for path in paths)
+    print("200 random graphs match")
+
+def test_engine_reuse_and_errors():
+    print("\n=== Testing Engine Reuse and Errors ===")
+
+    graph = WeightedGraph.from_edge_list([("A", "B", 1), ("B", "D", 1), ("A", "C", 2), ("C", "D", 2)])
+    engine = KShortestPaths(graph)
+    assert [path.distance for path in engine.paths("A", "D", 5)] == [2, 4]
+
+    # Changing the graph is picked up on the next query
+    graph.add_undirected_edge("A", "D", 3)
+    paths = engine.paths("A", "D", 5)
+    print(f"After adding A-D: {[(path.distance, path.path) for path in paths]}")
+    assert [path.distance for path in paths] == [2, 3, 4]
+
+    assert engine.paths("A", "Z", 2) == []
+    for bad in (lambda: engine.paths("A", "D", 0),
+                lambda: k_shortest_paths(WeightedGraph.from_edge_list([("A", "B", -1)]), "A", "B", 1)):
+        try:
+            bad()
+            assert False, "Expected ValueError"
+        except ValueError as error:
+            print(f"Rejected: {error}")
+
+if __name__ == "__main__":
+    test_yen_example()
+    test_against_brute_force()
+    test_engine_reuse_and_errors()
+    print("\n✅ All tests completed!")
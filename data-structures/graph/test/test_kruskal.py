@@ -4,7 +4,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import multiprocessing
+import random
 from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
 from algorithms.kruskal import kruskal
 
 def test_kruskal():
@@ -46,7 +49,49 @@ def test_kruskal():
     for edge in result:
         print(f"  {edge.from_node} --({edge.weight})-> {edge.to_node}")
 
+def test_mst_methods():
+    print("\n=== Testing Filter-Kruskal and Boruvka ===")
+
+    rng = random.Random(3)
+    graph = WeightedGraph()
+    for i in range(300):
+        graph.add_node(str(i))
+    # Integer weights produce plenty of ties
+    graph.add_edges_from([(str(rng.randrange(300)), str(rng.randrange(300)), float(rng.randrange(20)))
+                          for _ in range(6000)])
+
+    for target in (graph, CSRGraph.from_graph(graph)):
+        expected = [(edge.from_node.label, edge.to_node.label, edge.weight) for edge in kruskal(target)]
+        for method, workers in (('filter', None), ('boruvka', None), ('boruvka', 2)):
+            result = [(edge.from_node.label, edge.to_node.label, edge.weight)
+                      for edge in kruskal(target, method, workers)]
+            print(f"  {type(target).__name__} {method} workers={workers}: weight {sum(edge[2] for edge in result)}")
+            assert result == expected
+
+    try:
+        kruskal(graph, 'prim')
+        assert False, "expected ValueError"
+    except ValueError as error:
+        print(f"  {error}")
+
+def test_boruvka_spawn():
+    print("\n=== Testing Boruvka Workers Under Spawn ===")
+
+    # spawn (the macOS and Windows default) pickles the pool's initializer arguments
+    graph = WeightedGraph.from_edge_list([("A", "B", 1), ("B", "C", 2), ("A", "C", 3), ("C", "D", 1)])
+    start_method = multiprocessing.get_start_method()
+    multiprocessing.set_start_method('spawn', force=True)
+    try:
+        for target in (graph, CSRGraph.from_graph(graph)):
+            result = [(edge.from_node.label, edge.to_node.label, edge.weight)
+                      for edge in kruskal(target, 'boruvka', workers=2)]
+            print(f"  {type(target).__name__}: {result}")
+            assert sorted(edge[2] for edge in result) == [1, 1, 2]
+    finally:
+        multiprocessing.set_start_method(start_method, force=True)
 
 if __name__ == "__main__":
     test_kruskal()
+    test_mst_methods()
+    test_boruvka_spawn()
     print("\n✅ All tests completed!")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+import tempfile
+from weighted_graph import WeightedGraph
+from csr_graph import CSRGraph
+from graph_generators import grid
+from algorithms import Instrumentation
+from algorithms.dijkstra import dijkstra, dijkstra_path, astar, alt_path
+from algorithms.landmarks import LandmarkOracle
+
+def random_graph(n: int, edges: int, directed: bool, seed: int) -> WeightedGraph:
+    rng = random.Random(seed)
+    graph = WeightedGraph()
+    for i in range(n):
+        graph.add_node(str(i))
+    for _ in range(edges):
+        a, b = rng.sample(range(n), 2)
+        if directed:
+            graph.add_directed_edge(str(a), str(b), rng.randint(1, 20))
+        else:
+            graph.add_undirected_edge(str(a), str(b), rng.randint(1, 20))
+    return graph
+
+def assert_bounds(graph: WeightedGraph, oracle: LandmarkOracle):
+    for source in graph.get_nodes():
+        for dist_info in dijkstra(graph, source.label):
+            lower = oracle.lower_bound(source.label, dist_info.node)
+            upper = oracle.upper_bound(source.label, dist_info.node)
+            assert lower <= dist_info.distance <= upper, (source.label, dist_info.node, lower, upper)
+
+def test_bounds():
+    print("=== Testing Distance Bounds ===\n")
+
+    for trial in range(20):
+        directed = trial % 2 == 1
+        # Sparse enough that some pairs are disconnected
+        graph = random_graph(30, 35, directed, trial)
+        oracle = LandmarkOracle.build(graph, landmarks=4, seed=trial)
+        assert len(set(oracle.landmarks)) == len(oracle.landmarks)
+        assert (oracle.backward is not None) == directed
+        assert_bounds(graph, oracle)
+    print("Bounds bracket every distance in 20 random graphs")
+
+    graph = WeightedGraph.from_edge_list([("A", "B", 1), ("B", "C", 2), ("C", "D", 3)])
+    oracle = LandmarkOracle.build(graph, landmarks=2)
+    print(f"{oracle}: landmarks {oracle.landmark_labels()}")
+    # The ends of a path are farthest apart, and bounds through them are exact
+    assert sorted(oracle.landmark_labels()) == ["A", "D"]
+    assert oracle.lower_bound("B", "D") == oracle.upper_bound("B", "D") == 5
+
+    # More landmarks than nodes stops once every node is one
+    assert len(LandmarkOracle.build(graph, landmarks=10).landmarks) == 4
+    assert oracle.lower_bound("A", "Z") == float('inf')
+
+def test_alt_path():
+    print("\n=== Testing ALT Queries ===")
+
+    graph = WeightedGraph.from_edge_list(grid(2500, seed=3))
+    oracle = LandmarkOracle.build(graph, landmarks=8, seed=1)
+    csr = CSRGraph.from_graph(graph)
+    rng = random.Random(2)
+    pairs = [(str(rng.randrange(2500)), str(rng.randrange(2500))) for _ in range(20)]
+
+    with Instrumentation() as run:
+        for source, target in pairs:
+            expected = dijkstra_path(graph, source, target)
+            assert alt_path(graph, source, target, oracle).distance == expected.distance
+            assert alt_path(csr, source, target, oracle).distance == expected.distance
+            assert astar(graph, source, target, oracle.heuristic).distance == expected.distance
+
+    totals = run.totals()
+    print(f"Settled by dijkstra_path: {totals['dijkstra_path'].nodes_visited}, "
+          f"by alt_path: {totals['alt_path'].nodes_visited // 2}")
+    # alt_path ran twice per pair, on the graph and on its CSR copy
+    assert 4 * totals['alt_path'].nodes_visited < totals['dijkstra_path'].nodes_visited
+
+    result = alt_path(graph, "0", "2499", oracle)
+    assert result.path[0] == "0" and result.path[-1] == "2499"
+    assert alt_path(graph, "0", "missing", oracle).distance == float('inf')
+
+    graph.add_undirected_edge("0", "2499", 1)
+    try:
+        alt_path(graph, "0", "2499", oracle)
+        assert False, "Expected ValueError"
+    except ValueError as error:
+        print(f"Rejected: {error}")
+
+def test_save_and_load():
+    print("\n=== Testing Save / Load ===")
+
+    for directed in (False, True):
+        graph = random_graph(40, 80, directed, 9)
+        oracle = LandmarkOracle.build(graph, landmarks=5, seed=4)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "graph.alt")
+            oracle.save(path)
+            loaded = LandmarkOracle.load(path)
+
+            print(f"Loaded {loaded}")
+            assert list(loaded.landmarks) == list(oracle.landmarks)
+            assert list(loaded.forward) == list(oracle.forward)
+            assert (loaded.backward is None) == (oracle.backward is None)
+            assert_bounds(graph, loaded)
+            assert alt_path(graph, "0", "39", loaded).distance == dijkstra_path(graph, "0", "39").distance
+            # The same edges in a fresh graph match the saved fingerprint
+            copy = random_graph(40, 80, directed, 9)
+            assert loaded.matches(copy) and loaded.matches(CSRGraph.from_graph(copy))
+
+            # A graph changed since the oracle was saved is refused, not answered with a wrong distance
+            graph.add_directed_edge("0", "39", 1)
+            assert not loaded.matches(graph)
+            try:
+                alt_path(graph, "0", "39", loaded)
+                assert False, "Expected ValueError"
+            except ValueError as error:
+                print(f"Rejected: {error}")
+
+            with open(path, 'r+b') as file:
+                file.write(b'NOTANALT')
+            try:
+                LandmarkOracle.load(path)
+                assert False, "Expected ValueError"
+            except ValueError as error:
+                print(f"Rejected: {error}")
+            del loaded
+
+def test_workers_and_errors():
+    print("\n=== Testing Workers and Errors ===")
+
+    graph = random_graph(200, 600, True, 11)
+    serial = LandmarkOracle.build(graph, landmarks=6, seed=5)
+    parallel = LandmarkOracle.build(graph, landmarks=6, workers=2, seed=5)
+    assert list(parallel.landmarks) == list(serial.landmarks)
+    assert parallel.forward == serial.forward and parallel.backward == serial.backward
+    print("Two workers build the same tables as one")
+
+    for bad in (lambda: LandmarkOracle.build(graph, landmarks=0),
+                lambda: LandmarkOracle.build(graph, workers=-1),
+                lambda: LandmarkOracle.build(WeightedGraph()),
+                lambda: LandmarkOracle.build(WeightedGraph.from_edge_list([("A", "B", -1)]))):
+        try:
+            bad()
+            assert False, "Expected ValueError"
+        except ValueError as error:
+            print(f"Rejected: {error}")
+
+if __name__ == "__main__":
+    test_bounds()
+    test_alt_path()
+    test_save_and_load()
+    test_workers_and_errors()
+    print("\n✅ All tests completed!")
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from undirected_graph import UndirectedGraph
+from csr_graph import CSRGraph
+from algorithms.level_bfs import bfs_levels, connected_components
+
+def build_graph() -> UndirectedGraph:
+    graph = UndirectedGraph()
+    for label in ["A", "B", "C", "D", "E", "F", "G"]:
+        graph.add_node(label)
+
+    graph.add_edge("A", "B")
+    graph.add_edge("A", "C")
+    graph.add_edge("C", "D")
+    graph.add_edge("E", "F")
+    return graph
+
+def test_bfs_levels():
+    print("=== Testing Level-Synchronous BFS ===\n")
+
+    csr = CSRGraph.from_graph(build_graph())
+    levels = bfs_levels(csr, "A")
+    for node_id, level in enumerate(levels):
+        print(f"  {csr.get_label(node_id)}: {level}")
+
+    assert levels.tolist() == [0, 1, 1, 2, -1, -1, -1]
+
+def test_connected_components():
+    print("\n=== Testing Connected Components ===")
+
+    csr = CSRGraph.from_graph(build_graph())
+    components = connected_components(csr)
+    print(f"Component ids: {components.tolist()}")
+
+    assert components.tolist() == [0, 0, 0, 0, 1, 1, 2]
+
+if __name__ == "__main__":
+    test_bfs_levels()
+    test_connected_components()
+    print("\n✅ All tests completed!")
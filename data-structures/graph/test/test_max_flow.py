@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import random
+from itertools import combinations
+from weighted_graph import WeightedGraph
+from undirected_graph import UndirectedGraph
+from csr_graph import CSRGraph
+from algorithms.max_flow import max_flow, gomory_hu_tree
+
+def brute_force_min_cut(graph, source: str, sink: str) -> float:
+    """Cheapest cut over every split of the other nodes"""
+    others = [label for label in graph.nodes if label not in (source, sink)]
+    best = float('inf')
+    for size in range(len(others) + 1):
+        for chosen in combinations(others, size):
+            side = {source, *chosen}
+            cut = sum(getattr(edge, 'weight', 1) for label in side for edge in graph.nodes[label].get_edges()
+                      if edge.to_node.label not in side)
+            best = min(best, cut)
+    return best
+
+def test_max_flow_basic():
+    print("=== Testing Max Flow ===\n")
+    
+    graph = WeightedGraph()
+    for label in "STABCD":
+        graph.add_node(label)
+    graph.add_directed_edge("S", "A", 10)
+    graph.add_directed_edge("S", "B", 5)
+    graph.add_directed_edge("A", "B", 15)
+    graph.add_directed_edge("A", "C", 4)
+    graph.add_directed_edge("B", "D", 8)
+    graph.add_directed_edge("C", "T", 10)
+    graph.add_directed_edge("D", "C", 6)
+    graph.add_directed_edge("D", "T", 10)
+    
+    result = max_flow(graph, "S", "T")
+    print(f"Max flow S -> T: {result.value}, cut {result.cut_edges}")
+    assert result.value == 12
+    assert sorted(result.cut_edges) == [("A", "C"), ("B", "D")]
+    assert "S" in result.source_side and "T" not in result.source_side
+    
+    assert max_flow(CSRGraph.from_graph(graph), "S", "T").value == 12
+    assert max_flow(graph, "T", "S").value == 0
+    assert max_flow(graph, "S", "X").value == 0
+
+def test_against_brute_force():
+    print("\n=== Testing Against Brute-Force Cuts ===")
+    
+    rng = random.Random(8)
+    for trial in range(30):
+        graph = WeightedGraph()
+        for label in range(8):
+            graph.add_node(str(label))
+        for _ in range(16):
+            from_label, to_label = str(rng.randrange(8)), str(rng.randrange(8))
+            if trial % 2:
+                graph.add_directed_edge(from_label, to_label, float(rng.randrange(1, 10)))
+            else:
+                graph.add_undirected_edge(from_label, to_label, float(rng.randrange(1, 10)))
+        source, sink = rng.sample(list(graph.nodes), 2)
+        result = max_flow(graph, source, sink)
+        assert result.value == brute_force_min_cut(graph, source, sink), trial
+        # Parallel edges are listed once each, hence the set
+        assert sum(edge.weight for a, b in set(result.cut_edges) for edge in graph.nodes[a].edges
+                   if edge.to_node.label == b) == result.value
+    print("  30 random graphs match the cheapest cut")
+
+def test_gomory_hu_tree():
+    print("\n=== Testing Gomory-Hu Tree ===")
+    
+    rng = random.Random(4)
+    graph = WeightedGraph()
+    for label in range(25):
+        graph.add_node(str(label))
+    for _ in range(60):
+        graph.add_undirected_edge(str(rng.randrange(25)), str(rng.randrange(25)), float(rng.randrange(1, 10)))
+    
+    tree = gomory_hu_tree(graph)
+    assert len(tree.edges()) == 24
+    for a, b in combinations(graph.nodes, 2):
+        assert tree.min_cut(a, b) == max_flow(graph, a, b).value, (a, b)
+    print(f"  All {25 * 24 // 2} pairwise min cuts match a direct max flow")
+    
+    # Unweighted links: the cut counts how many links must fail
+    ring = UndirectedGraph.from_edge_list([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A"), ("D", "E")])
+    ring_tree = gomory_hu_tree(ring)
+    print(f"  Links separating A and C: {ring_tree.min_cut('A', 'C')}, A and E: {ring_tree.min_cut('A', 'E')}")
+    assert ring_tree.min_cut("A", "C") == 2 and ring_tree.min_cut("A", "E") == 1
+    assert ring_tree.min_cut("A", "X") == 0
+
+if __name__ == "__main__":
+    test_max_flow_basic()
+    test_against_brute_force()
+    test_gomory_hu_tree()
+    print("\n✅ All tests completed!")
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import importlib.util
+import random
+
+# The real-world scripts have hyphenated names, so they are loaded by path
+_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'real-world-problems',
+                       'microservice-dependency-analyzer.py')
+_spec = importlib.util.spec_from_file_location('microservice_dependency_analyzer', _SCRIPT)
+analyzer = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = analyzer
+_spec.loader.exec_module(analyzer)
+MicroserviceGraph = analyzer.MicroserviceGraph
+
+def reaches(start, goal) -> bool:
+    """Whether start depends on goal through one or more dependencies"""
+    seen = set()
+    stack = list(start.dependencies)
+    while stack:
+        service = stack.pop()
+        if service is goal:
+            return True
+        if service not in seen:
+            seen.add(service)
+            stack.extend(service.dependencies)
+    return False
+
+def assert_valid_order(graph: MicroserviceGraph):
+    assert sorted(service.name for service in graph.order) == sorted(graph.microservices)
+    for position, service in enumerate(graph.order):
+        assert graph.positions[service] == position
+        for dependency in service.dependencies:
+            assert graph.positions[dependency] < position, (service, dependency)
+
+def snapshot(graph: MicroserviceGraph):
+    return (list(graph.order), dict(graph.positions), graph.version,
+            {name: list(service.dependencies) for name, service in graph.microservices.items()})
+
+def test_online_order_against_brute_force():
+    print("=== Testing Online Deployment Order ===\n")
+
+    rejected = 0
+    for trial in range(100):
+        rng = random.Random(trial)
+        graph = MicroserviceGraph()
+        n = rng.randint(2, 15)
+        for i in range(n):
+            graph.add_microservice(f"S{i}")
+
+        for _ in range(rng.randint(1, 40)):
+            name, dependency_name = f"S{rng.randrange(n)}", f"S{rng.randrange(n)}"
+            service = graph.microservices[name]
+            dependency = graph.microservices[dependency_name]
+            creates_cycle = service is dependency or reaches(dependency, service)
+            before = snapshot(graph)
+
+            cycle = graph.add_dependency(name, dependency_name)
+
+            assert bool(cycle) == creates_cycle, (trial, name, dependency_name)
+            if cycle:
+                rejected += 1
+                # The new dependency first, then existing dependencies back to where it started
+                assert cycle[0] is service and cycle[1] is dependency and cycle[-1] is service
+                assert all(later in earlier.dependencies for earlier, later in zip(cycle[1:], cycle[2:]))
+                assert snapshot(graph) == before
+            else:
+                assert dependency in service.dependencies
+            assert_valid_order(graph)
+
+    print(f"Order valid after every insert in 100 random graphs, {rejected} cycles rejected")
+
+def test_rejected_cycle():
+    print("\n=== Testing Rejected Cycle ===")
+
+    graph = analyzer.build_microservice_graph()
+    print(f"Order: {graph.order}")
+    assert_valid_order(graph)
+    assert graph.microservices["ServiceD"].dependencies == []
+
+    before = snapshot(graph)
+    cycle = graph.add_dependency("ServiceD", "ServiceA")
+    assert [service.name for service in cycle] == ["ServiceD", "ServiceA", "ServiceB", "ServiceC", "ServiceD"]
+    assert [service.name for service in graph.add_dependency("ServiceA", "ServiceA")] == ["ServiceA", "ServiceA"]
+    assert snapshot(graph) == before
+
+    # Unknown services are reported and change nothing
+    assert graph.add_dependency("ServiceA", "Missing") == []
+    assert snapshot(graph) == before
+
+def assert_index_matches(graph: MicroserviceGraph):
+    services = list(graph.microservices.values())
+    for service in services:
+        for other in services:
+            assert graph.depends_on(service.name, other.name) == reaches(service, other), (service, other)
+
+        dependents = graph.transitive_dependents(service.name)
+        assert set(dependents) == {other for other in services if reaches(other, service)}
+        assert len(dependents) == len(set(dependents))
+        # Listed in a valid deployment order
+        listed = {dependent: position for position, dependent in enumerate(dependents)}
+        for dependent in dependents:
+            assert all(listed[dependency] < listed[dependent]
+                       for dependency in dependent.dependencies if dependency in listed and dependency is not dependent)
+
+def test_dependency_index_against_reachability():
+    print("\n=== Testing Dependency Index ===")
+
+    for trial in range(50):
+        rng = random.Random(trial)
+        graph = MicroserviceGraph()
+        n = rng.randint(2, 25)
+        for i in range(n):
+            graph.add_microservice(f"S{i}")
+        for _ in range(rng.randint(0, 40)):
+            a, b = rng.sample(range(n), 2)
+            # Only dependencies that keep the graph acyclic, so nothing is rejected
+            if not reaches(graph.microservices[f"S{b}"], graph.microservices[f"S{a}"]):
+                graph.add_dependency(f"S{a}", f"S{b}")
+        assert_index_matches(graph)
+    print("depends_on and transitive_dependents match plain reachability in 50 random graphs")
+
+def test_index_rebuild_and_cycles():
+    print("\n=== Testing Index Rebuild ===")
+
+    graph = analyzer.build_valid_microservice_graph()
+    index = graph.dependency_index()
+    print(index)
+    assert graph.depends_on("WebUI", "Database") and not graph.depends_on("Database", "WebUI")
+    assert graph.dependency_index() is index
+
+    # A new dependency bumps the version, so the next query sees it through a fresh index
+    graph.add_microservice("Cache")
+    assert not graph.depends_on("WebUI", "Cache")
+    index = graph.dependency_index()
+    graph.add_dependency("Database", "Cache")
+    assert graph.dependency_index() is not index
+    assert graph.depends_on("WebUI", "Cache")
+    assert [service.name for service in graph.transitive_dependents("WebUI")] == []
+    assert_index_matches(graph)
+
+    # Dependencies added straight on Microservice can form a cycle, which collapses into one component
+    a, b, c = (graph.microservices[name] for name in ("UserService", "OrderService", "Cache"))
+    c.add_dependency(b)
+    index = analyzer.DependencyIndex(graph)
+    assert index.depends_on("UserService", "UserService") and index.depends_on("Cache", "OrderService")
+    assert not index.depends_on("AuthService", "AuthService")
+    assert a in index.transitive_dependents("UserService")
+    assert not index.depends_on("Missing", "Cache") and index.transitive_dependents("Missing") == []
+
+def test_dependencies_added_on_microservice():
+    print("\n=== Testing Dependencies Added on Microservice ===")
+
+    # Against the order, but no cycle: the order is rebuilt
+    graph = MicroserviceGraph()
+    for name in "ABC":
+        graph.add_microservice(name)
+    graph.add_dependency("B", "C")
+    version = graph.version
+    graph.microservices["A"].add_dependency(graph.microservices["B"])
+    assert not graph.order_valid and graph.version == version + 1
+    deployment = analyzer.deploy(graph)
+    print(f"Order: {deployment.order}")
+    assert deployment.is_possible and [service.name for service in deployment.order] == ["C", "B", "A"]
+    assert graph.order_valid
+    assert_valid_order(graph)
+    assert [[service.name for service in level.services]
+            for level in analyzer.find_parallel_deployment_order(graph)] == [["C"], ["B"], ["A"]]
+    # The rebuilt order keeps working incrementally
+    assert graph.add_dependency("C", "A")[-1].name == "C"
+    graph.add_microservice("D")
+    graph.add_dependency("C", "D")
+    assert_valid_order(graph)
+
+    # A cycle makes deployment impossible, as it did before the order was maintained
+    graph.microservices["C"].add_dependency(graph.microservices["A"])
+    assert analyzer.deploy(graph) == analyzer.Deployment(is_possible=False, order=[])
+    assert analyzer.find_parallel_deployment_order(graph) == []
+    assert [service.name for service in graph.add_dependency("D", "A")] == ["D", "A", "B", "C", "D"]
+    assert graph.add_dependency("A", "D") == [] and graph.depends_on("A", "D")
+    assert not analyzer.deploy(graph).is_possible
+
+if __name__ == "__main__":
+    test_online_order_against_brute_force()
+    test_rejected_cycle()
+    test_dependency_index_against_reachability()
+    test_index_rebuild_and_cycles()
+    test_dependencies_added_on_microservice()
+    print("\n✅ All tests completed!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from directed_graph import DirectedGraph
+from weighted_graph import WeightedGraph
+from algorithms import topological_sort, find_scss
+from algorithms.dijkstra import dijkstra
+
+def test_version_bumps():
+    print("=== Testing Graph Version ===\n")
+
+    graph = DirectedGraph()
+    graph.add_node("A")
+    graph.add_node("B")
+    graph.add_edge("A", "B")
+    print(f"Version after 2 nodes and 1 edge: {graph.version}")
+    assert graph.version == 3
+
+    graph.add_edge("A", "X")  # Missing node, nothing changes
+    assert graph.version == 3
+
+def test_cached_results():
+    print("\n=== Testing Result Cache ===")
+
+    graph = DirectedGraph()
+    for label in ["A", "B", "C"]:
+        graph.add_node(label)
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "C")
+
+    first = graph.cached(topological_sort)
+    second = graph.cached(topological_sort)
+    assert first is second
+    graph.cached(find_scss)
+    graph.cached(find_scss, method='tarjan')
+
+    stats = graph.result_cache.stats
+    print(f"Hits: {stats.hits}, misses: {stats.misses}")
+    assert (stats.hits, stats.misses) == (1, 3)
+
+    graph.add_edge("C", "A")
+    assert graph.cached(find_scss) == [["A", "C", "B"]]
+    print(f"After mutation: {stats}")
+    assert stats.invalidations == 1
+    assert len(graph.result_cache) == 1
+
+def test_cached_dijkstra_arguments():
+    print("\n=== Testing Cache Keys Include Arguments ===")
+
+    graph = WeightedGraph()
+    for label in ["A", "B"]:
+        graph.add_node(label)
+    graph.add_edge("A", "B", 2.0)
+
+    from_a = graph.cached(dijkstra, "A")
+    from_b = graph.cached(dijkstra, "B")
+    assert from_a[0].node == "B" and from_b[0].node == "A"
+    assert graph.cached(dijkstra, "A") is from_a
+    print(f"Hit rate: {graph.result_cache.stats.hit_rate():.2f}")
+
+if __name__ == "__main__":
+    test_version_bumps()
+    test_cached_results()
+    test_cached_dijkstra_arguments()
+    print("\n✅ All tests completed!")
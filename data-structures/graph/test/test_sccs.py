@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from directed_graph import DirectedGraph
+from csr_graph import CSRGraph
+from algorithms import find_scss, find_condensation
+
+def build_graph() -> DirectedGraph:
+    graph = DirectedGraph()
+    for label in ["A", "B", "C", "D", "E", "F"]:
+        graph.add_node(label)
+
+    # {A, B, C} -> {D, E} -> {F}
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "C")
+    graph.add_edge("C", "A")
+    graph.add_edge("C", "D")
+    graph.add_edge("D", "E")
+    graph.add_edge("E", "D")
+    graph.add_edge("E", "F")
+    return graph
+
+def test_tarjan_matches_kosaraju():
+    print("=== Testing Tarjan vs Kosaraju ===\n")
+
+    graph = build_graph()
+    kosaraju = find_scss(graph)
+    tarjan = find_scss(graph, method='tarjan')
+
+    print(f"Kosaraju: {kosaraju}")
+    print(f"Tarjan:   {tarjan}")
+
+    assert sorted(sorted(scc) for scc in kosaraju) == sorted(sorted(scc) for scc in tarjan)
+    assert find_scss(CSRGraph.from_graph(graph), method='tarjan') == tarjan
+
+def test_condensation():
+    print("\n=== Testing Condensation DAG ===")
+
+    condensation = find_condensation(build_graph())
+    for component_id, component in enumerate(condensation.components):
+        print(f"  {component_id}: {component} -> {condensation.edges[component_id]}")
+
+    assert [sorted(component) for component in condensation.components] == [["A", "B", "C"], ["D", "E"], ["F"]]
+    assert condensation.edges == [[1], [2], []]
+    assert condensation.component_of["E"] == 1
+
+if __name__ == "__main__":
+    test_tarjan_matches_kosaraju()
+    test_condensation()
+    print("\n✅ All tests completed!")
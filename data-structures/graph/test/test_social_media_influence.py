@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import importlib.util
+import random
+import numpy as np
+
+# The real-world scripts have hyphenated names, so they are loaded by path
+_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'real-world-problems',
+                       'social-media-influence.py')
+_spec = importlib.util.spec_from_file_location('social_media_influence', _SCRIPT)
+influence = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = influence
+_spec.loader.exec_module(influence)
+SocialMediaGraph = influence.SocialMediaGraph
+InfluenceRanker = influence.InfluenceRanker
+
+def random_graph(n: int, follows: int, seed: int) -> SocialMediaGraph:
+    rng = random.Random(seed)
+    graph = SocialMediaGraph()
+    for i in range(n):
+        graph.add_user(f"U{i}")
+    for _ in range(follows):
+        followee, follower = rng.sample(range(n), 2)
+        graph.add_follower_relationship(f"U{followee}", f"U{follower}")
+    return graph
+
+def test_hand_computed():
+    print("=== Testing Hand-Computed PageRank ===\n")
+
+    # A follows B and B follows nobody, so B's score comes back through the teleport vector:
+    #   s_A = (0.85 s_B + 0.15) / 2,  s_B = 0.85 s_A + (0.85 s_B + 0.15) / 2  =>  s_A = 1 / 2.85
+    graph = SocialMediaGraph()
+    graph.add_user("A")
+    graph.add_user("B")
+    graph.add_follower_relationship("B", "A")
+
+    ranker = InfluenceRanker(graph, tolerance=1e-12, max_iterations=1000)
+    scores = ranker.rank()
+    print(f"Scores: {dict(zip(ranker.names, scores.round(6)))}")
+    assert ranker.converged
+    assert np.allclose(scores, [1 / 2.85, 1 - 1 / 2.85])
+
+    # Teleporting to A only: s_A = 0.85 s_B + 0.15, s_B = 0.85 s_A
+    scores = ranker.rank(personalization={"A": 1.0})
+    assert np.allclose(scores, [0.15 / (1 - 0.85 ** 2), 0.85 * 0.15 / (1 - 0.85 ** 2)])
+
+    # A follow cycle spreads the score evenly
+    cycle = SocialMediaGraph()
+    for name in "XYZ":
+        cycle.add_user(name)
+    for followee, follower in ("XY", "YZ", "ZX"):
+        cycle.add_follower_relationship(followee, follower)
+    assert np.allclose(InfluenceRanker(cycle).rank(), 1 / 3)
+
+def test_scores_and_top_k():
+    print("\n=== Testing Score Totals and top_k ===")
+
+    for seed in range(10):
+        # Sparse, so plenty of users follow nobody
+        graph = random_graph(200, 250, seed)
+        ranker = InfluenceRanker(graph)
+        scores = ranker.rank()
+        assert abs(scores.sum() - 1) < 1e-9 and (scores > 0).all()
+        assert ranker.dangling.any()
+
+        personalized = ranker.rank(personalization={"U0": 2.0, "U1": 1.0})
+        assert abs(personalized.sum() - 1) < 1e-9
+
+        top = ranker.top_k(10)
+        assert [score.score for score in top] == sorted(personalized.tolist(), reverse=True)[:10]
+        assert all(personalized[ranker.names.index(score.name)] == score.score for score in top)
+    print("Scores sum to 1 in 10 random graphs with dangling users")
+
+    ranker = InfluenceRanker(influence.build_social_media_graph())
+    assert len(ranker.top_k(100)) == 5 and ranker.top_k(0) == []
+    # Unknown users are reported and left out of the teleport vector
+    assert np.allclose(ranker.rank(personalization={"Eve": 1.0, "missing": 5.0}),
+                       ranker.rank(personalization={"Eve": 1.0}))
+    print(f"Top 2: {ranker.top_k(2)}")
+
+    for bad in (lambda: InfluenceRanker(SocialMediaGraph(), damping=1.0),
+                lambda: ranker.rank(personalization={"missing": 1.0})):
+        try:
+            bad()
+            assert False, "Expected ValueError"
+        except ValueError as error:
+            print(f"Rejected: {error}")
+
+def test_warm_start():
+    print("\n=== Testing Warm Start ===")
+
+    graph = random_graph(2000, 8000, 3)
+    ranker = InfluenceRanker(graph, tolerance=1e-10, max_iterations=500)
+    ranker.rank()
+
+    graph.add_user("Newcomer")
+    graph.add_follower_relationship("U7", "U8")
+    graph.add_follower_relationship("Newcomer", "U9")
+    warm = ranker.rank()
+    warm_iterations = ranker.iterations
+
+    cold_ranker = InfluenceRanker(graph, tolerance=1e-10, max_iterations=500)
+    cold = cold_ranker.rank()
+    print(f"Iterations after a new follow: warm {warm_iterations}, cold {cold_ranker.iterations}")
+    assert ranker.converged and cold_ranker.converged
+    assert ranker.names == cold_ranker.names and np.allclose(warm, cold, atol=1e-8)
+    assert warm_iterations < cold_ranker.iterations
+
+    ranker.rank(warm_start=False)
+    assert ranker.iterations == cold_ranker.iterations
+
+if __name__ == "__main__":
+    test_hand_computed()
+    test_scores_and_top_k()
+    test_warm_start()
+    print("\n✅ All tests completed!")
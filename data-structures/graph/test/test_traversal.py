@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from directed_graph import DirectedGraph
+from undirected_graph import UndirectedGraph
+from algorithms import dfs, topological_sort, find_scss, find_bridges
+from algorithms.articulation_points import find_articulation_points
+
+def test_deep_path_graph():
+    print("=== Testing Deep Path Graph (no recursion limit) ===\n")
+
+    n = 100_000
+    directed = DirectedGraph()
+    undirected = UndirectedGraph()
+    for i in range(n):
+        directed.add_node(str(i))
+        undirected.add_node(str(i))
+
+    for i in range(n - 1):
+        directed.add_edge(str(i), str(i + 1))
+        undirected.add_edge(str(i), str(i + 1))
+
+    print(f"Recursion limit: {sys.getrecursionlimit()}, path length: {n}")
+
+    assert len(dfs(directed)) == n
+    assert topological_sort(directed)[0].label == str(n - 1)
+    assert len(find_scss(directed)) == n
+    assert len(find_bridges(undirected)) == n - 1
+    assert len(find_articulation_points(undirected)) == n - 2
+    assert directed.detect_cycle() == False
+    assert undirected.detect_cycle() == False
+
+    directed.add_edge(str(n - 1), "0")
+    assert directed.detect_cycle() == True
+    assert len(find_scss(directed)) == 1
+
+    print("All traversals completed")
+
+def test_traversal_order():
+    print("\n=== Testing Traversal Order ===")
+
+    graph = DirectedGraph()
+    for label in ["A", "B", "C", "D"]:
+        graph.add_node(label)
+
+    graph.add_edge("A", "B")
+    graph.add_edge("A", "C")
+    graph.add_edge("C", "D")
+    graph.add_edge("B", "D")
+
+    assert [node.label for node in dfs(graph)] == ["A", "B", "D", "C"]
+    assert [node.label for node in topological_sort(graph)] == ["D", "B", "C", "A"]
+    print(f"DFS: {dfs(graph)}")
+    print(f"Topological sort: {topological_sort(graph)}")
+
+if __name__ == "__main__":
+    test_deep_path_graph()
+    test_traversal_order()
+    print("\n✅ All tests completed!")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from union_find import UnionFind
+
+def test_union_find():
+    print("=== Testing Union-Find ===\n")
+
+    union_find = UnionFind(6)
+    assert union_find.union(0, 1) == True
+    assert union_find.union(1, 2) == True
+    assert union_find.union(0, 2) == False
+    assert union_find.union(3, 4) == True
+
+    print(f"Components: {union_find.component_count()}")
+    assert union_find.component_count() == 3
+    assert union_find.component_size(2) == 3
+    assert union_find.component_size(4) == 2
+    assert union_find.component_size(5) == 1
+    assert union_find.connected(0, 2) and not union_find.connected(2, 3)
+
+def test_batch_operations():
+    print("\n=== Testing Batch Operations ===")
+
+    union_find = UnionFind(8)
+    merged = union_find.union_many([(0, 1), (2, 3), (1, 0), (1, 3), (6, 7)])
+    roots = union_find.find_many(range(8))
+    print(f"Merged: {merged}, roots: {list(roots)}")
+
+    assert merged == 4
+    assert union_find.component_count() == 4
+    assert len(set(roots[0:4])) == 1
+    assert roots[4] == 4 and roots[5] == 5 and roots[6] == roots[7]
+
+def test_long_chain():
+    print("\n=== Testing Long Chain (no recursion limit) ===")
+
+    n = 200_000
+    union_find = UnionFind(n)
+    # Union by size keeps trees shallow, so build the worst case by hand
+    for i in range(1, n):
+        union_find.parent[i] = i - 1
+    assert union_find.find(n - 1) == 0
+    assert union_find.find(n - 1) == 0
+    print(f"Chain of {n} resolved")
+
+if __name__ == "__main__":
+    test_union_find()
+    test_batch_operations()
+    test_long_chain()
+    print("\n✅ All tests completed!")
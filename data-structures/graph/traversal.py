@@ -0,0 +1,56 @@
+from typing import Dict, Iterator, Optional, Tuple
+from graph import Node, NodeState
+
+# Events yielded by depth_first
+ENTER = 0  # (ENTER, node, parent)   node discovered through a tree edge from parent
+EDGE = 1   # (EDGE, node, to_node)   edge from node to an already discovered to_node
+EXIT = 2   # (EXIT, node, parent)    every edge of node has been explored
+
+def depth_first(root: Node,
+                node_states: Dict[str, NodeState],
+                report_edges: bool = False,
+                skip_parent: bool = False) -> Iterator[Tuple[int, Node, Optional[Node]]]:
+    """
+    Explicit-stack DFS from root that yields the same events, in the same
+    order, as the recursive traversals it replaces.
+
+    node_states is keyed by node label (str hashes are cached, Node hashes are
+    not) and is shared across calls so callers can loop over several roots.
+    EDGE events are only produced when report_edges is set, and skip_parent
+    ignores edges leading straight back to the node's DFS parent.
+    """
+    not_started = NodeState.NOT_STARTED
+    visiting = NodeState.VISITING
+
+    node_states[root.label] = visiting
+    yield ENTER, root, None
+
+    path = [root]
+    parents = [None]
+    stack = [iter(root.edges)]
+
+    while stack:
+        node = path[-1]
+        parent = parents[-1]
+        for edge in stack[-1]:
+            to_node = edge.to_node
+
+            if skip_parent and to_node is parent:
+                continue
+
+            if node_states[to_node.label] is not_started:
+                node_states[to_node.label] = visiting
+                yield ENTER, to_node, node
+                path.append(to_node)
+                parents.append(node)
+                stack.append(iter(to_node.edges))
+                break
+
+            if report_edges:
+                yield EDGE, node, to_node
+        else:
+            stack.pop()
+            path.pop()
+            parents.pop()
+            node_states[node.label] = NodeState.VISITED
+            yield EXIT, node, parent
@@ -1,12 +1,14 @@
 from collections import deque
-from typing import List, Deque
+from typing import List, Deque, Dict
 from graph import Graph, Node, Edge, NodeState
+from traversal import depth_first, EDGE
 
 class UndirectedGraph(Graph):
     def add_node(self, label: str):
         node = Node(label)
         self.nodes[label] = node
         self.node_states[node] = NodeState.NOT_STARTED
+        self.version += 1
         
     def add_edge(self, from_node_label: str, to_node_label: str):
         from_node = self.nodes.get(from_node_label, None)
@@ -22,36 +24,30 @@ class UndirectedGraph(Graph):
         
         from_node.add_edge(Edge(to_node))
         to_node.add_edge(Edge(from_node))     
+        self.version += 1
+    
+    def _link(self, from_node: Node, to_node: Node, weight: float):
+        from_node.edges.append(Edge(to_node))
+        to_node.edges.append(Edge(from_node))
     
     def reset_node_state(self):
         for node in self.nodes.values():
             self.node_states[node] = NodeState.NOT_STARTED
             
     def detect_cycle(self) -> bool:
-        self.reset_node_state()
+        node_states: Dict[str, NodeState] = dict.fromkeys(self.nodes, NodeState.NOT_STARTED)
         for node in self.nodes.values():
-            if self.node_states[node] == NodeState.NOT_STARTED:
-                if self._is_cycle_present(node, None):
+            if node_states[node.label] == NodeState.NOT_STARTED:
+                if self._is_cycle_present(node, node_states):
                     return True
                 
         return False
     
-    def _is_cycle_present(self, node: Node, parent_node: Node) -> bool:
-        self.node_states[node] = NodeState.VISITING
-        
-        for edge in node.get_edges():
-            to_node = edge.to_node
-            if to_node == parent_node:
-                continue
-        
-            if self.node_states[to_node] == NodeState.VISITING:
+    def _is_cycle_present(self, node: Node, node_states: Dict[str, NodeState]) -> bool:
+        for event, _, to_node in depth_first(node, node_states, report_edges=True, skip_parent=True):
+            if event == EDGE and node_states[to_node.label] == NodeState.VISITING:
                 return True
-        
-            if self.node_states[to_node] == NodeState.NOT_STARTED:
-                if self._is_cycle_present(to_node, node):
-                    return True
 
-        self.node_states[node] = NodeState.VISITED
         return False
         
     def create_transpose(self):
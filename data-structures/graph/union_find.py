@@ -1,36 +1,93 @@
-from typing import List
+from array import array
+from typing import Iterable, Sequence
 
 class UnionFind:
+    """
+    Disjoint sets over the ids 0..n-1. parent and size are typed arrays, so
+    10^7 elements take about 80MB instead of the ~600MB of two lists of ints.
+    find uses iterative path halving (no recursion limit) and union attaches
+    the smaller set under the larger one.
+    """
     def __init__(self, n: int):
         self.n = n
-        self.parent = list(range(n))
-        self.rank = [0] * n  
-        
-        for i in range(n):
-            self.parent[i] = i
-            self.rank[i] = 0
-            
-    def find(self, x: int):
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-
-        return self.parent[x]
-            
+        self.parent = array('i', range(n))
+        self.size = array('i', [1]) * n
+        self.components = n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        while parent[x] != x:
+            # Path halving: point every other node on the path at its grandparent
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
     def union(self, x: int, y: int) -> bool:
         par_x = self.find(x)
         par_y = self.find(y)
-        
+
         # Already connected
         if par_x == par_y:
             return False
-        
-        if self.rank[par_x] < self.rank[par_y]:
-            self.parent[par_x] = par_y
-        elif self.rank[par_x] > self.rank[par_y]:
-            self.parent[par_y] = par_x
-        else:
-            self.parent[par_y] = par_x
-            self.rank[par_x] += 1
-            
+
+        if self.size[par_x] < self.size[par_y]:
+            par_x, par_y = par_y, par_x
+        self.parent[par_y] = par_x
+        self.size[par_x] += self.size[par_y]
+        self.components -= 1
+
         return True
-            
\ No newline at end of file
+
+    def connected(self, x: int, y: int) -> bool:
+        return self.find(x) == self.find(y)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def component_count(self) -> int:
+        return self.components
+
+    def union_many(self, pairs: Iterable[Sequence[int]]) -> int:
+        """
+        Unions every (x, y) pair, in order, and returns how many merges
+        happened. pairs may be any iterable of pairs or an (m, 2) NumPy array.
+        """
+        if hasattr(pairs, 'T'):
+            # Two flat columns convert far faster than m two-element rows
+            pairs = zip(*pairs.T.tolist())
+
+        parent = self.parent
+        size = self.size
+        merged = 0
+        # find and union are inlined: the batch form exists to skip their call overhead
+        for x, y in pairs:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+            if x == y:
+                continue
+            if size[x] < size[y]:
+                x, y = y, x
+            parent[y] = x
+            size[x] += size[y]
+            merged += 1
+
+        self.components -= merged
+        return merged
+
+    def find_many(self, ids: Iterable[int]) -> array:
+        """Root of every id, in order. ids may be any iterable of ints or a NumPy array"""
+        if hasattr(ids, 'tolist'):
+            ids = ids.tolist()
+
+        parent = self.parent
+        roots = array('i')
+        for x in ids:
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            roots.append(x)
+        return roots
@@ -1,4 +1,5 @@
-from graph import Graph, WeightedEdge
+from typing import Iterable, List, Optional, Sequence
+from graph import Graph, Node, WeightedEdge
 
 class WeightedGraph(Graph):
     def add_undirected_edge(self, from_node_label: str, to_node_label: str, weight: float = 1.0):
@@ -15,6 +16,7 @@ class WeightedGraph(Graph):
         
         from_node.add_edge(WeightedEdge(from_node, to_node, weight))
         to_node.add_edge(WeightedEdge(to_node, from_node, weight)) 
+        self.version += 1
         
     def add_directed_edge(self, from_node_label: str, to_node_label: str, weight: float = 1.0):
         from_node = self.nodes.get(from_node_label, None)
@@ -29,13 +31,83 @@ class WeightedGraph(Graph):
             return
         
         from_node.add_edge(WeightedEdge(from_node, to_node, weight))
+        self.version += 1
         
     def add_edge(self, from_node_label: str, to_node_label: str, weight: float = 1.0):
         """Default implementation delegates to undirected edge for compatibility"""
         self.add_undirected_edge(from_node_label, to_node_label, weight)
         
-    def create_transpose(self):
-        pass
+    def set_directed_edge_weight(self, from_node_label: str, to_node_label: str, weight: float):
+        """Sets the weight of every from -> to edge"""
+        edges = self._edges_between(from_node_label, to_node_label)
+        if not edges:
+            return
+        
+        for edge in edges:
+            edge.weight = weight
+        self.version += 1
+        
+    def set_undirected_edge_weight(self, from_node_label: str, to_node_label: str, weight: float):
+        self.set_directed_edge_weight(from_node_label, to_node_label, weight)
+        self.set_directed_edge_weight(to_node_label, from_node_label, weight)
+        
+    def set_edge_weight(self, from_node_label: str, to_node_label: str, weight: float):
+        self.set_undirected_edge_weight(from_node_label, to_node_label, weight)
+        
+    def remove_directed_edge(self, from_node_label: str, to_node_label: str):
+        """Removes every from -> to edge"""
+        edges = self._edges_between(from_node_label, to_node_label)
+        if not edges:
+            return
+        
+        from_node = self.nodes[from_node_label]
+        from_node.edges = [edge for edge in from_node.edges if edge not in edges]
+        self.version += 1
+        
+    def remove_undirected_edge(self, from_node_label: str, to_node_label: str):
+        self.remove_directed_edge(from_node_label, to_node_label)
+        self.remove_directed_edge(to_node_label, from_node_label)
+        
+    def remove_edge(self, from_node_label: str, to_node_label: str):
+        self.remove_undirected_edge(from_node_label, to_node_label)
+        
+    def _edges_between(self, from_node_label: str, to_node_label: str) -> List[WeightedEdge]:
+        from_node = self.nodes.get(from_node_label, None)
+        if from_node == None:
+            print(f"Node with label {from_node_label} not found")
+            return []
+        
+        edges = [edge for edge in from_node.edges if edge.to_node.label == to_node_label]
+        if not edges:
+            print(f"Edge from {from_node_label} to {to_node_label} not found")
+        return edges
+        
+    def add_edges_from(self, edges: Iterable[Sequence], create_nodes: bool = True,
+                       directed: bool = False, weights: Optional[Iterable[float]] = None):
+        """
+        Bulk version of add_undirected_edge / add_directed_edge for
+        (from_label, to_label[, weight]) rows. Weights may instead come from a
+        separate sequence, so a NumPy label array need not hold the weights too.
+        """
+        self._add_edges(edges, weights, create_nodes, self._link_directed if directed else self._link)
+        
+    def _link(self, from_node: Node, to_node: Node, weight: float):
+        from_node.edges.append(WeightedEdge(from_node, to_node, weight))
+        to_node.edges.append(WeightedEdge(to_node, from_node, weight))
+        
+    def _link_directed(self, from_node: Node, to_node: Node, weight: float):
+        from_node.edges.append(WeightedEdge(from_node, to_node, weight))
+        
+    def create_transpose(self) -> 'WeightedGraph':
+        graph = WeightedGraph()
+        for label in self.nodes:
+            graph.add_node(label)
+            
+        for node in self.nodes.values():
+            for edge in node.get_edges():
+                graph.add_directed_edge(edge.to_node.label, node.label, edge.weight)
+                
+        return graph
     
     def detect_cycle(self):
         pass
\ No newline at end of file
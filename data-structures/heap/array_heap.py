@@ -0,0 +1,153 @@
+from array import array
+from typing import Iterable, List, Optional
+
+class ArrayHeap:
+    """
+    Min-heap of numbers stored in a typed array, so each entry costs 8 bytes
+    instead of a pointer to a boxed number. The array grows as values are
+    pushed; there is no fixed capacity.
+
+    arity is the number of children per node (2, 4 or 8). Wider heaps are
+    shallower, so a pop runs fewer Python-level loop iterations even though
+    it compares more children per level.
+    Child and parent positions are computed inline: every method call in the
+    sift loop costs about as much as the comparison itself.
+    """
+    def __init__(self, arity: int = 4, typecode: str = 'd'):
+        if arity not in (2, 4, 8):
+            raise ValueError(f"Heap arity must be 2, 4 or 8, got {arity}")
+
+        self.arity = arity
+        self.items = array(typecode)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def push(self, item: float) -> None:
+        self.items.append(item)
+        self._bubble_up(len(self.items) - 1)
+
+    def pop(self) -> Optional[float]:
+        items = self.items
+        if not items:
+            print("Heap is empty")
+            return None
+
+        root = items[0]
+        last = items.pop()
+        if items:
+            items[0] = last
+            self._bubble_down_from(0)
+        return root
+
+    def peek(self) -> Optional[float]:
+        if not self.items:
+            print("Heap is empty")
+            return None
+
+        return self.items[0]
+
+    def push_many(self, values: Iterable[float]) -> None:
+        items = self.items
+        size = len(items)
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        items.extend(values)
+
+        # Sifting k new values costs k log n, rebuilding costs n + k
+        added = len(items) - size
+        if added > size:
+            self._build()
+        else:
+            for index in range(size, len(items)):
+                self._bubble_up(index)
+
+    def pop_many(self, k: int) -> List[float]:
+        """The k smallest values in ascending order, or every value when fewer are left"""
+        items = self.items
+        result: List[float] = []
+        for _ in range(min(k, len(items))):
+            result.append(items[0])
+            last = items.pop()
+            if items:
+                items[0] = last
+                self._bubble_down_from(0)
+        return result
+
+    def heapify(self, values: Iterable[float]) -> array:
+        """
+        Replaces the contents with values in O(n). A C-contiguous buffer of
+        the same type (an array, a memoryview or a NumPy array of float64 for
+        'd') is copied as raw bytes instead of number by number; a strided
+        one, such as a NumPy slice with a step, is read value by value.
+        """
+        items = array(self.items.typecode)
+        try:
+            view = memoryview(values)
+        except TypeError:
+            view = None
+
+        if view is not None and view.format == items.typecode and view.c_contiguous:
+            items.frombytes(view.cast('B'))
+        else:
+            items.extend(values.tolist() if hasattr(values, 'tolist') else values)
+
+        self.items = items
+        self._build()
+        return self.items
+
+    def _build(self) -> None:
+        items = self.items
+        for index in range((len(items) - 2) // self.arity, -1, -1):
+            self._bubble_down_from(index)
+
+    # Both sifts move a hole instead of swapping, writing each displaced value once
+
+    def _bubble_up(self, index: int) -> None:
+        items = self.items
+        arity = self.arity
+        item = items[index]
+
+        while index > 0:
+            parent = (index - 1) // arity
+            parent_item = items[parent]
+            if parent_item <= item:
+                break
+            items[index] = parent_item
+            index = parent
+
+        items[index] = item
+
+    def _bubble_down_from(self, index: int) -> None:
+        items = self.items
+        arity = self.arity
+        size = len(items)
+        item = items[index]
+
+        while True:
+            first_child = arity * index + 1
+            if first_child >= size:
+                break
+
+            smallest = first_child
+            smallest_item = items[first_child]
+            for child in range(first_child + 1, min(first_child + arity, size)):
+                if items[child] < smallest_item:
+                    smallest = child
+                    smallest_item = items[child]
+            if item <= smallest_item:
+                break
+
+            items[index] = smallest_item
+            index = smallest
+
+        items[index] = item
+
+if __name__ == '__main__':
+    heap = ArrayHeap()
+    heap.push_many([100, 200, 20, 30, 10, 5])
+    print(heap.peek())
+    print(heap.pop_many(3))
+    print(heap.pop())
+    print(heap.heapify([4, 6, 9, 3, 2, 8, 3]))
+    print(heap.pop_many(10))
@@ -0,0 +1,120 @@
+"""
+Push/pop and heapify timings for heapq, the heap classes in this folder and
+ArrayHeap at each arity, plus heapq against RadixHeap on monotone integer
+keys. Run from any directory:
+
+    python benchmark_heaps.py [n]
+"""
+from array import array
+import contextlib
+import heapq
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from array_heap import ArrayHeap
+from custom_heap import MyHeap
+from indexed_heap import IndexedHeap
+from radix_heap import RadixHeap
+
+# min_heap.py runs a demo at import time
+with contextlib.redirect_stdout(io.StringIO()):
+    from min_heap import MinHeap
+
+def bench_heapq(values):
+    heap = []
+    for value in values:
+        heapq.heappush(heap, value)
+    for _ in range(len(values)):
+        heapq.heappop(heap)
+
+def bench_my_heap(values):
+    heap = MyHeap()
+    for value in values:
+        heap.push(value)
+    for _ in range(len(values)):
+        heap.pop()
+
+def bench_min_heap(values):
+    heap = MinHeap(len(values))
+    for value in values:
+        heap.insert(value)
+    for _ in range(len(values)):
+        heap.extract_min()
+
+def bench_indexed_heap(values):
+    heap = IndexedHeap(4)
+    for item, value in enumerate(values):
+        heap.push(item, value)
+    for _ in range(len(values)):
+        heap.pop()
+
+def bench_array_heap(arity):
+    def run(values):
+        heap = ArrayHeap(arity)
+        for value in values:
+            heap.push(value)
+        for _ in range(len(values)):
+            heap.pop()
+    return run
+
+def bench_array_heap_bulk(values):
+    heap = ArrayHeap(4)
+    heap.push_many(values)
+    heap.pop_many(len(values))
+
+def monotone_heapq(n, increments):
+    heap = [(0, 0)]
+    pushes = 1
+    for increment in increments:
+        key, _ = heapq.heappop(heap)
+        if pushes < n:
+            heapq.heappush(heap, (key + increment, pushes))
+            heapq.heappush(heap, (key + increment * 2, pushes + 1))
+            pushes += 2
+
+def monotone_radix(n, increments):
+    heap = RadixHeap()
+    heap.push(0, 0)
+    pushes = 1
+    for increment in increments:
+        key, _ = heap.pop()
+        if pushes < n:
+            heap.push(key + increment, pushes)
+            heap.push(key + increment * 2, pushes + 1)
+            pushes += 2
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    values = [random.random() for _ in range(n)]
+
+    print(f"push {n} values, then pop them all")
+    for name, function in [('heapq', bench_heapq),
+                           ('MyHeap', bench_my_heap),
+                           ('MinHeap', bench_min_heap),
+                           ('IndexedHeap(4)', bench_indexed_heap),
+                           ('ArrayHeap(2)', bench_array_heap(2)),
+                           ('ArrayHeap(4)', bench_array_heap(4)),
+                           ('ArrayHeap(8)', bench_array_heap(8)),
+                           ('ArrayHeap(4) push_many/pop_many', bench_array_heap_bulk)]:
+        print(f"  {name:34} {timed(function, values):7.3f}s")
+
+    print(f"\nheapify {n} values")
+    buffer = array('d', values)
+    print(f"  {'heapq.heapify(list)':34} {timed(heapq.heapify, list(values)):7.3f}s")
+    print(f"  {'MyHeap.heapify(list)':34} {timed(MyHeap().heapify, values):7.3f}s")
+    print(f"  {'ArrayHeap(4).heapify(array)':34} {timed(ArrayHeap(4).heapify, buffer):7.3f}s")
+
+    # Dijkstra-like: each popped key pushes larger integer keys until n entries were queued
+    print(f"\nmonotone integer keys, {n} pushes and pops")
+    increments = [random.randrange(1, 1000) for _ in range(n)]
+    print(f"  {'heapq':34} {timed(monotone_heapq, n, increments):7.3f}s")
+    print(f"  {'RadixHeap':34} {timed(monotone_radix, n, increments):7.3f}s")
@@ -0,0 +1,175 @@
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+class IndexedHeap:
+    """
+    Min-heap of items keyed by a hashable id. A position map follows every
+    item through the heap, so an item's priority can be changed, or the item
+    removed, in O(log n) instead of pushing a duplicate entry and skipping it
+    later. Each item is in the heap at most once.
+
+    arity is the number of children per node (2 for a binary heap). Wider
+    heaps are shallower, which makes decrease_key cheaper and pop dearer.
+    """
+    def __init__(self, arity: int = 2):
+        if arity < 2:
+            raise ValueError(f"Heap arity must be at least 2, got {arity}")
+
+        self.arity = arity
+        self.items: List[Hashable] = []
+        self.priorities: List[Any] = []
+        self.positions: Dict[Hashable, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.positions
+
+    def contains(self, item: Hashable) -> bool:
+        return item in self.positions
+
+    def priority(self, item: Hashable) -> Any:
+        return self.priorities[self._position(item)]
+
+    def push(self, item: Hashable, priority: Any) -> None:
+        if item in self.positions:
+            raise ValueError(f"{item!r} is already in the heap, use decrease_key or increase_key")
+
+        self.items.append(item)
+        self.priorities.append(priority)
+        self.positions[item] = len(self.items) - 1
+        self._bubble_up(len(self.items) - 1)
+
+    def peek(self) -> Optional[Tuple[Hashable, Any]]:
+        if not self.items:
+            print("Heap is empty")
+            return None
+
+        return self.items[0], self.priorities[0]
+
+    def pop(self) -> Optional[Tuple[Hashable, Any]]:
+        if not self.items:
+            print("Heap is empty")
+            return None
+
+        item = self.items[0]
+        priority = self.priorities[0]
+        self._remove_at(0)
+        return item, priority
+
+    def decrease_key(self, item: Hashable, priority: Any) -> None:
+        index = self._position(item)
+        if self.priorities[index] < priority:
+            raise ValueError(f"New priority {priority} is greater than the current {self.priorities[index]}")
+
+        self.priorities[index] = priority
+        self._bubble_up(index)
+
+    def increase_key(self, item: Hashable, priority: Any) -> None:
+        index = self._position(item)
+        if priority < self.priorities[index]:
+            raise ValueError(f"New priority {priority} is less than the current {self.priorities[index]}")
+
+        self.priorities[index] = priority
+        self._bubble_down_from(index)
+
+    def remove(self, item: Hashable) -> Any:
+        """Removes an item from anywhere in the heap and returns its priority"""
+        index = self._position(item)
+        priority = self.priorities[index]
+        self._remove_at(index)
+        return priority
+
+    def _position(self, item: Hashable) -> int:
+        index = self.positions.get(item, None)
+        if index is None:
+            raise KeyError(f"{item!r} is not in the heap")
+        return index
+
+    def _remove_at(self, index: int) -> None:
+        items = self.items
+        priorities = self.priorities
+        del self.positions[items[index]]
+
+        last_item = items.pop()
+        last_priority = priorities.pop()
+        if index == len(items):
+            return
+
+        # Fill the hole with the last entry, which may need to move either way
+        items[index] = last_item
+        priorities[index] = last_priority
+        self.positions[last_item] = index
+        if index > 0 and last_priority < priorities[(index - 1) // self.arity]:
+            self._bubble_up(index)
+        else:
+            self._bubble_down_from(index)
+
+    # Both sifts move a hole instead of swapping, writing each displaced entry once
+
+    def _bubble_up(self, index: int) -> None:
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        arity = self.arity
+        item = items[index]
+        priority = priorities[index]
+
+        while index > 0:
+            parent = (index - 1) // arity
+            if not priority < priorities[parent]:
+                break
+            items[index] = items[parent]
+            priorities[index] = priorities[parent]
+            positions[items[index]] = index
+            index = parent
+
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
+
+    def _bubble_down_from(self, index: int) -> None:
+        items = self.items
+        priorities = self.priorities
+        positions = self.positions
+        arity = self.arity
+        size = len(items)
+        item = items[index]
+        priority = priorities[index]
+
+        while True:
+            first_child = arity * index + 1
+            if first_child >= size:
+                break
+
+            # Slicing and min run in C, unlike a key function called per child
+            children = priorities[first_child:first_child + arity]
+            smallest_priority = min(children)
+            if not smallest_priority < priority:
+                break
+
+            smallest = first_child + children.index(smallest_priority)
+            items[index] = items[smallest]
+            priorities[index] = smallest_priority
+            positions[items[index]] = index
+            index = smallest
+
+        items[index] = item
+        priorities[index] = priority
+        positions[item] = index
+
+if __name__ == '__main__':
+    heap = IndexedHeap()
+    heap.push('a', 100)
+    heap.push('b', 200)
+    heap.push('c', 20)
+    heap.push('d', 30)
+    print(heap.peek())
+    heap.decrease_key('b', 10)
+    print(heap.peek())
+    heap.increase_key('b', 300)
+    print(heap.peek())
+    print(heap.remove('c'))
+    print('c' in heap, 'd' in heap)
+    while heap:
+        print(heap.pop())
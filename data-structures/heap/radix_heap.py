@@ -0,0 +1,94 @@
+from operator import itemgetter
+from typing import Callable, Hashable, List, Optional, Tuple
+
+class RadixHeap:
+    """
+    Monotone priority queue for non-negative integer keys: a key may not be
+    pushed below the last key popped, which is always true in Dijkstra.
+
+    An entry lives in the bucket numbered by the highest bit in which its key
+    differs from the last popped key, so bucket 0 holds keys equal to it.
+    When bucket 0 runs dry the lowest non-empty bucket is emptied into lower
+    buckets around its minimum. An entry can only move down, at most once per
+    bit of the key range, so push is O(1) and pop is amortized O(log C) for
+    keys up to C, independent of how many entries are queued.
+    """
+    def __init__(self):
+        self.last = 0
+        self.size = 0
+        # Enough for 64-bit keys; push adds more for larger ones
+        self.buckets: List[List[Tuple[int, Hashable]]] = [[] for _ in range(65)]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def push(self, key: int, item: Hashable) -> None:
+        if key < self.last:
+            raise ValueError(f"Key {key} is below the last popped key {self.last}")
+
+        index = (key ^ self.last).bit_length()
+        buckets = self.buckets
+        if index >= len(buckets):
+            buckets.extend([] for _ in range(index + 1 - len(buckets)))
+        buckets[index].append((key, item))
+        self.size += 1
+
+    def peek(self) -> Optional[Tuple[int, Hashable]]:
+        """The entry pop would return, leaving the heap and its last key as they are"""
+        if self.size == 0:
+            print("Heap is empty")
+            return None
+
+        if self.buckets[0]:
+            return self.buckets[0][-1]
+        # Refilling would move last up to this key and reject pushes between the two
+        bucket = next(bucket for bucket in self.buckets if bucket)
+        return min(reversed(bucket), key=itemgetter(0))
+
+    def pop(self) -> Optional[Tuple[int, Hashable]]:
+        if self.size == 0:
+            print("Heap is empty")
+            return None
+
+        if not self.buckets[0]:
+            self._refill()
+        self.size -= 1
+        return self.buckets[0].pop()
+
+    def retain(self, keep: Callable[[int, Hashable], bool]) -> int:
+        """Drops every entry for which keep(key, item) is false and returns how many were dropped"""
+        buckets = self.buckets
+        dropped = 0
+        for index, bucket in enumerate(buckets):
+            if bucket:
+                kept = [entry for entry in bucket if keep(*entry)]
+                dropped += len(bucket) - len(kept)
+                buckets[index] = kept
+        self.size -= dropped
+        return dropped
+
+    def _refill(self) -> None:
+        """Moves the entries with the minimum key into the empty bucket 0"""
+        buckets = self.buckets
+        index = 1
+        while not buckets[index]:
+            index += 1
+
+        entries = buckets[index]
+        buckets[index] = []
+        last = min(map(itemgetter(0), entries))
+        self.last = last
+        for entry in entries:
+            buckets[(entry[0] ^ last).bit_length()].append(entry)
+
+if __name__ == '__main__':
+    heap = RadixHeap()
+    heap.push(100, 'a')
+    heap.push(200, 'b')
+    heap.push(20, 'c')
+    heap.push(30, 'd')
+    print(heap.pop())
+    heap.push(25, 'e')
+    print(heap.peek())
+    while heap:
+        print(heap.pop())
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import heapq
+import random
+from array import array
+import numpy as np
+from array_heap import ArrayHeap
+
+def assert_heap(heap: ArrayHeap):
+    items = heap.items
+    assert all(items[(index - 1) // heap.arity] <= items[index] for index in range(1, len(items)))
+
+def test_push_and_pop_many():
+    print("=== Testing push_many and pop_many ===\n")
+
+    for arity in (2, 4, 8):
+        rng = random.Random(arity)
+        heap = ArrayHeap(arity)
+        reference = []
+        for _ in range(200):
+            if rng.random() < 0.6:
+                # Small batches sift each value up, large ones rebuild the heap
+                values = [rng.uniform(-100, 100) for _ in range(rng.choice([1, 5, 50, 500]))]
+                heap.push_many(values)
+                for value in values:
+                    heapq.heappush(reference, value)
+            else:
+                k = rng.randrange(60)
+                assert heap.pop_many(k) == [heapq.heappop(reference) for _ in range(min(k, len(reference)))]
+            assert len(heap) == len(reference)
+            assert_heap(heap)
+
+        heap.push_many(np.arange(10.0)[::-1])
+        heap.push(-1000.0)
+        for value in [*np.arange(10.0)[::-1], -1000.0]:
+            heapq.heappush(reference, value)
+        assert heap.pop_many(len(reference) + 5) == sorted(reference)
+        assert heap.pop_many(3) == [] and heap.pop() is None
+        print(f"Arity {arity}: push_many and pop_many match heapq")
+
+def test_heapify():
+    print("\n=== Testing heapify ===")
+
+    rng = random.Random(5)
+    values = [rng.uniform(0, 1000) for _ in range(1001)]
+    strided = np.array(values)[::3]
+    inputs = {
+        'list': values,
+        'generator': (value for value in values),
+        'array': array('d', values),
+        'int array': array('i', range(1000, 0, -1)),
+        'float64 array': np.array(values),
+        'int64 array': np.arange(1000, 0, -1),
+        # Not C-contiguous, so it cannot be copied as raw bytes
+        'strided float64 array': strided,
+        'memoryview': memoryview(array('d', values)),
+    }
+    for name, source in inputs.items():
+        expected = sorted(float(value) for value in (values if name == 'generator' else source))
+        for arity in (2, 4, 8):
+            heap = ArrayHeap(arity)
+            heap.push(-1.0)
+            heap.heapify(source if name != 'generator' else (value for value in values))
+            assert_heap(heap)
+            assert heap.pop_many(len(heap)) == expected, name
+        print(f"{name}: {len(expected)} values")
+    assert len(strided) == 334 and not strided.flags['C_CONTIGUOUS']
+
+    # The input is copied, not shared
+    source = array('d', [3.0, 1.0, 2.0])
+    heap = ArrayHeap()
+    heap.heapify(source)
+    heap.pop()
+    assert list(source) == [3.0, 1.0, 2.0]
+
+if __name__ == "__main__":
+    test_push_and_pop_many()
+    test_heapify()
+    print("\n✅ All tests completed!")
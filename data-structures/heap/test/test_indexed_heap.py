@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import heapq
+import random
+from indexed_heap import IndexedHeap
+
+def assert_heap(heap: IndexedHeap):
+    """Every entry is no smaller than its parent and the position map points at it"""
+    assert sorted(heap.positions.values()) == list(range(len(heap)))
+    for index, item in enumerate(heap.items):
+        assert heap.positions[item] == index
+        if index > 0:
+            assert not heap.priorities[index] < heap.priorities[(index - 1) // heap.arity]
+
+def test_against_reference():
+    print("=== Testing IndexedHeap Against a Reference ===\n")
+
+    for arity in (2, 3, 4, 8):
+        rng = random.Random(arity)
+        heap = IndexedHeap(arity)
+        expected = {}
+        for step in range(3000):
+            operation = rng.random()
+            item = rng.randrange(200)
+            if item not in expected and operation < 0.4:
+                expected[item] = rng.randrange(1000)
+                heap.push(item, expected[item])
+            elif item in expected and operation < 0.6:
+                expected[item] = rng.randrange(expected[item] + 1)
+                heap.decrease_key(item, expected[item])
+            elif item in expected and operation < 0.75:
+                expected[item] = rng.randrange(expected[item], 1000)
+                heap.increase_key(item, expected[item])
+            elif item in expected and operation < 0.85:
+                assert heap.remove(item) == expected.pop(item)
+            elif expected:
+                item, priority = heap.pop()
+                assert priority == min(expected.values()) == expected.pop(item)
+
+            assert len(heap) == len(expected)
+            assert all(heap.contains(key) and heap.priority(key) == value for key, value in expected.items())
+            if step % 100 == 0:
+                assert_heap(heap)
+
+        # What is left pops in the same order as heapq gives
+        remaining = [(priority, item) for item, priority in expected.items()]
+        heapq.heapify(remaining)
+        while heap:
+            assert heap.pop()[1] == heapq.heappop(remaining)[0]
+        print(f"Arity {arity}: 3000 random operations match")
+
+def test_errors():
+    print("\n=== Testing IndexedHeap Errors ===")
+
+    heap = IndexedHeap()
+    heap.push('a', 5)
+    failures = [
+        (lambda: heap.push('a', 1), ValueError),
+        (lambda: heap.decrease_key('a', 6), ValueError),
+        (lambda: heap.increase_key('a', 4), ValueError),
+        (lambda: heap.decrease_key('missing', 1), KeyError),
+        (lambda: heap.remove('missing'), KeyError),
+        (lambda: IndexedHeap(1), ValueError),
+    ]
+    for failure, error_type in failures:
+        try:
+            failure()
+            assert False, f"Expected {error_type.__name__}"
+        except error_type as error:
+            print(f"Rejected: {error}")
+
+    # Equal priorities are allowed both ways, and removing the last entry empties the heap
+    heap.decrease_key('a', 5)
+    heap.increase_key('a', 5)
+    assert heap.remove('a') == 5
+    assert len(heap) == 0 and 'a' not in heap
+    assert heap.pop() is None and heap.peek() is None
+
+if __name__ == "__main__":
+    test_against_reference()
+    test_errors()
+    print("\n✅ All tests completed!")
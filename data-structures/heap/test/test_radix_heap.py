@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import heapq
+import random
+from radix_heap import RadixHeap
+
+def test_against_heapq():
+    print("=== Testing RadixHeap Against heapq ===\n")
+
+    rng = random.Random(1)
+    heap = RadixHeap()
+    reference = []
+    last = 0
+    for _ in range(5000):
+        if reference and rng.random() < 0.45:
+            peeked = heap.peek()
+            key, item = heap.pop()
+            assert (key, item) == peeked
+            assert key == heapq.heappop(reference)[0] and key >= last
+            last = key
+        else:
+            # Keys only need to stay at or above the last one popped
+            key = last + rng.choice([0, rng.randrange(4), rng.randrange(1 << 40)])
+            heap.push(key, len(reference))
+            heapq.heappush(reference, (key, len(reference)))
+        assert len(heap) == len(reference)
+    print("5000 monotone operations match heapq")
+
+def test_peek_keeps_last():
+    print("\n=== Testing peek ===")
+
+    heap = RadixHeap()
+    heap.push(10, 'a')
+    heap.push(20, 'b')
+    heap.push(20, 'c')
+    assert heap.pop() == (10, 'a')
+    # The minimum is now 20, but 15 is still a valid push after peeking
+    peeked = heap.peek()
+    assert peeked[0] == 20 and heap.last == 10
+    heap.push(15, 'd')
+    assert heap.pop() == (15, 'd')
+    assert heap.pop() == peeked
+
+    try:
+        heap.push(14, 'e')
+        assert False, "Expected ValueError"
+    except ValueError as error:
+        print(f"Rejected: {error}")
+    assert heap.pop() is not None and heap.peek() is None
+
+def test_retain():
+    print("\n=== Testing retain ===")
+
+    heap = RadixHeap()
+    for key in range(100):
+        heap.push(key * 3, key)
+    heap.pop()
+    assert heap.retain(lambda key, item: item % 2 == 0) == 50
+    assert len(heap) == 49
+    popped = [heap.pop()[1] for _ in range(len(heap))]
+    assert popped == list(range(2, 100, 2))
+
+if __name__ == "__main__":
+    test_against_heapq()
+    test_peek_keeps_last()
+    test_retain()
+    print("\n✅ All tests completed!")
@@ -1,6 +1,10 @@
-from typing import List, Tuple, Dict, Set
-from dataclasses import dataclass
-import heapq
+from typing import List, Tuple, Dict, Optional, Set
+from dataclasses import dataclass, field
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'data-structures', 'heap'))
+from indexed_heap import IndexedHeap
 
 @dataclass
 class NetworkEdge:
@@ -10,7 +14,7 @@ class NetworkEdge:
 @dataclass
 class Server:
     label: str
-    edges: List[NetworkEdge] = []
+    edges: List[NetworkEdge] = field(default_factory=list)
 
     def add_edge(self, edge: NetworkEdge):
         self.edges.append(edge)
@@ -37,22 +41,35 @@ class NetworkGraph:
         server_v.add_edge(NetworkEdge(server_u_label, latency_ms))
 
     def get_sync_path(self, start_server: str) -> List[Tuple[str, str]]:
-        visited: Dict[Server, bool] = {server: False for server in self.servers.values()}
-        min_heap: List[Tuple[int, Server, str]] = [(0, self.servers[start_server], None)]
+        if start_server not in self.servers:
+            print(f"Server {start_server} does not exist in the network")
+            return []
+
+        # Prim's algorithm: every server outside the tree is queued at most once,
+        # keyed by the cheapest link seen so far into the tree
+        in_tree: Set[str] = set()
+        parent: Dict[str, Optional[str]] = {start_server: None}
+        min_heap = IndexedHeap()
+        min_heap.push(start_server, 0)
         mst: List[Tuple[str, str]] = []
 
         while min_heap:
-            latency, server, parent = heapq.heappop(min_heap)
+            server_label, _ = min_heap.pop()
+            in_tree.add(server_label)
+            if parent[server_label] != None:
+                mst.append((parent[server_label], server_label))
+
+            for edge in self.servers[server_label].edges:
+                next_server = edge.to_server
+                if next_server in in_tree:
+                    continue
 
-            if not visited[server]:
-                visited[server] = True
-                if parent != None:
-                    mst.append((parent, server.label))
-                
-                for edge in server.edges:
-                    next_server = self.servers[edge.to_server]
-                    if not visited[next_server]:
-                        heapq.heappush(min_heap, (edge.latency_ms, next_server, server))
+                if next_server not in min_heap:
+                    min_heap.push(next_server, edge.latency_ms)
+                    parent[next_server] = server_label
+                elif edge.latency_ms < min_heap.priority(next_server):
+                    min_heap.decrease_key(next_server, edge.latency_ms)
+                    parent[next_server] = server_label
 
         return mst
     
@@ -61,4 +78,4 @@ class NetworkGraph:
 
         for _, to_server in sync_path:
             next_server = self.servers[to_server]
-            next_server.sync_file_changes(file_id)
\ No newline at end of file
+            next_server.sync_file_changes(file_id)
\ No newline at end of file